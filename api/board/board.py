@@ -6,7 +6,7 @@ from typing import List, Optional, Set
 from .cell import Cell
 from .constants import (
     GRID_SIZE, EMPTY_CELL, ALL_VALUES,
-    ROW_INDICES, COL_INDICES, BOX_INDICES, get_box_for_index
+    ROW_INDICES, COL_INDICES, BOX_INDICES, PEER_INDICES, get_box_for_index
 )
 
 
@@ -105,16 +105,7 @@ class Board:
 
     def get_related_indices(self, index: int) -> Set[int]:
         """Get all indices related to a cell (same row, col, box)."""
-        row = index // 9
-        col = index % 9
-        box_row, box_col = get_box_for_index(index)
-
-        related = set()
-        related.update(ROW_INDICES[row])
-        related.update(COL_INDICES[box_col * 9 + col])
-        related.update(BOX_INDICES[box_row * 3 + box_col])
-        related.discard(index)
-        return related
+        return set(PEER_INDICES[index])
 
     def get_empty_cells(self) -> List[int]:
         """Get indices of all empty cells."""
@@ -151,19 +142,50 @@ class Board:
 
     def _is_group_valid(self, indices: List[int]) -> bool:
         """Check if a group (row, col, box) has no duplicates."""
-        values = []
+        seen = 0
         for idx in indices:
             val = self._cells[idx].value
             if val != EMPTY_CELL:
-                if val in values:
+                bit = 1 << (val - 1)
+                if seen & bit:
                     return False
-                values.append(val)
+                seen |= bit
         return True
 
     def to_list(self) -> List[int]:
         """Convert board to list of 81 integers."""
         return [cell.value for cell in self._cells]
 
+    def to_string(self) -> str:
+        """Convert board to an 81-character string ('.' for empty cells)."""
+        return "".join(
+            str(cell.value) if cell.value != EMPTY_CELL else "." for cell in self._cells
+        )
+
+    @classmethod
+    def from_string(cls, board_str: str) -> 'Board':
+        """
+        Create a board from an 81-character string.
+
+        Args:
+            board_str: Digits 1-9 for clues, '.' or '0' for empty cells
+
+        Raises:
+            ValueError: If the string is not a valid board
+        """
+        if len(board_str) != GRID_SIZE * GRID_SIZE:
+            raise ValueError("Board must have exactly 81 cells")
+
+        values = []
+        for char in board_str:
+            if char == ".":
+                values.append(EMPTY_CELL)
+            elif char in "0123456789":
+                values.append(int(char))
+            else:
+                raise ValueError(f"Invalid board character: {char!r}")
+        return cls(values)
+
     def to_display_string(self) -> str:
         """Get a string representation of the board."""
         lines = []
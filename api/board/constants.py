@@ -22,6 +22,23 @@ BOX_INDICES = [
 ROW_INDICES = [list(range(i * 9, i * 9 + 9)) for i in range(9)]
 COL_INDICES = [list(range(i, 81, 9)) for i in range(9)]
 
+# All 27 units: rows 0-8, columns 9-17, boxes 18-26.
+UNIT_INDICES = ROW_INDICES + COL_INDICES + BOX_INDICES
+
+# The row, column, and box unit of each cell.
+CELL_UNITS = [
+    (i // 9, 9 + i % 9, 18 + (i // 27) * 3 + (i % 9) // 3) for i in range(81)
+]
+
+# Indices sharing a row, column, or box with each cell (excluding the cell).
+PEER_INDICES = [
+    sorted(
+        (set(ROW_INDICES[i // 9]) | set(COL_INDICES[i % 9])
+         | set(BOX_INDICES[(i // 27) * 3 + (i % 9) // 3])) - {i}
+    )
+    for i in range(81)
+]
+
 
 def get_box_indices(box_row: int, box_col: int) -> list:
     """Get cell indices for a specific box (0-indexed)."""
@@ -49,3 +66,34 @@ def get_row_for_index(index: int) -> int:
 def get_col_for_index(index: int) -> int:
     """Get column number for a given cell index."""
     return index % 9
+
+
+def digit_mask(values) -> int:
+    """Convert a collection of values 1-9 to a bitmask (bit 0 is value 1)."""
+    mask = 0
+    for value in values:
+        mask |= 1 << (value - 1)
+    return mask
+
+
+def mask_digits(mask: int) -> list:
+    """Convert a digit bitmask back to a sorted list of values."""
+    return [value for value in range(1, 10) if mask >> (value - 1) & 1]
+
+
+def cell_mask(indices) -> int:
+    """Convert a collection of cell indices to a bitmask (bit i is cell i)."""
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def mask_cells(mask: int) -> list:
+    """Convert a cell bitmask back to a sorted list of indices."""
+    cells = []
+    while mask:
+        low = mask & -mask
+        cells.append(low.bit_length() - 1)
+        mask ^= low
+    return cells
@@ -4,12 +4,59 @@ Difficulty analyzer for Sudoku puzzles.
 
 from ..board.board import Board
 from ..solver.solver import SudokuSolver
-from .levels import DifficultyLevel, TECHNIQUE_DIFFICULTY
+from ..solver.solve_step import SolveStep
+from ..solver.cache import solve_cache
+from .levels import (
+    DifficultyLevel, DifficultyRating, TECHNIQUE_DIFFICULTY, TECHNIQUE_RATING, SEARCH_RATING
+)
 
 
 class DifficultyAnalyzer:
     """Analyzes the difficulty of a Sudoku puzzle."""
 
+    def rate(self, board: Board) -> DifficultyRating:
+        """
+        Rate a puzzle from a single solve.
+
+        The rating is stored with the cached solve, so rating the same
+        puzzle again (or a symmetric copy of it) costs a cache lookup.
+
+        Args:
+            board: The puzzle to rate
+
+        Returns:
+            The DifficultyRating for the puzzle
+        """
+        result = SudokuSolver().get_result(board)
+        if result.rating is not None:
+            return result.rating
+
+        steps = result.steps
+        technique_counts = {}
+        hardest = "None"
+        rating = 0.0
+        for step in steps:
+            technique_counts[step.technique] = technique_counts.get(step.technique, 0) + 1
+            if TECHNIQUE_DIFFICULTY.get(step.technique, 0) > TECHNIQUE_DIFFICULTY.get(hardest, 0):
+                hardest = step.technique
+            rating = max(rating, _step_rating(step))
+
+        needs_search = not result.solved
+        if needs_search:
+            rating = SEARCH_RATING
+
+        rated = DifficultyRating(
+            level=_level(TECHNIQUE_DIFFICULTY.get(hardest, 0), len(steps), needs_search),
+            rating=rating,
+            technique_counts=technique_counts,
+            total_steps=len(steps),
+            hardest_technique=hardest,
+            needs_search=needs_search,
+        )
+        if result.key is not None:
+            solve_cache.set_rating(result.key, rated)
+        return rated
+
     def analyze(self, board: Board) -> DifficultyLevel:
         """
         Analyze puzzle difficulty.
@@ -20,22 +67,7 @@ class DifficultyAnalyzer:
         Returns:
             The difficulty level
         """
-        solver = SudokuSolver()
-        solver.solve(board, collect_steps=True)
-
-        hardest_technique = solver.get_hardest_technique()
-        total_steps = len(solver.get_steps())
-
-        max_diff = TECHNIQUE_DIFFICULTY.get(hardest_technique, 0)
-
-        if max_diff <= 1 and total_steps <= 30:
-            return DifficultyLevel.EASY
-        elif max_diff <= 2 and total_steps <= 80:
-            return DifficultyLevel.MEDIUM
-        elif max_diff <= 3 and total_steps <= 150:
-            return DifficultyLevel.HARD
-        else:
-            return DifficultyLevel.EXPERT
+        return self.rate(board).level
 
     def get_details(self, board: Board) -> dict:
         """
@@ -47,29 +79,24 @@ class DifficultyAnalyzer:
         Returns:
             Dictionary with difficulty details
         """
-        solver = SudokuSolver()
-        solver.solve(board, collect_steps=True)
-
-        steps = solver.get_steps()
-        hardest = solver.get_hardest_technique()
-
-        technique_counts = {}
-        for step in steps:
-            technique_counts[step.technique] = technique_counts.get(step.technique, 0) + 1
-
-        max_diff = TECHNIQUE_DIFFICULTY.get(hardest, 0)
-
-        level = DifficultyLevel.EASY
-        if max_diff > 1 or len(steps) > 30:
-            level = DifficultyLevel.MEDIUM
-        if max_diff > 2 or len(steps) > 80:
-            level = DifficultyLevel.HARD
-        if max_diff > 3 or len(steps) > 150:
-            level = DifficultyLevel.EXPERT
-
-        return {
-            "level": str(level),
-            "total_steps": len(steps),
-            "hardest_technique": hardest,
-            "technique_counts": technique_counts,
-        }
+        return self.rate(board).to_dict()
+
+
+def _step_rating(step: SolveStep) -> float:
+    """Get the numeric rating of one step."""
+    if step.technique == "Hidden Single" and step.unit >= 18:
+        return TECHNIQUE_RATING["Hidden Single (box)"]
+    return TECHNIQUE_RATING.get(step.technique, 0.0)
+
+
+def _level(max_difficulty: int, total_steps: int, needs_search: bool) -> DifficultyLevel:
+    """Get the difficulty level for the hardest technique and path length."""
+    if needs_search:
+        return DifficultyLevel.EXPERT
+    if max_difficulty <= 1 and total_steps <= 30:
+        return DifficultyLevel.EASY
+    if max_difficulty <= 2 and total_steps <= 80:
+        return DifficultyLevel.MEDIUM
+    if max_difficulty <= 3 and total_steps <= 150:
+        return DifficultyLevel.HARD
+    return DifficultyLevel.EXPERT
@@ -0,0 +1,174 @@
+"""
+Command-line rating of puzzle files.
+
+Usage:
+    python -m api.difficulty puzzles.txt -o ratings.jsonl
+    cat puzzles.txt | python -m api.difficulty --format csv -j 8 > ratings.csv
+
+Each input line holds one 81-character puzzle ('.' or '0' for empty
+cells); anything after the first space, tab or comma is ignored, as are
+blank lines and lines starting with '#'. Puzzles are rated in chunks on a
+process pool with a bounded number of chunks in flight, and results are
+written in input order, so memory use does not grow with the file size.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from ..board.board import Board
+from ..solver.cache import solve_cache
+from ..validation.consistency import is_solvable
+from .analyzer import DifficultyAnalyzer
+
+
+# Search branches allowed when checking that a puzzle can be solved at all.
+SOLVABLE_MAX_NODES = 10000
+
+CSV_FIELDS = [
+    "puzzle", "level", "rating", "total_steps", "hardest_technique", "needs_search", "error"
+]
+
+
+def read_puzzles(stream: TextIO) -> Iterator[str]:
+    """Yield the puzzle of each non-empty, non-comment line."""
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        yield line.replace(",", " ").split()[0]
+
+
+def rate_chunk(puzzles: List[str]) -> List[dict]:
+    """
+    Rate a list of puzzles.
+
+    Args:
+        puzzles: Puzzle strings
+
+    Returns:
+        One result dictionary per puzzle, in the same order; invalid and
+        unsolvable puzzles get an "error" instead of a rating
+    """
+    analyzer = DifficultyAnalyzer()
+    results = []
+    for puzzle in puzzles:
+        try:
+            board = Board.from_string(puzzle)
+            solvable = is_solvable(board, max_nodes=SOLVABLE_MAX_NODES)
+            if solvable or solvable.undecided:
+                result = analyzer.rate(board).to_dict()
+            else:
+                result = {"error": solvable.contradiction}
+        except ValueError as e:
+            result = {"error": str(e)}
+        result["puzzle"] = puzzle
+        results.append(result)
+
+    # A corpus rarely repeats puzzles; keep worker memory flat.
+    solve_cache.clear()
+    return results
+
+
+def rate_stream(
+    puzzles: Iterable[str],
+    workers: int = 1,
+    chunk_size: int = 64,
+    max_pending: Optional[int] = None,
+) -> Iterator[dict]:
+    """
+    Rate puzzles, yielding results in input order.
+
+    Args:
+        puzzles: Puzzle strings, read lazily
+        workers: Number of worker processes (1 rates in this process)
+        chunk_size: Puzzles sent to a worker at a time
+        max_pending: Chunks in flight at most (defaults to 4 per worker)
+
+    Yields:
+        One result dictionary per puzzle
+    """
+    puzzles = iter(puzzles)
+    chunks = iter(lambda: list(islice(puzzles, chunk_size)), [])
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from rate_chunk(chunk)
+        return
+
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(rate_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_results(results: Iterable[dict], out: TextIO, fmt: str) -> int:
+    """
+    Write results as JSON lines or CSV.
+
+    Returns:
+        Number of results written
+    """
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result)
+            count += 1
+    else:
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+            count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command-line interface."""
+    parser = argparse.ArgumentParser(
+        prog="python -m api.difficulty",
+        description="Rate the difficulty of every puzzle in a file.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="puzzle file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="result file (default: stdout)")
+    parser.add_argument(
+        "-f", "--format", choices=("jsonl", "csv"),
+        help="output format (default: from the output extension, else jsonl)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=os.cpu_count() or 1,
+        help="worker processes (default: number of CPUs)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=64, help="puzzles per task")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+
+    start = time.perf_counter()
+    try:
+        results = rate_stream(read_puzzles(src), workers=args.workers, chunk_size=args.chunk_size)
+        count = write_results(results, out, fmt)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"Rated {count} puzzles in {elapsed:.2f}s ({rate:.1f} puzzles/s)", file=sys.stderr)
+    return 0
@@ -2,7 +2,9 @@
 Difficulty levels for Sudoku puzzles.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Dict
 
 
 class DifficultyLevel(Enum):
@@ -43,4 +45,60 @@ TECHNIQUE_DIFFICULTY = {
     "Naked Pair": 3,
     "Hidden Pair": 4,
     "Pointing Pair": 4,
+    "Naked Triple": 5,
+    "Hidden Triple": 5,
+    "Naked Quad": 6,
+    "Hidden Quad": 6,
 }
+
+
+# Numeric ratings in the style of Sudoku Explainer. Hidden singles are
+# easier to spot in a box than in a row or column.
+TECHNIQUE_RATING = {
+    "Naked Single": 2.3,
+    "Hidden Single": 1.5,
+    "Hidden Single (box)": 1.2,
+    "Pointing Pair": 2.6,
+    "Naked Pair": 3.0,
+    "Hidden Pair": 3.4,
+    "Naked Triple": 3.6,
+    "Hidden Triple": 4.0,
+    "Naked Quad": 5.0,
+    "Hidden Quad": 5.4,
+}
+
+# Rating given to puzzles the techniques cannot finish, roughly where
+# Sudoku Explainer's chains and forcing techniques begin.
+SEARCH_RATING = 7.0
+
+
+@dataclass(frozen=True)
+class DifficultyRating:
+    """
+    Result of rating a puzzle.
+
+    Attributes:
+        level: Difficulty level
+        rating: Numeric rating of the hardest step (Sudoku Explainer scale)
+        technique_counts: Number of steps taken with each technique
+        total_steps: Number of steps in the solve path
+        hardest_technique: Name of the hardest technique used
+        needs_search: Whether the techniques could not finish the puzzle
+    """
+    level: DifficultyLevel
+    rating: float
+    technique_counts: Dict[str, int] = field(hash=False)
+    total_steps: int
+    hardest_technique: str
+    needs_search: bool
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "level": str(self.level),
+            "rating": self.rating,
+            "total_steps": self.total_steps,
+            "hardest_technique": self.hardest_technique,
+            "technique_counts": dict(self.technique_counts),
+            "needs_search": self.needs_search,
+        }
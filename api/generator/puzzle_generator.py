@@ -3,6 +3,7 @@ Puzzle generator that creates Sudoku puzzles with unique solutions.
 """
 
 import random
+from typing import Callable, Optional
 from ..board.board import Board
 from ..board.constants import EMPTY_CELL
 from .full_board import FullBoardGenerator
@@ -16,13 +17,19 @@ class PuzzleGenerator:
         self._board_generator = FullBoardGenerator()
         self._uniqueness_checker = UniquenessChecker()
 
-    def generate(self, difficulty: str = "medium", attempts: int = 100) -> Board:
+    def generate(
+        self,
+        difficulty: str = "medium",
+        attempts: int = 100,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> Board:
         """
         Generate a puzzle with the specified difficulty.
 
         Args:
             difficulty: Target difficulty level
             attempts: Number of attempts to find a valid puzzle
+            progress: Called with the fraction of cells removed so far
 
         Returns:
             A puzzle board with unique solution
@@ -31,14 +38,19 @@ class PuzzleGenerator:
 
         for _ in range(attempts):
             solution = self._board_generator.generate()
-            puzzle = self._create_puzzle(solution, target_clues)
+            puzzle = self._create_puzzle(solution, target_clues, progress)
 
             if puzzle is not None:
                 return puzzle
 
         return self._generate_fallback(target_clues)
 
-    def _create_puzzle(self, solution: Board, target_clues: int) -> Board:
+    def _create_puzzle(
+        self,
+        solution: Board,
+        target_clues: int,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> Board:
         """Create a puzzle by removing cells from a solved board."""
         puzzle = solution.copy()
         indices = list(range(81))
@@ -65,6 +77,8 @@ class PuzzleGenerator:
                 continue
 
             removed += 1
+            if progress is not None:
+                progress(removed / target_removal)
 
         return puzzle
 
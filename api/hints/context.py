@@ -0,0 +1,323 @@
+"""
+Per-game hint state kept between hint requests.
+
+A HintContext holds the candidate grid of one game. When the player asks
+for another hint, only the cells placed since the previous request are
+applied to it, instead of rebuilding every candidate from scratch.
+
+Games started by the server also keep the puzzle's precomputed solve
+path. As long as the player's board agrees with the solution, a hint is
+just the first step on that path the player has not yet made.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from ..board.board import Board
+from ..board.constants import PEER_INDICES
+from ..solver.solve_step import SolveStep
+from ..solver.candidates import initialize_candidates
+from ..solver.registry import TechniqueRegistry, technique_registry
+
+
+DEFAULT_MAX_GAMES = 4096
+DEFAULT_TTL = 7200.0
+
+
+class HintContext:
+    """
+    Candidate state of one game.
+
+    Attributes:
+        board: The game's board with candidates kept up to date
+        rebuilds: Number of full candidate rebuilds
+        placements: Number of placements applied incrementally
+        path_hints: Number of hints served from the solve path
+    """
+
+    def __init__(
+        self,
+        board_str: str,
+        registry: Optional[TechniqueRegistry] = None,
+        solution: Optional[str] = None,
+        path: Optional[List[SolveStep]] = None,
+    ):
+        """
+        Initialize the context from the game's current board.
+
+        Args:
+            board_str: 81-character board ('.' or '0' for empty cells)
+            registry: Techniques to use (defaults to the shared registry)
+            solution: The puzzle's solution ('.' where unknown)
+            path: The puzzle's logical solve path, in order
+        """
+        self._registry = registry or technique_registry
+        self._lock = threading.Lock()
+        self._solution = solution
+        self._path = path or []
+        self._cursor = 0
+        self.rebuilds = 0
+        self.placements = 0
+        self.path_hints = 0
+        self._rebuild(_normalize(board_str))
+
+    def update(self, board_str: str) -> None:
+        """
+        Bring the context up to date with the player's board.
+
+        New placements are applied by removing the value from the peers'
+        candidates. Anything else (an erased or overwritten cell) means
+        earlier eliminations may no longer hold, so the candidates are
+        rebuilt.
+
+        Args:
+            board_str: 81-character board ('.' or '0' for empty cells)
+
+        Raises:
+            ValueError: If the string is not a valid board
+        """
+        board_str = _normalize(board_str)
+        if len(board_str) != 81:
+            raise ValueError("Board must have exactly 81 cells")
+
+        placed = []
+        for idx, (old, new) in enumerate(zip(self._board_str, board_str)):
+            if old == new:
+                continue
+            if old != "." or new not in "123456789":
+                self._rebuild(board_str)
+                return
+            placed.append((idx, int(new)))
+
+        for idx, value in placed:
+            self.board.set_value(idx // 9, idx % 9, value, fixed=False)
+            for peer in PEER_INDICES[idx]:
+                self.board.get_cell_by_index(peer).remove_candidate(value)
+        self.placements += len(placed)
+        self._board_str = board_str
+
+    def next_hint(self, board_str: str) -> SolveStep:
+        """
+        Get the next hint for the player's board.
+
+        The hint comes from the solve path when there is one and the board
+        has not diverged from the solution; otherwise the techniques are
+        run on the game's candidates.
+
+        Args:
+            board_str: The player's current board
+
+        Returns:
+            A SolveStep representing the next logical move
+
+        Raises:
+            ValueError: If the board is invalid or no technique applies
+        """
+        with self._lock:
+            self.update(board_str)
+            step = self._path_hint()
+            if step is not None:
+                self.path_hints += 1
+                return step
+            found = self._registry.find(self.board)
+
+        if found:
+            return found[1]
+
+        raise ValueError("No more hints available - puzzle requires guessing")
+
+    def next_placement(self, board_str: str) -> Tuple[SolveStep, List[SolveStep]]:
+        """
+        Get the next value the player can place, with the eliminations needed first.
+
+        Eliminations found by searching are kept in the game's candidates,
+        so later hints do not have to find them again.
+
+        Args:
+            board_str: The player's current board
+
+        Returns:
+            (placement step, elimination steps leading to it, in order)
+
+        Raises:
+            ValueError: If the board is invalid or no technique applies
+        """
+        with self._lock:
+            self.update(board_str)
+            found = self._path_placement()
+            if found is not None:
+                self.path_hints += 1
+                return found
+            found = self._registry.find_placement(self.board)
+
+        if found:
+            return found
+
+        raise ValueError("No more hints available - puzzle requires guessing")
+
+    def _path_placement(self) -> Optional[Tuple[SolveStep, List[SolveStep]]]:
+        """Get the next relevant placement on the solve path and the eliminations before it."""
+        if self._path_hint() is None:
+            return None
+
+        eliminations = []
+        for step in self._path[self._cursor:]:
+            if not self._is_relevant(step):
+                continue
+            if step.value:
+                return step, eliminations
+            eliminations.append(step)
+        return None
+
+    def _path_hint(self) -> Optional[SolveStep]:
+        """Get the first step on the solve path that is still relevant."""
+        if not self._path or self._diverged():
+            return None
+
+        # Placements only ever make steps irrelevant, and erasing a cell
+        # rebuilds the context, so the cursor never has to move back.
+        while self._cursor < len(self._path):
+            step = self._path[self._cursor]
+            if self._is_relevant(step):
+                return step
+            self._cursor += 1
+        return None
+
+    def _diverged(self) -> bool:
+        """Check whether the board holds a value the solution disagrees with."""
+        if not self._solution:
+            return True
+        return any(
+            char != "." and expected != "." and char != expected
+            for char, expected in zip(self._board_str, self._solution)
+        )
+
+    def _is_relevant(self, step: SolveStep) -> bool:
+        """Check whether a step still changes the board."""
+        if step.value:
+            return self._board_str[step.cell_index] == "."
+        return any(self._board_str[idx] == "." for idx in step.affected_cells)
+
+    def _rebuild(self, board_str: str) -> None:
+        """Recompute every candidate from the board's values."""
+        self.board = Board.from_string(board_str)
+        initialize_candidates(self.board)
+        self._board_str = board_str
+        self._cursor = 0
+        self.rebuilds += 1
+
+
+class HintContextStore:
+    """Thread-safe bounded store of hint contexts keyed by game id."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_GAMES, ttl: Optional[float] = DEFAULT_TTL):
+        """
+        Initialize the store.
+
+        Args:
+            max_size: Maximum number of games kept
+            ttl: Seconds a game stays after its last hint, or None to never expire
+        """
+        self._contexts: "OrderedDict[str, tuple[float, HintContext]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def configure(self, max_size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """
+        Change the size limit and/or TTL, evicting games if needed.
+
+        A ttl of 0 disables expiry.
+        """
+        with self._lock:
+            if max_size is not None:
+                self._max_size = max_size
+            if ttl is not None:
+                self._ttl = ttl if ttl > 0 else None
+            self._evict()
+
+    def get(self, game_id: str, board_str: str) -> HintContext:
+        """
+        Get the context of a game, creating it from the board if needed.
+
+        Callers should only pass ids of games they know, since each new id
+        adds a context to the store.
+
+        Args:
+            game_id: The game's id
+            board_str: The player's current board, used for new contexts
+
+        Returns:
+            The game's HintContext
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._contexts.get(game_id)
+            if entry is not None and (self._ttl is None or now - entry[0] <= self._ttl):
+                context = entry[1]
+                self._contexts[game_id] = (now, context)
+                self._contexts.move_to_end(game_id)
+                return context
+
+        context = HintContext(board_str)
+        self._put(game_id, context)
+        return context
+
+    def start(self, game_id: str, puzzle_str: str, solution: str, path: List[SolveStep]) -> HintContext:
+        """
+        Store the context of a new game along with its solve path.
+
+        Args:
+            game_id: The game's id
+            puzzle_str: The puzzle as given to the player
+            solution: The puzzle's solution
+            path: The puzzle's logical solve path, in order
+
+        Returns:
+            The new HintContext
+        """
+        context = HintContext(puzzle_str, solution=solution, path=path)
+        self._put(game_id, context)
+        return context
+
+    def discard(self, game_id: str) -> None:
+        """Forget a game, e.g. once it is finished."""
+        with self._lock:
+            self._contexts.pop(game_id, None)
+
+    def clear(self) -> None:
+        """Forget every game."""
+        with self._lock:
+            self._contexts.clear()
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def _put(self, game_id: str, context: HintContext) -> None:
+        """Store a context as the most recently used."""
+        with self._lock:
+            self._contexts[game_id] = (time.monotonic(), context)
+            self._contexts.move_to_end(game_id)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired games, then least recently used ones beyond the limit."""
+        if self._ttl is not None:
+            cutoff = time.monotonic() - self._ttl
+            while self._contexts:
+                stored_at = next(iter(self._contexts.values()))[0]
+                if stored_at >= cutoff:
+                    break
+                self._contexts.popitem(last=False)
+        while len(self._contexts) > self._max_size:
+            self._contexts.popitem(last=False)
+
+
+def _normalize(board_str: str) -> str:
+    """Use '.' for every empty cell."""
+    return board_str.replace("0", ".")
+
+
+hint_contexts = HintContextStore()
@@ -2,28 +2,24 @@
 Hint engine that provides hints to the user.
 """
 
+from typing import List, Optional, Tuple
 from ..board.board import Board
 from ..solver.solve_step import SolveStep
 from ..solver.candidates import initialize_candidates
-from ..solver.techniques.naked_single import NakedSingle
-from ..solver.techniques.hidden_single import HiddenSingle
-from ..solver.techniques.naked_pair import NakedPair
-from ..solver.techniques.hidden_pair import HiddenPair
-from ..solver.techniques.pointing_pair import PointingPair
+from ..solver.registry import TechniqueRegistry, technique_registry
 
 
 class HintEngine:
-    """Provides hints for solving Sudoku puzzles."""
-
-    def __init__(self):
-        self._techniques = [
-            NakedSingle(),
-            HiddenSingle(),
-            NakedPair(),
-            HiddenPair(),
-            PointingPair(),
-        ]
-        self._initialized = False
+    """
+    Provides hints for solving Sudoku puzzles.
+
+    The engine keeps no per-board state, so one instance can serve any
+    number of games. Games that ask for repeated hints should use a
+    HintContext, which keeps candidates between requests.
+    """
+
+    def __init__(self, registry: Optional[TechniqueRegistry] = None):
+        self._registry = registry or technique_registry
 
     def get_next_hint(self, board: Board) -> SolveStep:
         """
@@ -37,20 +33,53 @@ class HintEngine:
         Returns:
             A SolveStep representing the next logical move
         """
-        if not self._initialized:
-            initialize_candidates(board)
-            self._initialized = True
+        work = board.copy()
+        initialize_candidates(work)
+
+        found = self._registry.find(work)
+        if found:
+            return found[1]
+
+        raise ValueError("No more hints available - puzzle requires guessing")
+
+    def get_next_placement(self, board: Board) -> Tuple[SolveStep, List[SolveStep]]:
+        """
+        Get the next value the player can place, with the eliminations needed first.
+
+        This method does NOT modify the board.
+
+        Args:
+            board: The current puzzle state
+
+        Returns:
+            (placement step, elimination steps leading to it, in order)
+        """
+        work = board.copy()
+        initialize_candidates(work)
 
-        for technique in self._techniques:
-            step = technique.find(board)
-            if step:
-                return step
+        found = self._registry.find_placement(work)
+        if found:
+            return found
 
         raise ValueError("No more hints available - puzzle requires guessing")
 
-    def reset(self) -> None:
-        """Reset the hint engine state."""
-        self._initialized = False
+    def get_all_hints(self, board: Board) -> List[SolveStep]:
+        """
+        Get every hint available for the current puzzle state.
+
+        This method does NOT modify the board. Hints are ordered from the
+        easiest technique to the hardest and all come from one scan.
+
+        Args:
+            board: The current puzzle state
+
+        Returns:
+            A list of SolveSteps, empty if no technique applies
+        """
+        work = board.copy()
+        initialize_candidates(work)
+
+        return self._registry.find_all(work)
 
     def is_solved(self, board: Board) -> bool:
         """Check if the puzzle is solved."""
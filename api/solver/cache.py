@@ -0,0 +1,177 @@
+"""
+Process-wide LRU cache of solve results keyed by puzzle string.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from .solve_step import SolveStep
+from ..utils.singleflight import SingleFlight
+
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 3600.0
+
+
+@dataclass
+class SolveResult:
+    """
+    Outcome of solving one puzzle.
+
+    Attributes:
+        solution: Final board as an 81-character string ('.' where unsolved)
+        solved: Whether the logical solver completed the board
+        steps: Steps taken, in order
+        rating: DifficultyRating, filled in once the puzzle is rated
+        key: Cache key the result is stored under, if any
+    """
+    solution: str
+    solved: bool
+    steps: List[SolveStep]
+    rating: Optional[Any] = None
+    key: Optional[str] = None
+
+
+class SolveCache:
+    """Thread-safe bounded LRU cache with optional time-to-live."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: Optional[float] = DEFAULT_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self._entries: "OrderedDict[str, tuple[float, SolveResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def configure(self, max_size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """
+        Change the size limit and/or TTL, evicting entries if needed.
+
+        A ttl of 0 disables expiry.
+        """
+        with self._lock:
+            if max_size is not None:
+                self._max_size = max_size
+            if ttl is not None:
+                self._ttl = ttl if ttl > 0 else None
+            self._evict()
+
+    def get(self, key: str) -> Optional[SolveResult]:
+        """Get a cached result and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, result = entry
+            if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], SolveResult], store: bool = True
+    ) -> SolveResult:
+        """
+        Get a cached result, or compute it once however many callers miss.
+
+        Concurrent misses on the same key wait for a single computation and
+        share its result, which is then stored for later callers.
+
+        Args:
+            key: Cache key
+            compute: Produces the result on a miss
+            store: Whether to cache the computed result
+
+        Returns:
+            The cached or computed result
+        """
+        result = self.get(key)
+        if result is not None:
+            return result
+
+        def run() -> SolveResult:
+            # A caller that missed just before the last flight stored its
+            # result finds it here instead of solving again.
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None:
+                return entry[1]
+            computed = compute()
+            if store:
+                self.put(key, computed)
+            return computed
+
+        # Results that are not stored must not be shared with callers that
+        # would store them.
+        flight_key = key if store else f"nostore:{key}"
+        return self._flights.do(flight_key, run)[0]
+
+    def put(self, key: str, result: SolveResult) -> None:
+        """Store a result, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def set_rating(self, key: str, rating: Any) -> None:
+        """Attach difficulty details to a cached result, if still present."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1].rating = rating
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    def stats(self) -> dict:
+        """Get cache counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "ttl": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "in_flight": self._flights.in_flight(),
+                "coalesced": self._flights.coalesced(),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond the size limit."""
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+solve_cache = SolveCache()
@@ -0,0 +1,133 @@
+"""
+On-demand rendering of solve step explanations.
+
+Templates come from the "step-*" keys of the static/lang/*.json locales
+used by the frontend, falling back to the English defaults below when a
+locale or key is missing.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+from .solve_step import SolveStep
+
+
+LANG_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "static",
+    "lang",
+)
+
+DEFAULT_STRINGS = {
+    "step-row": "row {n}",
+    "step-column": "column {n}",
+    "step-box": "box {n}",
+    "step-pair": "pair",
+    "step-triple": "triple",
+    "step-quad": "quad",
+    "step-naked-single": "Cell at row {row}, column {col} has only one possible value: {value}",
+    "step-hidden-single": "Value {value} can only go in one cell in {group}: "
+                          "cell at row {row}, column {col}",
+    "step-naked-subset": "Cells at {cells} form a naked {subset} in {group} "
+                         "with candidates {digits}. Removing these from {count} related cells.",
+    "step-hidden-subset": "Found hidden {subset} {digits} in {group} in cells {cells}. "
+                          "Removed candidates {removed} from these cells.",
+    "step-pointing-pair": "Pointing pair in box {box}: value {value} appears only in {line}. "
+                          "Removed {value} from {count} cells in {line} outside the box.",
+    "step-generic": "{technique} at row {row}, column {col}",
+}
+
+
+@lru_cache(maxsize=None)
+def get_strings(lang: str = "en") -> dict:
+    """
+    Get explanation templates for a language.
+
+    Args:
+        lang: Language code matching a file in static/lang
+
+    Returns:
+        Dictionary of template keys to format strings
+    """
+    strings = dict(DEFAULT_STRINGS)
+    if not lang.isalpha():
+        return strings
+
+    path = os.path.join(LANG_DIR, f"{lang}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            locale = json.load(f)
+    except (OSError, ValueError):
+        return strings
+
+    strings.update(
+        (key, value) for key, value in locale.items() if key in DEFAULT_STRINGS
+    )
+    return strings
+
+
+def render_explanation(step: SolveStep, lang: str = "en") -> str:
+    """
+    Render the explanation of a step.
+
+    Args:
+        step: The step to explain
+        lang: Language code (falls back to English)
+
+    Returns:
+        The explanation text
+    """
+    strings = get_strings(lang)
+    technique = step.technique
+    row, col = divmod(step.cell_index, 9)
+
+    if technique == "Naked Single":
+        return strings["step-naked-single"].format(row=row + 1, col=col + 1, value=step.value)
+
+    if technique == "Hidden Single":
+        return strings["step-hidden-single"].format(
+            value=step.value, group=_unit_name(strings, step.unit), row=row + 1, col=col + 1
+        )
+
+    if technique == "Pointing Pair":
+        return strings["step-pointing-pair"].format(
+            box=(row // 3) * 3 + col // 3 + 1,
+            value=step.pattern_digits[0],
+            line=_unit_name(strings, step.unit),
+            count=len(step.affected_cells),
+        )
+
+    kind, _, size = technique.partition(" ")
+    size_key = f"step-{size.lower()}"
+    if kind in ("Naked", "Hidden") and size_key in strings:
+        params = {
+            "subset": strings[size_key],
+            "group": _unit_name(strings, step.unit),
+        }
+        if kind == "Naked":
+            return strings["step-naked-subset"].format(
+                cells=_format_cells(step.pattern_cells),
+                digits=step.pattern_digits,
+                count=len(step.affected_cells),
+                **params,
+            )
+        return strings["step-hidden-subset"].format(
+            digits=step.pattern_digits,
+            cells=_format_cells(step.pattern_cells),
+            removed=sorted(step.candidates_removed),
+            **params,
+        )
+
+    return strings["step-generic"].format(technique=technique, row=row + 1, col=col + 1)
+
+
+def _unit_name(strings: dict, unit: int) -> str:
+    """Name a unit index (0-8 rows, 9-17 columns, 18-26 boxes)."""
+    kind = ("step-row", "step-column", "step-box")[unit // 9]
+    return strings[kind].format(n=unit % 9 + 1)
+
+
+def _format_cells(indices: list) -> str:
+    """Format cell indices as '(row, col)' pairs."""
+    return ", ".join(f"({idx // 9 + 1}, {idx % 9 + 1})" for idx in indices)
@@ -0,0 +1,214 @@
+"""
+Technique registry with per-technique profiling and adaptive ordering.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..board.board import Board
+from .solve_step import SolveStep
+from .techniques.base import BaseTechnique
+from .techniques.naked_single import NakedSingle
+from .techniques.hidden_single import HiddenSingle
+from .techniques.pointing_pair import PointingPair
+from .techniques.subsets import (
+    NakedPair, HiddenPair, NakedTriple, HiddenTriple, NakedQuad, HiddenQuad
+)
+
+
+DEFAULT_TECHNIQUES = (
+    NakedSingle,
+    HiddenSingle,
+    NakedPair,
+    HiddenPair,
+    PointingPair,
+    NakedTriple,
+    HiddenTriple,
+    NakedQuad,
+    HiddenQuad,
+)
+
+
+@dataclass
+class TechniqueStats:
+    """
+    Profiling counters for one technique.
+
+    Attributes:
+        calls: Number of searches run
+        hits: Number of searches that found a step
+        total_ns: Cumulative search time in nanoseconds
+    """
+    calls: int = 0
+    hits: int = 0
+    total_ns: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Smoothed probability that a search finds a step."""
+        return (self.hits + 1) / (self.calls + 2)
+
+    @property
+    def mean_ns(self) -> float:
+        """Average search time in nanoseconds."""
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "total_ns": self.total_ns,
+            "hit_rate": round(self.hits / self.calls, 4) if self.calls else 0.0,
+            "mean_ns": round(self.mean_ns),
+        }
+
+
+class TechniqueRegistry:
+    """
+    Ordered collection of solving techniques.
+
+    Techniques are kept in difficulty order, which is what rating and
+    hints need. The adaptive order instead tries techniques by expected
+    cost per success (mean time / hit rate), which minimizes the expected
+    time to the next step when only the solution matters.
+    """
+
+    def __init__(self, techniques: Optional[Iterable[BaseTechnique]] = None, min_calls: int = 20):
+        """
+        Initialize the registry.
+
+        Args:
+            techniques: Techniques to register (defaults to all built-ins)
+            min_calls: Searches needed before a technique is reordered
+        """
+        self._techniques: List[BaseTechnique] = []
+        self._stats: Dict[str, TechniqueStats] = {}
+        self._lock = threading.Lock()
+        self._min_calls = min_calls
+
+        if techniques is None:
+            techniques = [cls() for cls in DEFAULT_TECHNIQUES]
+        for technique in techniques:
+            self.register(technique)
+
+    def register(self, technique: BaseTechnique) -> None:
+        """Add a technique, keeping the list in difficulty order."""
+        self._techniques.append(technique)
+        self._techniques.sort(key=lambda t: t.difficulty)
+        self._stats.setdefault(technique.name, TechniqueStats())
+
+    @property
+    def techniques(self) -> List[BaseTechnique]:
+        """Get the techniques in difficulty order."""
+        return list(self._techniques)
+
+    def ordered(self, adaptive: bool = False) -> List[BaseTechnique]:
+        """
+        Get the techniques in search order.
+
+        Args:
+            adaptive: Order by expected cost per success instead of difficulty
+
+        Returns:
+            List of techniques
+        """
+        if not adaptive:
+            return list(self._techniques)
+
+        # Techniques without enough data keep their difficulty order and
+        # go after the profiled ones.
+        profiled = []
+        unprofiled = []
+        for technique in self._techniques:
+            stats = self._stats[technique.name]
+            if stats.calls >= self._min_calls:
+                profiled.append((stats.mean_ns / stats.hit_rate, technique))
+            else:
+                unprofiled.append(technique)
+        profiled.sort(key=lambda item: item[0])
+        return [technique for _, technique in profiled] + unprofiled
+
+    def find(self, board: Board, adaptive: bool = False) -> Optional[Tuple[BaseTechnique, SolveStep]]:
+        """
+        Find the next step, recording timing for every technique tried.
+
+        Args:
+            board: The current board state
+            adaptive: Use the adaptive order instead of difficulty order
+
+        Returns:
+            (technique, step) for the first technique that applies, or None
+        """
+        for technique in self.ordered(adaptive):
+            start = time.perf_counter_ns()
+            step = technique.find(board)
+            self.record(technique.name, time.perf_counter_ns() - start, step is not None)
+            if step:
+                return technique, step
+        return None
+
+    def find_placement(
+        self, board: Board, max_eliminations: int = 100
+    ) -> Optional[Tuple[SolveStep, List[SolveStep]]]:
+        """
+        Apply elimination steps to the board until a placement is found.
+
+        The board's candidates are modified by the eliminations; the
+        placement itself is not applied.
+
+        Args:
+            board: The current board state, with candidates
+            max_eliminations: Maximum number of eliminations to apply
+
+        Returns:
+            (placement, eliminations applied before it), or None if the
+            techniques get stuck first
+        """
+        eliminations = []
+        while len(eliminations) <= max_eliminations:
+            found = self.find(board)
+            if found is None:
+                return None
+
+            technique, step = found
+            if step.value is not None:
+                return step, eliminations
+            technique.apply(board, step)
+            eliminations.append(step)
+        return None
+
+    def find_all(self, board: Board) -> List[SolveStep]:
+        """Find every step of every technique, in difficulty order."""
+        steps = []
+        for technique in self._techniques:
+            start = time.perf_counter_ns()
+            found = list(technique.find_all(board))
+            self.record(technique.name, time.perf_counter_ns() - start, bool(found))
+            steps.extend(found)
+        return steps
+
+    def record(self, name: str, elapsed_ns: int, hit: bool) -> None:
+        """Record one search of a technique."""
+        with self._lock:
+            stats = self._stats.setdefault(name, TechniqueStats())
+            stats.calls += 1
+            stats.total_ns += elapsed_ns
+            if hit:
+                stats.hits += 1
+
+    def get_stats(self) -> dict:
+        """Get profiling counters for every technique, in difficulty order."""
+        with self._lock:
+            return {t.name: self._stats[t.name].to_dict() for t in self._techniques}
+
+    def reset_stats(self) -> None:
+        """Clear all profiling counters."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = TechniqueStats()
+
+
+technique_registry = TechniqueRegistry()
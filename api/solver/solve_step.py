@@ -2,43 +2,176 @@
 SolveStep represents a single solving action.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Set
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..board.constants import digit_mask, mask_digits, cell_mask, mask_cells
+
+
+# Technique names are interned so each step stores a small integer.
+TECHNIQUE_NAMES: List[str] = []
+_TECHNIQUE_IDS: Dict[str, int] = {}
+_TECHNIQUE_LOCK = threading.Lock()
+
+
+def technique_id(name: str) -> int:
+    """Get the id of a technique name, registering it on first use."""
+    tid = _TECHNIQUE_IDS.get(name)
+    if tid is None:
+        with _TECHNIQUE_LOCK:
+            # Another thread may have registered it while we waited.
+            tid = _TECHNIQUE_IDS.get(name)
+            if tid is None:
+                tid = len(TECHNIQUE_NAMES)
+                TECHNIQUE_NAMES.append(name)
+                _TECHNIQUE_IDS[name] = tid
+    return tid
 
 
-@dataclass
 class SolveStep:
     """
     Represents a single step in solving a Sudoku puzzle.
 
+    Steps are stored compactly: digits and cells are kept as bitmasks
+    (bit d-1 for digit d, bit i for cell i) and the explanation is only
+    rendered when it is asked for.
+
     Attributes:
         technique: Name of the solving technique used
         cell_index: Index of the cell being modified
         value: Value placed (for single placement techniques)
         candidates_removed: Candidates removed from a cell
         affected_cells: Additional cells affected by this step
-        explanation: Human-readable explanation
+        unit: Unit the pattern was found in (0-8 rows, 9-17 columns,
+            18-26 boxes), or -1
+        pattern_cells: Cells forming the pattern (e.g. a naked subset)
+        pattern_digits: Digits forming the pattern (e.g. a hidden subset)
+        explanation: Human-readable explanation in English
     """
-    technique: str
-    cell_index: int
-    value: Optional[int] = None
-    candidates_removed: Optional[Set[int]] = None
-    affected_cells: Optional[List[int]] = None
-    explanation: str = ""
-
-    def __post_init__(self):
-        if self.affected_cells is None:
-            self.affected_cells = []
-        if self.candidates_removed is None:
-            self.candidates_removed = set()
-
-    def to_dict(self) -> dict:
+
+    __slots__ = (
+        "technique_id", "cell_index", "placed", "removed_mask",
+        "affected_mask", "unit", "pattern_cell_mask", "pattern_digit_mask",
+        "_explanation",
+    )
+
+    def __init__(
+        self,
+        technique: str,
+        cell_index: int,
+        value: Optional[int] = None,
+        candidates_removed: Optional[Iterable[int]] = None,
+        affected_cells: Optional[Iterable[int]] = None,
+        explanation: Optional[str] = None,
+        unit: int = -1,
+        pattern_cells: Optional[Iterable[int]] = None,
+        pattern_digits: Optional[Iterable[int]] = None,
+    ):
+        self.technique_id = technique_id(technique)
+        self.cell_index = cell_index
+        self.placed = value or 0
+        self.removed_mask = digit_mask(candidates_removed) if candidates_removed else 0
+        self.affected_mask = cell_mask(affected_cells) if affected_cells else 0
+        self.unit = unit
+        self.pattern_cell_mask = cell_mask(pattern_cells) if pattern_cells else 0
+        self.pattern_digit_mask = digit_mask(pattern_digits) if pattern_digits else 0
+        self._explanation = explanation
+
+    @property
+    def technique(self) -> str:
+        """Name of the solving technique used."""
+        return TECHNIQUE_NAMES[self.technique_id]
+
+    @property
+    def value(self) -> Optional[int]:
+        """Value placed, or None for elimination steps."""
+        return self.placed or None
+
+    @property
+    def candidates_removed(self) -> Set[int]:
+        """Candidates removed by this step."""
+        return set(mask_digits(self.removed_mask))
+
+    @property
+    def affected_cells(self) -> List[int]:
+        """Cells candidates are removed from, in index order."""
+        return mask_cells(self.affected_mask)
+
+    @property
+    def pattern_cells(self) -> List[int]:
+        """Cells forming the pattern, in index order."""
+        return mask_cells(self.pattern_cell_mask)
+
+    @property
+    def pattern_digits(self) -> List[int]:
+        """Digits forming the pattern, in ascending order."""
+        return mask_digits(self.pattern_digit_mask)
+
+    @property
+    def explanation(self) -> str:
+        """Human-readable explanation in English."""
+        return self.explain()
+
+    def explain(self, lang: str = "en") -> str:
+        """
+        Render the explanation for this step.
+
+        Args:
+            lang: Language code of a static/lang locale (falls back to English)
+
+        Returns:
+            The explanation text
+        """
+        if self._explanation is not None:
+            return self._explanation
+
+        from .explanations import render_explanation
+        return render_explanation(self, lang)
+
+    def to_dict(self, lang: str = "en") -> dict:
         """Convert to dictionary for serialization."""
         return {
             "technique": self.technique,
             "cell_index": self.cell_index,
             "value": self.value,
-            "candidates_removed": list(self.candidates_removed) if self.candidates_removed else [],
+            "candidates_removed": mask_digits(self.removed_mask),
             "affected_cells": self.affected_cells,
-            "explanation": self.explanation,
+            "explanation": self.explain(lang),
         }
+
+    def __getstate__(self) -> tuple:
+        # Technique ids are assigned per process, so pickle the name.
+        return (
+            self.technique, self.cell_index, self.placed, self.removed_mask,
+            self.affected_mask, self.unit, self.pattern_cell_mask,
+            self.pattern_digit_mask, self._explanation,
+        )
+
+    def __setstate__(self, state: tuple) -> None:
+        (technique, self.cell_index, self.placed, self.removed_mask,
+         self.affected_mask, self.unit, self.pattern_cell_mask,
+         self.pattern_digit_mask, self._explanation) = state
+        self.technique_id = technique_id(technique)
+
+    def _key(self) -> tuple:
+        return (
+            self.technique_id, self.cell_index, self.placed, self.removed_mask,
+            self.affected_mask, self.unit, self.pattern_cell_mask,
+            self.pattern_digit_mask,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SolveStep):
+            return False
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        if self.placed:
+            return f"SolveStep({self.technique!r}, cell={self.cell_index}, value={self.placed})"
+        return (
+            f"SolveStep({self.technique!r}, cell={self.cell_index}, "
+            f"removed={mask_digits(self.removed_mask)}, affected={self.affected_cells})"
+        )
@@ -2,89 +2,230 @@
 Main Sudoku solver that orchestrates all solving techniques.
 """
 
-from typing import List
+import threading
+import time
+from dataclasses import replace
+from typing import List, Optional
 from ..board.board import Board
 from .solve_step import SolveStep
-from .candidates import initialize_candidates, update_all_candidates
-from .techniques.naked_single import NakedSingle
-from .techniques.hidden_single import HiddenSingle
-from .techniques.naked_pair import NakedPair
-from .techniques.hidden_pair import HiddenPair
-from .techniques.pointing_pair import PointingPair
+from .candidates import initialize_candidates
+from .cache import SolveResult, solve_cache
+from .registry import TechniqueRegistry, technique_registry
+from ..utils.symmetry import CanonicalSearchLimit, canonical_form
+
+
+# Fuller boards are cheap to solve, so they are keyed as they are.
+CANONICAL_MIN_EMPTY = 45
+
+# Canonicalizing a generated puzzle tries at most about 150 arrangements
+# (around a millisecond), but regular boards such as one filled band or
+# row need thousands (150-400 ms). Past this many, give up and key the
+# board as it is; hitting the cap costs about 10 ms.
+CANONICAL_MAX_NODES = 1000
 
 
 class SudokuSolver:
-    """Main solver that applies logical solving techniques."""
-
-    def __init__(self):
-        self._techniques = [
-            NakedSingle(),
-            HiddenSingle(),
-            NakedPair(),
-            HiddenPair(),
-            PointingPair(),
-        ]
-        self._steps: List[SolveStep] = []
-
-    def solve(self, board: Board, collect_steps: bool = True) -> bool:
+    """
+    Main solver that applies logical solving techniques.
+
+    A solver holds no per-puzzle state, so one instance can be shared by
+    any number of threads. solve_result() returns everything about a solve;
+    the steps kept for get_steps() are per thread.
+    """
+
+    def __init__(self, registry: Optional[TechniqueRegistry] = None, adaptive: bool = False):
+        """
+        Initialize the solver.
+
+        Args:
+            registry: Techniques to use (defaults to the shared registry)
+            adaptive: Try techniques in profiled cost order instead of
+                difficulty order. Faster when only the solution is needed,
+                but the steps no longer rate difficulty correctly, so
+                adaptive results are not stored in the solve cache.
+        """
+        self._registry = registry or technique_registry
+        self._adaptive = adaptive
+        self._local = threading.local()
+
+    def solve(self, board: Board, collect_steps: bool = True, use_cache: bool = True) -> bool:
         """
         Solve a Sudoku puzzle using logical techniques.
 
+        Results are looked up in and stored to the process-wide solve
+        cache, keyed by the board's values.
+
         Args:
             board: The puzzle to solve
             collect_steps: Whether to collect solving steps
+            use_cache: Whether to consult the solve cache
 
         Returns:
             True if puzzle was solved, False otherwise
         """
-        self._steps = []
+        result = self.solve_result(board, use_cache=use_cache)
+        self._local.steps = result.steps if collect_steps else []
+        return result.solved
+
+    def solve_result(
+        self, board: Board, use_cache: bool = True, deadline: Optional[float] = None
+    ) -> SolveResult:
+        """
+        Solve a puzzle in place and return the result.
+
+        Unlike solve(), this keeps nothing on the solver, so it is the call
+        to use when the steps are needed from concurrent requests.
+
+        Args:
+            board: The puzzle to solve
+            use_cache: Whether to consult the solve cache
+            deadline: Stop once time.time() passes this (None for no limit)
+
+        Returns:
+            The SolveResult, with a steps list owned by the caller
+
+        Raises:
+            TimeoutError: If the deadline passed first
+        """
+        if use_cache and not self._adaptive:
+            result = self.get_result(board, deadline=deadline)
+            self._fill_from_result(board, result)
+            return result
+        return self._run(board, deadline=deadline)
+
+    def get_result(self, board: Board, deadline: Optional[float] = None) -> SolveResult:
+        """
+        Get the solve result for a puzzle, from the cache when possible.
+
+        Puzzles are cached under their canonical form, so a rotated,
+        reflected or relabeled copy of a solved puzzle is also a hit. The
+        returned result is in the board's own coordinates.
+
+        This method does NOT modify the board.
+
+        Args:
+            board: The puzzle to solve
+            deadline: Stop once time.time() passes this (None for no limit)
+
+        Returns:
+            The SolveResult for the puzzle
+
+        Raises:
+            TimeoutError: If the deadline passed first
+        """
+        return self._result(board, compute=True, deadline=deadline)
+
+    def cached_result(
+        self, board: Board, deadline: Optional[float] = None
+    ) -> Optional[SolveResult]:
+        """
+        Get the solve result for a puzzle only if it is already cached.
+
+        Args:
+            board: The puzzle to look up
+            deadline: Stop canonicalizing once time.time() passes this
+
+        Returns:
+            The SolveResult in the board's own coordinates, or None
+        """
+        return self._result(board, compute=False, deadline=deadline)
+
+    def _result(
+        self, board: Board, compute: bool, deadline: Optional[float] = None
+    ) -> Optional[SolveResult]:
+        """Look up, and optionally compute, a result under the board's cache key."""
+        board_str = board.to_string()
+        key, transform = board_str, None
+        if board.count_empty() >= CANONICAL_MIN_EMPTY:
+            try:
+                key, transform = canonical_form(
+                    board_str, max_nodes=CANONICAL_MAX_NODES, deadline=deadline
+                )
+            except CanonicalSearchLimit:
+                pass
+
+        if compute:
+            result = solve_cache.get_or_compute(
+                key, lambda: self._run_keyed(key, deadline), store=not self._adaptive
+            )
+        else:
+            result = solve_cache.get(key)
+            if result is None:
+                return None
+
+        if transform is None:
+            # The cached entry is shared; hand out a list of our own.
+            return replace(result, steps=list(result.steps))
+        return SolveResult(
+            solution=transform.invert(result.solution),
+            solved=result.solved,
+            steps=[transform.unmap_step(step) for step in result.steps],
+            rating=result.rating,
+            key=key,
+        )
+
+    def _run_keyed(self, key: str, deadline: Optional[float] = None) -> SolveResult:
+        """Solve the puzzle a cache key spells out, tagging the result with it."""
+        result = self._run(Board.from_string(key), deadline=deadline)
+        result.key = key
+        return result
+
+    def _run(self, board: Board, deadline: Optional[float] = None) -> SolveResult:
+        """Apply techniques until the board is solved or no step applies."""
+        steps = []
         initialize_candidates(board)
 
         max_iterations = 500
         iteration = 0
 
         while not board.is_complete() and iteration < max_iterations:
+            if deadline is not None and time.time() > deadline:
+                raise TimeoutError("Solving timed out")
             iteration += 1
-            step_applied = False
-
-            for technique in self._techniques:
-                step = technique.find(board)
-                if step:
-                    technique.apply(board, step)
-                    update_all_candidates(board)
+            found = self._registry.find(board, adaptive=self._adaptive)
+            if found is None:
+                break
 
-                    if collect_steps:
-                        self._steps.append(step)
+            technique, step = found
+            technique.apply(board, step)
+            steps.append(step)
 
-                    step_applied = True
-                    break
+        return SolveResult(
+            solution=board.to_string(),
+            solved=board.is_complete(),
+            steps=steps,
+        )
 
-            if not step_applied:
-                break
-
-        return board.is_complete()
+    def _fill_from_result(self, board: Board, result: SolveResult) -> None:
+        """Copy the values of a cached result into the board."""
+        for idx, char in enumerate(result.solution):
+            if char != "." and board.get_cell_by_index(idx).is_empty:
+                board.set_value(idx // 9, idx % 9, int(char), fixed=False)
+        if not result.solved:
+            initialize_candidates(board)
 
     def get_steps(self) -> List[SolveStep]:
-        """Get the list of solving steps."""
-        return self._steps.copy()
+        """Get the steps of this thread's last solve()."""
+        return list(getattr(self._local, "steps", []))
+
+    def get_hardest_technique(self, steps: Optional[List[SolveStep]] = None) -> str:
+        """
+        Get the name of the hardest technique used.
 
-    def get_hardest_technique(self) -> str:
-        """Get the name of the hardest technique used."""
-        if not self._steps:
+        Args:
+            steps: Steps to inspect (defaults to this thread's last solve())
+        """
+        if steps is None:
+            steps = self.get_steps()
+        if not steps:
             return "None"
 
-        technique_difficulty = {
-            "Naked Single": 1,
-            "Hidden Single": 2,
-            "Naked Pair": 3,
-            "Hidden Pair": 4,
-            "Pointing Pair": 4,
-        }
+        technique_difficulty = {t.name: t.difficulty for t in self._registry.techniques}
 
         max_difficulty = 0
         hardest = "None"
 
-        for step in self._steps:
+        for step in steps:
             diff = technique_difficulty.get(step.technique, 0)
             if diff > max_difficulty:
                 max_difficulty = diff
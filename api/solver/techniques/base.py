@@ -3,12 +3,18 @@ Base class for all solving techniques.
 """
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 from ...board.board import Board
+from ...board.constants import PEER_INDICES
 from ..solve_step import SolveStep
 
 
 class BaseTechnique(ABC):
-    """Abstract base class for Sudoku solving techniques."""
+    """
+    Abstract base class for Sudoku solving techniques.
+
+    Finding a step never modifies the board; only apply() does.
+    """
 
     @property
     @abstractmethod
@@ -23,22 +29,39 @@ class BaseTechnique(ABC):
         pass
 
     @abstractmethod
-    def find(self, board: Board) -> SolveStep | None:
+    def find_all(self, board: Board) -> Iterator[SolveStep]:
         """
-        Find and apply this technique on the board.
+        Yield every application of this technique on the board.
+
+        All steps are found against the same board state in one scan.
 
         Args:
             board: The current Sudoku board state
 
         Returns:
-            A SolveStep if technique was applied, None otherwise
+            An iterator of SolveSteps
         """
         pass
 
+    def find(self, board: Board) -> SolveStep | None:
+        """
+        Find the first application of this technique on the board.
+
+        Args:
+            board: The current Sudoku board state
+
+        Returns:
+            A SolveStep if technique applies, None otherwise
+        """
+        return next(self.find_all(board), None)
+
     def apply(self, board: Board, step: SolveStep) -> None:
         """
         Apply a solving step to the board.
 
+        Placing a value also removes it from the candidates of every
+        cell in the same row, column, and box.
+
         Args:
             board: The board to modify
             step: The step to apply
@@ -47,6 +70,8 @@ class BaseTechnique(ABC):
             row = step.cell_index // 9
             col = step.cell_index % 9
             board.set_value(row, col, step.value, fixed=False)
+            for idx in PEER_INDICES[step.cell_index]:
+                board.get_cell_by_index(idx).remove_candidate(step.value)
 
         if step.candidates_removed:
             for idx in step.affected_cells:
@@ -4,6 +4,7 @@ Naked Single solving technique.
 A naked single occurs when a cell has only one possible candidate.
 """
 
+from typing import Iterator
 from ...board.board import Board
 from ..solve_step import SolveStep
 from .base import BaseTechnique
@@ -20,8 +21,8 @@ class NakedSingle(BaseTechnique):
     def difficulty(self) -> int:
         return 1
 
-    def find(self, board: Board) -> SolveStep | None:
-        """Find a cell with only one candidate."""
+    def find_all(self, board: Board) -> Iterator[SolveStep]:
+        """Find every cell with only one candidate."""
         for row in range(9):
             for col in range(9):
                 cell = board.get_cell(row, col)
@@ -29,11 +30,8 @@ class NakedSingle(BaseTechnique):
                     value = next(iter(cell.candidates))
                     index = row * 9 + col
 
-                    return SolveStep(
+                    yield SolveStep(
                         technique=self.name,
                         cell_index=index,
                         value=value,
-                        explanation=f"Cell at row {row + 1}, column {col + 1} "
-                                    f"has only one possible value: {value}",
                     )
-        return None
@@ -7,6 +7,7 @@ other cell in the same row or column outside the box.
 This allows the candidate to be eliminated from that row/column.
 """
 
+from typing import Iterator
 from ...board.board import Board
 from ..solve_step import SolveStep
 from .base import BaseTechnique
@@ -24,20 +25,14 @@ class PointingPair(BaseTechnique):
     def difficulty(self) -> int:
         return 4
 
-    def find(self, board: Board) -> SolveStep | None:
-        """Find a pointing pair."""
+    def find_all(self, board: Board) -> Iterator[SolveStep]:
+        """Find every pointing pair."""
         for box in range(9):
-            step = self._check_box(board, box)
-            if step:
-                return step
+            yield from self._check_box(board, box)
 
-        return None
-
-    def _check_box(self, board: Board, box: int) -> SolveStep | None:
+    def _check_box(self, board: Board, box: int) -> Iterator[SolveStep]:
         """Check a box for pointing pairs."""
         indices = BOX_INDICES[box]
-        box_row = box // 3
-        box_col = box % 3
 
         cells_in_box = [
             (idx, board.get_cell_by_index(idx).candidates.copy())
@@ -46,7 +41,7 @@ class PointingPair(BaseTechnique):
         ]
 
         if len(cells_in_box) < 2:
-            return None
+            return
 
         for value in range(1, 10):
             cells_with_value = [
@@ -67,19 +62,17 @@ class PointingPair(BaseTechnique):
                     if (row * 9 + col) not in indices:
                         cell = board.get_cell_by_index(row * 9 + col)
                         if cell.is_empty and value in cell.candidates:
-                            cell.remove_candidate(value)
                             affected.append(row * 9 + col)
 
                 if affected:
-                    return SolveStep(
+                    yield SolveStep(
                         technique=self.name,
                         cell_index=cells_with_value[0],
                         candidates_removed={value},
                         affected_cells=affected,
-                        explanation=f"Pointing pair in box {box + 1}: value {value} "
-                                    f"appears only in row {row + 1}. "
-                                    f"Removed {value} from {len(affected)} cells in that row "
-                                    f"outside the box.",
+                        unit=row,
+                        pattern_cells=cells_with_value,
+                        pattern_digits={value},
                     )
 
             if len(cols) == 1:
@@ -90,19 +83,15 @@ class PointingPair(BaseTechnique):
                     if (row * 9 + col) not in indices:
                         cell = board.get_cell_by_index(row * 9 + col)
                         if cell.is_empty and value in cell.candidates:
-                            cell.remove_candidate(value)
                             affected.append(row * 9 + col)
 
                 if affected:
-                    return SolveStep(
+                    yield SolveStep(
                         technique=self.name,
                         cell_index=cells_with_value[0],
                         candidates_removed={value},
                         affected_cells=affected,
-                        explanation=f"Pointing pair in box {box + 1}: value {value} "
-                                    f"appears only in column {col + 1}. "
-                                    f"Removed {value} from {len(affected)} cells in that column "
-                                    f"outside the box.",
+                        unit=9 + col,
+                        pattern_cells=cells_with_value,
+                        pattern_digits={value},
                     )
-
-        return None
@@ -0,0 +1,205 @@
+"""
+Naked and hidden subset solving techniques.
+
+A naked subset occurs when N cells in the same group together hold
+exactly N candidates, allowing those candidates to be removed from all
+other cells in that group. A hidden subset occurs when N candidates are
+confined to exactly N cells of a group, allowing all other candidates
+to be removed from those cells.
+
+Both kinds are found by one engine working on bitmasks: every empty cell
+of a group becomes a digit mask and every digit becomes a mask of the
+group positions holding it, so each subset test is a single popcount.
+"""
+
+from itertools import combinations
+from typing import Iterator
+
+from ...board.board import Board
+from ..solve_step import SolveStep
+from .base import BaseTechnique
+from ...board.constants import UNIT_INDICES, digit_mask, mask_digits
+
+
+SUBSET_NAMES = {2: "pair", 3: "triple", 4: "quad"}
+
+
+class SubsetTechnique(BaseTechnique):
+    """
+    Base class for naked and hidden subsets of a fixed size.
+
+    Subclasses only set the subset size, whether the subset is hidden,
+    and the difficulty.
+    """
+
+    _size = 2
+    _hidden = False
+    _difficulty = 3
+
+    @property
+    def name(self) -> str:
+        kind = "Hidden" if self._hidden else "Naked"
+        return f"{kind} {SUBSET_NAMES[self._size].capitalize()}"
+
+    @property
+    def difficulty(self) -> int:
+        return self._difficulty
+
+    def find_all(self, board: Board) -> Iterator[SolveStep]:
+        """Find every subset of this size in the rows, columns, and boxes."""
+        for unit, indices in enumerate(UNIT_INDICES):
+            yield from self._check_group(board, indices, unit)
+
+    def _check_group(self, board: Board, indices: list, unit: int) -> Iterator[SolveStep]:
+        """Check a group for subsets of this size."""
+        cells = []
+        for idx in indices:
+            cell = board.get_cell_by_index(idx)
+            if cell.is_empty:
+                cells.append((idx, digit_mask(cell.candidates)))
+
+        # With N or fewer empty cells there is nothing outside the subset.
+        if len(cells) <= self._size:
+            return
+
+        if self._hidden:
+            yield from self._find_hidden(cells, unit)
+        else:
+            yield from self._find_naked(cells, unit)
+
+    def _find_naked(self, cells: list, unit: int) -> Iterator[SolveStep]:
+        """Find N cells whose candidate masks together cover N digits."""
+        size = self._size
+
+        # Only cells with 2..N candidates can belong to a naked subset,
+        # and only the digits they hold need to be enumerated.
+        union = 0
+        eligible = 0
+        for _, mask in cells:
+            if 2 <= mask.bit_count() <= size:
+                union |= mask
+                eligible += 1
+        if eligible < size or union.bit_count() < size:
+            return
+
+        digits = [1 << bit for bit in range(9) if union >> bit & 1]
+        for combo in combinations(digits, size):
+            subset = sum(combo)
+            members = [
+                idx for idx, mask in cells
+                if mask.bit_count() >= 2 and not mask & ~subset
+            ]
+            if len(members) != size:
+                continue
+
+            affected = [
+                idx for idx, mask in cells
+                if idx not in members and mask & subset
+            ]
+            if not affected:
+                continue
+
+            values = mask_digits(subset)
+            yield SolveStep(
+                technique=self.name,
+                cell_index=members[0],
+                candidates_removed=values,
+                affected_cells=affected,
+                unit=unit,
+                pattern_cells=members,
+                pattern_digits=values,
+            )
+
+    def _find_hidden(self, cells: list, unit: int) -> Iterator[SolveStep]:
+        """Find N digits whose position masks together cover N cells."""
+        size = self._size
+
+        positions = [0] * 9
+        for pos, (_, mask) in enumerate(cells):
+            for bit in range(9):
+                if mask >> bit & 1:
+                    positions[bit] |= 1 << pos
+
+        # A digit in one position is a hidden single; in more than N
+        # positions it cannot be part of a hidden subset of size N.
+        digits = [
+            bit for bit in range(9)
+            if 2 <= positions[bit].bit_count() <= size
+        ]
+        if len(digits) < size:
+            return
+
+        for combo in combinations(digits, size):
+            covered = 0
+            subset = 0
+            for bit in combo:
+                covered |= positions[bit]
+                subset |= 1 << bit
+            if covered.bit_count() != size:
+                continue
+
+            members = [idx for pos, (idx, _) in enumerate(cells) if covered >> pos & 1]
+            removed = 0
+            for pos, (_, mask) in enumerate(cells):
+                if covered >> pos & 1:
+                    removed |= mask & ~subset
+            if not removed:
+                continue
+
+            yield SolveStep(
+                technique=self.name,
+                cell_index=members[0],
+                candidates_removed=mask_digits(removed),
+                affected_cells=members,
+                unit=unit,
+                pattern_cells=members,
+                pattern_digits=mask_digits(subset),
+            )
+
+
+class NakedPair(SubsetTechnique):
+    """Find naked pairs in rows, columns, and boxes."""
+
+    _size = 2
+    _hidden = False
+    _difficulty = 3
+
+
+class HiddenPair(SubsetTechnique):
+    """Find hidden pairs in rows, columns, and boxes."""
+
+    _size = 2
+    _hidden = True
+    _difficulty = 4
+
+
+class NakedTriple(SubsetTechnique):
+    """Find naked triples in rows, columns, and boxes."""
+
+    _size = 3
+    _hidden = False
+    _difficulty = 5
+
+
+class HiddenTriple(SubsetTechnique):
+    """Find hidden triples in rows, columns, and boxes."""
+
+    _size = 3
+    _hidden = True
+    _difficulty = 5
+
+
+class NakedQuad(SubsetTechnique):
+    """Find naked quads in rows, columns, and boxes."""
+
+    _size = 4
+    _hidden = False
+    _difficulty = 6
+
+
+class HiddenQuad(SubsetTechnique):
+    """Find hidden quads in rows, columns, and boxes."""
+
+    _size = 4
+    _hidden = True
+    _difficulty = 6
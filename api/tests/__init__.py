@@ -1 +1,39 @@
 # Tests Package
+
+import os
+import shutil
+import tempfile
+import unittest
+from app import create_app
+from app.models import db
+
+
+class AppTestCase(unittest.TestCase):
+    """Base test case for tests that run against the Flask app."""
+
+    # Extra app config, on top of the temporary databases.
+    config = {}
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.app = self.make_app()
+
+    def make_app(self, **config):
+        """Create an app on this test's temporary databases, closed at cleanup"""
+        app = create_app({
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///" + os.path.join(self.directory, "sudoku.db"),
+            "SESSION_DB_PATH": os.path.join(self.directory, "sessions.db"),
+            "GAME_DB_PATH": os.path.join(self.directory, "games.db"),
+            **self.config,
+            **config,
+        })
+        self.addCleanup(self._close, app)
+        return app
+
+    @staticmethod
+    def _close(app):
+        app.extensions["score_writer"].stop()
+        with app.app_context():
+            db.engine.dispose()
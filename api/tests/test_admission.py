@@ -0,0 +1,111 @@
+"""
+Tests for admission control.
+"""
+
+import threading
+import time
+import unittest
+from app.admission import AdmissionControl, Gate, Overloaded
+
+
+class TestGate(unittest.TestCase):
+    """Test cases for admission gates."""
+
+    def test_slots_up_to_limit(self):
+        """Test that the gate admits up to its limit without waiting."""
+        gate = Gate("solve", limit=2, queue=0)
+        gate.acquire()
+        gate.acquire()
+
+        with self.assertRaises(Overloaded) as raised:
+            gate.acquire()
+        self.assertEqual(raised.exception.gate, "solve")
+        self.assertGreaterEqual(raised.exception.retry_after, 1)
+
+        gate.release()
+        gate.acquire()
+        self.assertEqual(gate.stats()["admitted"], 3)
+        self.assertEqual(gate.stats()["rejected"], 1)
+
+    def test_queued_caller_gets_freed_slot(self):
+        """Test that a queued caller is admitted when a slot frees up."""
+        gate = Gate("generate", limit=1, queue=1, wait=5)
+        gate.acquire()
+        admitted = threading.Event()
+
+        def waiter():
+            with gate.slot():
+                admitted.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        while gate.stats()["waiting"] == 0:
+            time.sleep(0.01)
+
+        self.assertFalse(admitted.is_set())
+        gate.release()
+        thread.join(timeout=5)
+        self.assertTrue(admitted.is_set())
+        self.assertEqual(gate.stats()["peak_waiting"], 1)
+        self.assertEqual(gate.stats()["active"], 0)
+
+    def test_queue_wait_times_out(self):
+        """Test that a queued caller is turned away after the wait."""
+        gate = Gate("generate", limit=1, queue=1, wait=0.05)
+        gate.acquire()
+
+        start = time.monotonic()
+        with self.assertRaises(Overloaded):
+            gate.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual(gate.stats()["waiting"], 0)
+
+    def test_full_queue_rejects_at_once(self):
+        """Test that callers beyond the queue are rejected without waiting."""
+        gate = Gate("generate", limit=1, queue=0, wait=5)
+        gate.acquire()
+
+        start = time.monotonic()
+        with self.assertRaises(Overloaded):
+            gate.acquire()
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_slot_released_on_error(self):
+        """Test that a with-block gives back its slot when it raises."""
+        gate = Gate("solve", limit=1)
+        with self.assertRaises(ValueError):
+            with gate.slot():
+                raise ValueError()
+
+        self.assertEqual(gate.stats()["active"], 0)
+
+    def test_configure(self):
+        """Test that raising the limit admits waiting callers."""
+        gate = Gate("solve", limit=1, queue=1, wait=5)
+        gate.acquire()
+        thread = threading.Thread(target=gate.acquire)
+        thread.start()
+        while gate.stats()["waiting"] == 0:
+            time.sleep(0.01)
+
+        gate.configure(limit=2)
+        thread.join(timeout=5)
+        self.assertEqual(gate.stats()["active"], 2)
+
+
+class TestAdmissionControl(unittest.TestCase):
+    """Test cases for the named gates."""
+
+    def test_gates_by_name(self):
+        """Test that gates are created once per name and reported together."""
+        control = AdmissionControl()
+        control.configure("generate", limit=3, queue=2, wait=1)
+
+        self.assertIs(control.gate("generate"), control.gate("generate"))
+        self.assertEqual(control.gate("solve").stats()["limit"], 1)
+        self.assertEqual(control.stats()["generate"]["limit"], 3)
+        self.assertEqual(set(control.stats()), {"generate", "solve"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Tests for the solve result cache.
+"""
+
+import threading
+import time
+import unittest
+from api.board.board import Board
+from api.solver.cache import SolveCache, SolveResult, solve_cache
+from api.solver.solver import SudokuSolver
+from api.difficulty.analyzer import DifficultyAnalyzer
+from api.validation.rules import validate_complete
+from api.utils.singleflight import SingleFlight
+
+PUZZLE = (
+    "53..7....6..195....98....6.8...6...34..8.3..17...2...6"
+    ".6....28....419..5....8..79"
+)
+
+
+class TestSolveCache(unittest.TestCase):
+    """Test cases for the solve cache."""
+
+    def setUp(self):
+        solve_cache.clear()
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = SolveCache(max_size=2, ttl=None)
+        cache.put("a", SolveResult("a", True, []))
+        cache.put("b", SolveResult("b", True, []))
+        cache.get("a")
+        cache.put("c", SolveResult("c", True, []))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Test that expired entries count as misses."""
+        cache = SolveCache(max_size=2, ttl=-1)
+        cache.put("a", SolveResult("a", True, []))
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_solver_uses_cache(self):
+        """Test that a second solve of the same puzzle is a cache hit."""
+        solver = SudokuSolver()
+        first = Board.from_string(PUZZLE)
+        second = Board.from_string(PUZZLE)
+
+        self.assertTrue(solver.solve(first))
+        steps = solver.get_steps()
+        self.assertTrue(solver.solve(second))
+
+        self.assertEqual(first, second)
+        self.assertEqual(solver.get_steps(), steps)
+        self.assertEqual(solve_cache.stats()["hits"], 1)
+
+    def test_symmetric_puzzle_hits_cache(self):
+        """Test that a transposed, relabeled copy reuses the cached solve."""
+        relabel = str.maketrans("123456789", "918273645")
+        variant = "".join(PUZZLE[c * 9 + r] for r in range(9) for c in range(9))
+        variant = variant.translate(relabel)
+
+        solver = SudokuSolver()
+        solver.solve(Board.from_string(PUZZLE))
+        board = Board.from_string(variant)
+        self.assertTrue(solver.solve(board))
+
+        self.assertEqual(solve_cache.stats()["hits"], 1)
+        self.assertTrue(validate_complete(board))
+        for step in solver.get_steps():
+            if step.value:
+                self.assertEqual(board.get_cell_by_index(step.cell_index).value, step.value)
+
+    def test_regular_board_keyed_as_is(self):
+        """Test that a board too regular to canonicalize cheaply is still cached."""
+        band = "123456789456789123789123456" + "." * 54
+        solver = SudokuSolver()
+
+        first = solver.get_result(Board.from_string(band))
+        cached = solver.cached_result(Board.from_string(band))
+
+        # Keyed by the raw board: the canonical search gave up at its budget.
+        self.assertEqual(first.key, band)
+        self.assertEqual(cached.solution, first.solution)
+        self.assertEqual(solve_cache.stats()["hits"], 1)
+
+    def test_concurrent_misses_compute_once(self):
+        """Test that identical concurrent misses share one computation and cache it."""
+        cache = SolveCache()
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return SolveResult(solution=PUZZLE, solved=False, steps=[])
+
+        def worker():
+            results.append(cache.get_or_compute("key", compute))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertIs(cache.get("key"), results[0])
+        self.assertEqual(cache.stats()["in_flight"], 0)
+
+    def test_single_flight_shares_errors(self):
+        """Test that waiters see the leader's exception and later calls run again."""
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def failing():
+            started.set()
+            release.wait()
+            raise ValueError("boom")
+
+        def worker():
+            try:
+                flights.do("key", failing)
+            except ValueError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=worker)
+        follower.start()
+        while flights.coalesced() == 0:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(errors, ["boom", "boom"])
+        self.assertEqual(flights.do("key", lambda: 42), (42, False))
+
+    def test_analyzer_shares_solve(self):
+        """Test that rating reuses the cached solve and does not modify the board."""
+        board = Board.from_string(PUZZLE)
+        analyzer = DifficultyAnalyzer()
+
+        details = analyzer.get_details(board)
+        level = analyzer.analyze(board)
+
+        self.assertEqual(details["level"], str(level))
+        self.assertEqual(board.to_string(), PUZZLE)
+        self.assertEqual(solve_cache.stats()["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for difficulty rating.
+"""
+
+import io
+import json
+import unittest
+from api.board.board import Board
+from api.solver.cache import solve_cache
+from api.difficulty.analyzer import DifficultyAnalyzer
+from api.difficulty.levels import DifficultyLevel, SEARCH_RATING
+from api.difficulty.cli import read_puzzles, rate_chunk, rate_stream, write_results
+
+PUZZLE = (
+    "53..7....6..195....98....6.8...6...34..8.3..17...2...6"
+    ".6....28....419..5....8..79"
+)
+
+# Cannot be finished with the implemented techniques.
+SEARCH_PUZZLE = (
+    "8..........36......7..9.2...5...7.......457.....1...3..."
+    "1....68..85...1..9....4.."
+)
+
+
+class TestDifficulty(unittest.TestCase):
+    """Test cases for the difficulty analyzer."""
+
+    def setUp(self):
+        solve_cache.clear()
+
+    def test_rate(self):
+        """Test that one rating holds every detail."""
+        rating = DifficultyAnalyzer().rate(Board.from_string(PUZZLE))
+
+        self.assertFalse(rating.needs_search)
+        self.assertEqual(rating.total_steps, 51)
+        self.assertEqual(sum(rating.technique_counts.values()), rating.total_steps)
+        self.assertGreaterEqual(rating.rating, 1.2)
+        self.assertLess(rating.rating, SEARCH_RATING)
+        self.assertEqual(rating.to_dict()["level"], str(rating.level))
+
+    def test_rating_is_memoized(self):
+        """Test that the level and details share one rating."""
+        analyzer = DifficultyAnalyzer()
+        board = Board.from_string(PUZZLE)
+
+        rating = analyzer.rate(board)
+        self.assertIs(analyzer.rate(board), rating)
+        self.assertEqual(analyzer.analyze(board), rating.level)
+        self.assertEqual(analyzer.get_details(board), rating.to_dict())
+        self.assertEqual(solve_cache.stats()["misses"], 1)
+
+    def test_needs_search(self):
+        """Test that puzzles the techniques cannot finish are flagged."""
+        rating = DifficultyAnalyzer().rate(Board.from_string(SEARCH_PUZZLE))
+
+        self.assertTrue(rating.needs_search)
+        self.assertEqual(rating.rating, SEARCH_RATING)
+        self.assertEqual(rating.level, DifficultyLevel.EXPERT)
+
+
+class TestRatingCli(unittest.TestCase):
+    """Test cases for corpus rating."""
+
+    def test_read_puzzles(self):
+        """Test that comments, blank lines and extra fields are skipped."""
+        stream = io.StringIO(f"# header\n\n{PUZZLE},3.4\n{SEARCH_PUZZLE} extra\n")
+        self.assertEqual(list(read_puzzles(stream)), [PUZZLE, SEARCH_PUZZLE])
+
+    def test_invalid_puzzles_report_errors(self):
+        """Test that boards with repeated digits or no solution are not rated."""
+        repeated = "1" * 81
+        # Valid so far, but the empty first cell has no candidate left.
+        unsolvable = ".23456789" + "1" + "." * 71
+
+        results = rate_chunk([repeated, unsolvable, PUZZLE])
+
+        self.assertIn("repeats 1", results[0]["error"])
+        self.assertNotIn("level", results[0])
+        self.assertIn("error", results[1])
+        self.assertNotIn("level", results[1])
+        self.assertNotIn("error", results[2])
+
+    def test_results_keep_input_order(self):
+        """Test that pooled rating writes results in input order."""
+        puzzles = [PUZZLE, "bad", SEARCH_PUZZLE] * 3
+        out = io.StringIO()
+
+        count = write_results(rate_stream(puzzles, workers=2, chunk_size=2, max_pending=2), out, "jsonl")
+        results = [json.loads(line) for line in out.getvalue().splitlines()]
+
+        self.assertEqual(count, len(puzzles))
+        self.assertEqual([r["puzzle"] for r in results], puzzles)
+        self.assertIn("error", results[1])
+        self.assertTrue(results[2]["needs_search"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests for the CPU process pool.
+"""
+
+import os
+import time
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from app.executor import CpuExecutor, TaskTimeout, check_deadline
+
+
+# Worker functions must be importable by the pool's processes.
+
+def _add(a, b, deadline=None, progress=None):
+    return a + b, deadline
+
+
+def _sleep(seconds, deadline=None, progress=None):
+    time.sleep(seconds)
+    return seconds
+
+
+def _count(steps, deadline=None, progress=None):
+    for step in range(1, steps + 1):
+        progress(step / steps)
+        time.sleep(0.1)
+    return steps
+
+
+def _die(deadline=None, progress=None):
+    os._exit(1)
+
+
+def _overrun(deadline=None, progress=None):
+    while True:
+        check_deadline(deadline, "Overrun")
+        time.sleep(0.01)
+
+
+class TestCpuExecutor(unittest.TestCase):
+    """Test cases for the CPU process pool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = CpuExecutor(max_workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_run(self):
+        """Test that a task's result comes back with its deadline."""
+        before = time.time()
+        total, deadline = self.executor.run(_add, 2, 3, timeout=30)
+
+        self.assertEqual(total, 5)
+        self.assertGreaterEqual(deadline, before + 30)
+
+    def test_timeout(self):
+        """Test that waiting stops at the timeout even if the task keeps running."""
+        start = time.monotonic()
+        with self.assertRaises(TaskTimeout):
+            self.executor.run(_sleep, 1.5, timeout=0.3)
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        # The worker frees up once the overrunning task ends.
+        self.assertEqual(self.executor.run(_sleep, 0, timeout=30), 0)
+
+    def test_task_checks_deadline(self):
+        """Test that a task checking its deadline stops and frees its worker."""
+        with self.assertRaises(TaskTimeout):
+            self.executor.run(_overrun, timeout=0.2)
+
+        # With one worker, this only runs if the overrunning task gave up.
+        self.assertEqual(self.executor.run(_add, 1, 1, timeout=5)[0], 2)
+
+    def test_progress(self):
+        """Test that worker progress is relayed to the caller."""
+        seen = []
+        self.assertEqual(self.executor.run(_count, 5, timeout=30, progress=seen.append), 5)
+
+        self.assertTrue(seen)
+        self.assertEqual(seen, sorted(seen))
+        self.assertLessEqual(seen[-1], 1.0)
+
+    def test_broken_pool_is_replaced(self):
+        """Test that a worker dying breaks only its own task."""
+        with self.assertRaises(BrokenProcessPool):
+            self.executor.run(_die, timeout=30)
+
+        self.assertEqual(self.executor.run(_add, 2, 2, timeout=30)[0], 4)
+
+    def test_check_deadline(self):
+        """Test that check_deadline raises only once the deadline has passed."""
+        check_deadline(None)
+        check_deadline(time.time() + 60)
+        with self.assertRaises(TaskTimeout):
+            check_deadline(time.time() - 1, "Solving")
+
+
+if __name__ == "__main__":
+    unittest.main()
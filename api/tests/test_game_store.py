@@ -0,0 +1,109 @@
+"""
+Tests for the server-side game store.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+from app.game_store import GameStore
+
+PUZZLE = "." * 81
+SOLUTION = "123456789" * 9
+
+
+class TestGameStore(unittest.TestCase):
+    """Test cases for the game store."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "games.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_check_moves(self):
+        """Test that moves are checked against the stored solution."""
+        store = GameStore()
+        game_id = store.create(PUZZLE, SOLUTION, "easy")
+
+        self.assertEqual(store.check_moves(game_id, [(0, 1), (1, "2"), (2, 4)]),
+                         [True, True, False])
+        self.assertIsNone(store.check_moves("missing", [(0, 1)]))
+        with self.assertRaises(ValueError):
+            store.check_moves(game_id, [(81, 1)])
+
+    def test_lru_eviction(self):
+        """Test that the least recently used game is evicted."""
+        store = GameStore(max_size=2)
+        first = store.create(PUZZLE, SOLUTION, "easy")
+        second = store.create(PUZZLE, SOLUTION, "easy")
+        store.get(first)
+        store.create(PUZZLE, SOLUTION, "easy")
+
+        self.assertIsNotNone(store.get(first))
+        self.assertIsNone(store.get(second))
+        self.assertEqual(len(store), 2)
+
+    def test_ttl_expiry(self):
+        """Test that expired games are unknown, in memory and on disk."""
+        store = GameStore(ttl=0.05)
+        store.configure(path=self.path)
+        game_id = store.create(PUZZLE, SOLUTION, "easy")
+        time.sleep(0.1)
+
+        self.assertIsNone(store.get(game_id))
+        other = GameStore()
+        other.configure(path=self.path)
+        self.assertIsNone(other.get(game_id))
+
+    def test_expired_games_dropped_after_use(self):
+        """Test that an expired game is dropped even if it was used more recently."""
+        store = GameStore(ttl=100)
+        with mock.patch("app.game_store.time") as clock:
+            clock.time.return_value = 1000.0
+            first = store.create(PUZZLE, SOLUTION, "easy")
+            clock.time.return_value = 1010.0
+            second = store.create(PUZZLE, SOLUTION, "easy")
+            store.get(first)
+
+            # Only the first game has expired, and it is now the most recent.
+            clock.time.return_value = 1105.0
+            third = store.create(PUZZLE, SOLUTION, "easy")
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(list(store._games), [second, third])
+
+    def test_shared_through_database(self):
+        """Test that a game created by one store is found by another."""
+        creator = GameStore()
+        creator.configure(path=self.path)
+        game_id = creator.create(PUZZLE, SOLUTION, "hard")
+
+        other = GameStore()
+        other.configure(path=self.path)
+        game = other.get(game_id)
+
+        self.assertEqual((game.puzzle, game.solution, game.difficulty),
+                         (PUZZLE, SOLUTION, "hard"))
+        self.assertEqual(len(other), 1)
+
+    def test_discard(self):
+        """Test that a discarded game is gone from every store."""
+        creator = GameStore()
+        creator.configure(path=self.path)
+        game_id = creator.create(PUZZLE, SOLUTION, "easy")
+        other = GameStore()
+        other.configure(path=self.path)
+
+        other.discard(game_id)
+
+        self.assertIsNone(other.get(game_id))
+        creator._games.clear()
+        self.assertIsNone(creator.get(game_id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,19 @@ import unittest
 from api.generator.full_board import FullBoardGenerator
 from api.generator.puzzle_generator import PuzzleGenerator
 from api.hints.hint_engine import HintEngine
+from api.hints.context import HintContext, HintContextStore, hint_contexts
+from api.solver.solver import SudokuSolver
 from api.board.board import Board
+from api.solver.techniques.pointing_pair import PointingPair
+from api.solver.techniques.subsets import NakedPair
+from api.tests import AppTestCase
+from app.game_store import game_store
+
+# Needs a naked pair before the next value can be placed.
+ELIMINATION_FIRST = (
+    "..8.1...7..2..68.4...8.5.3......39...2.....4..5...1.83."
+    "159...78..71..5699..5...21"
+)
 
 
 class TestHints(unittest.TestCase):
@@ -62,6 +74,45 @@ class TestHints(unittest.TestCase):
 
         self.assertTrue(puzzle.is_valid())
 
+    def test_find_does_not_modify_candidates(self):
+        """Test that elimination techniques leave candidates untouched."""
+        board = Board()
+        for idx in (0, 1, 2, 9, 10, 11):
+            board.get_cell_by_index(idx).candidates = {1, 2} if idx < 2 else {3, 4, 5}
+
+        before = [cell.candidates for cell in board.cells]
+        self.assertIsNotNone(NakedPair().find(board))
+        self.assertIsNotNone(PointingPair().find(board))
+
+        self.assertEqual([cell.candidates for cell in board.cells], before)
+
+    def test_next_placement_after_eliminations(self):
+        """Test that elimination steps are applied until a value can be placed."""
+        board = Board.from_string(ELIMINATION_FIRST)
+        hint_engine = HintEngine()
+
+        self.assertIsNone(hint_engine.get_next_hint(board).value)
+        placement, eliminations = hint_engine.get_next_placement(board)
+
+        self.assertIsNotNone(placement.value)
+        self.assertGreater(len(eliminations), 0)
+        self.assertTrue(all(step.value is None for step in eliminations))
+        self.assertEqual(board.to_string(), ELIMINATION_FIRST)
+
+    def test_get_all_hints(self):
+        """Test that all hints come from one scan of the same state."""
+        generator = PuzzleGenerator()
+        puzzle = generator.generate(difficulty="easy")
+
+        hint_engine = HintEngine()
+        hints = hint_engine.get_all_hints(puzzle)
+
+        self.assertGreater(len(hints), 0)
+        self.assertEqual(hints[0], hint_engine.get_next_hint(puzzle))
+        for hint in hints:
+            if hint.value is not None:
+                self.assertTrue(puzzle.get_cell_by_index(hint.cell_index).is_empty)
+
     def test_is_solved(self):
         """Test is_solved check."""
         hint_engine = HintEngine()
@@ -79,5 +130,123 @@ class TestHints(unittest.TestCase):
         self.assertTrue(hint_engine.can_make_progress(puzzle))
 
 
+class TestHintContext(unittest.TestCase):
+    """Test cases for per-game hint contexts."""
+
+    def setUp(self):
+        puzzle = PuzzleGenerator().generate(difficulty="easy")
+        self.puzzle_str = puzzle.to_string()
+
+    def _play(self, board_str: str, hint) -> str:
+        """Place a hint's value on a board string."""
+        idx = hint.cell_index
+        return board_str[:idx] + str(hint.value) + board_str[idx + 1:]
+
+    def test_applies_placements_incrementally(self):
+        """Test that new placements update candidates without a rebuild."""
+        context = HintContext(self.puzzle_str)
+        board_str = self.puzzle_str
+
+        for _ in range(3):
+            hint = context.next_hint(board_str)
+            self.assertEqual(hint, HintEngine().get_next_hint(Board.from_string(board_str)))
+            board_str = self._play(board_str, hint)
+
+        self.assertEqual(context.rebuilds, 1)
+        self.assertEqual(context.placements, 2)
+
+    def test_erased_cell_rebuilds(self):
+        """Test that erasing a cell rebuilds the candidates."""
+        context = HintContext(self.puzzle_str)
+        hint = context.next_hint(self.puzzle_str)
+        context.next_hint(self._play(self.puzzle_str, hint))
+        context.next_hint(self.puzzle_str)
+
+        self.assertEqual(context.rebuilds, 2)
+        self.assertEqual(context.board.to_string(), self.puzzle_str)
+
+    def test_serves_solve_path(self):
+        """Test that hints follow the precomputed path while the board agrees."""
+        result = SudokuSolver().get_result(Board.from_string(self.puzzle_str))
+        store = HintContextStore()
+        context = store.start("game", self.puzzle_str, result.solution, result.steps)
+
+        board_str = self.puzzle_str
+        for expected in result.steps[:3]:
+            hint = context.next_hint(board_str)
+            self.assertEqual(hint, expected)
+            board_str = self._play(board_str, hint)
+
+        self.assertEqual(context.path_hints, 3)
+        self.assertIs(store.get("game", board_str), context)
+
+    def test_path_placement_includes_eliminations(self):
+        """Test that the path answers with a placement and the eliminations before it."""
+        board = Board.from_string(ELIMINATION_FIRST)
+        result = SudokuSolver().get_result(board)
+        context = HintContext(ELIMINATION_FIRST, solution=result.solution, path=result.steps)
+
+        placement, eliminations = context.next_placement(ELIMINATION_FIRST)
+        self.assertEqual(placement, HintEngine().get_next_placement(board)[0])
+        self.assertEqual(eliminations, result.steps[:len(eliminations)])
+        self.assertEqual(context.path_hints, 1)
+
+    def test_diverged_board_uses_search(self):
+        """Test that a wrong placement falls back to the techniques."""
+        result = SudokuSolver().get_result(Board.from_string(self.puzzle_str))
+        context = HintContext(self.puzzle_str, solution=result.solution, path=result.steps)
+
+        idx = self.puzzle_str.index(".")
+        wrong = str(int(result.solution[idx]) % 9 + 1)
+        board_str = self.puzzle_str[:idx] + wrong + self.puzzle_str[idx + 1:]
+        try:
+            context.next_hint(board_str)
+        except ValueError:
+            pass
+
+        self.assertEqual(context.path_hints, 0)
+
+    def test_store_keys_by_game(self):
+        """Test that the store keeps one bounded context per game."""
+        store = HintContextStore(max_size=2, ttl=None)
+        first = store.get("a", self.puzzle_str)
+
+        self.assertIs(store.get("a", self.puzzle_str), first)
+        store.get("b", self.puzzle_str)
+        store.get("c", self.puzzle_str)
+        self.assertEqual(len(store), 2)
+        self.assertIsNot(store.get("a", self.puzzle_str), first)
+
+
+class TestHintRoute(AppTestCase):
+    """Test cases for /api/get-hint."""
+
+    def setUp(self):
+        self.addCleanup(hint_contexts.clear)
+        super().setUp()
+        hint_contexts.clear()
+        self.puzzle_str = PuzzleGenerator().generate(difficulty="easy").to_string()
+
+    def _hint(self, game_id):
+        return self.app.test_client().post(
+            "/api/get-hint", json={"board": self.puzzle_str, "game_id": game_id}
+        ).get_json()
+
+    def test_known_game_keeps_context(self):
+        """Test that hints for a running game are served from its context."""
+        result = SudokuSolver().get_result(Board.from_string(self.puzzle_str))
+        game_id = game_store.create(self.puzzle_str, result.solution, "easy")
+
+        self.assertTrue(self._hint(game_id)["success"])
+        self.assertEqual(len(hint_contexts), 1)
+
+    def test_unknown_game_is_stateless(self):
+        """Test that made-up game ids get hints without storing contexts."""
+        for game_id in ("a", "b", "c"):
+            self.assertTrue(self._hint(game_id)["success"])
+
+        self.assertEqual(len(hint_contexts), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,151 @@
+"""
+Tests for background generation jobs and their event streams.
+"""
+
+import json
+import threading
+import unittest
+from unittest import mock
+from api.tests import AppTestCase
+from app.admission import admission
+from app.jobs import JobManager
+from app.routes import api
+
+
+def _events(body):
+    """Split a Server-Sent Events body into (event, data) pairs"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        if lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestJobManager(unittest.TestCase):
+    """Test cases for the job manager."""
+
+    def setUp(self):
+        self.jobs = JobManager(max_workers=2, max_jobs=3)
+
+    def _finish(self, job):
+        while not job.finished:
+            self.jobs.wait(job, job.version, timeout=5)
+
+    def test_done_job(self):
+        """Test that a job reports progress and then its result."""
+        def work(value, progress):
+            progress(0.5)
+            return value * 2
+
+        job = self.jobs.submit("double", work, 21)
+        self._finish(job)
+
+        self.assertEqual(job.to_dict(), {"job_id": job.id, "kind": "double",
+                                         "status": "done", "progress": 1.0, "result": 42})
+        self.assertIs(self.jobs.get(job.id), job)
+
+    def test_failed_job(self):
+        """Test that an exception becomes the job's error."""
+        def work(progress):
+            raise ValueError("no puzzle")
+
+        job = self.jobs.submit("fail", work)
+        self._finish(job)
+
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.to_dict()["error"], "no puzzle")
+        self.assertNotIn("result", job.to_dict())
+
+    def test_wait_times_out(self):
+        """Test that waiting on an unchanged job returns False."""
+        release = threading.Event()
+        job = self.jobs.submit("block", lambda progress: release.wait(5))
+        while job.status == "queued":
+            self.jobs.wait(job, job.version, timeout=5)
+
+        self.assertFalse(self.jobs.wait(job, job.version, timeout=0.05))
+        release.set()
+        self._finish(job)
+
+    def test_oldest_jobs_evicted(self):
+        """Test that jobs beyond the limit are dropped oldest first."""
+        jobs = [self.jobs.submit("n", lambda progress: None) for _ in range(4)]
+        for job in jobs:
+            self._finish(job)
+
+        self.assertIsNone(self.jobs.get(jobs[0].id))
+        self.assertIsNotNone(self.jobs.get(jobs[3].id))
+
+    def test_configure_workers(self):
+        """Test that changing the worker count starts a new thread pool."""
+        self._finish(self.jobs.submit("n", lambda progress: None))
+        executor = self.jobs._executor
+        self.jobs.configure(max_workers=3)
+        self._finish(self.jobs.submit("n", lambda progress: None))
+
+        self.assertIsNot(self.jobs._executor, executor)
+        self.assertEqual(self.jobs._executor._max_workers, 3)
+
+
+class TestGenerateJobRoutes(AppTestCase):
+    """Test cases for the generation job endpoints."""
+
+    config = {"GENERATE_CONCURRENCY": 1, "GENERATE_QUEUE": 0}
+
+    def setUp(self):
+        super().setUp()
+        self.client = self.app.test_client()
+        # Run pool tasks in the job thread; the pool itself is tested elsewhere.
+        patcher = mock.patch.object(
+            api.cpu_executor, "run",
+            side_effect=lambda fn, *args, timeout, progress=None: fn(*args, progress=progress),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stream_and_poll(self):
+        """Test that a job streams progress to done and polling starts the game."""
+        response = self.client.post("/api/generate/jobs", json={"difficulty": "easy"})
+        self.assertEqual(response.status_code, 202)
+        started = response.get_json()
+
+        events = _events(self.client.get(started["events_url"]).get_data(as_text=True))
+        statuses = [event for event, _ in events]
+        game = events[-1][1]["result"]
+
+        self.assertEqual(statuses[-1], "done")
+        self.assertEqual(len(game["puzzle"]), 81)
+        self.assertEqual(admission.gate("generate").stats()["active"], 0)
+
+        polled = self.client.get(started["status_url"]).get_json()
+        self.assertEqual(polled["result"]["game_id"], game["game_id"])
+        with self.client.session_transaction() as session:
+            self.assertEqual(session["game_id"], game["game_id"])
+
+        index = game["puzzle"].index(".")
+        results = self.client.post("/api/validate", json={
+            "moves": [{"index": index, "value": digit} for digit in range(1, 10)],
+        }).get_json()["results"]
+        self.assertEqual(results.count(True), 1)
+
+    def test_unknown_job(self):
+        """Test that an unknown job id is a 404 for polling and streaming."""
+        self.assertEqual(self.client.get("/api/generate/jobs/missing").status_code, 404)
+        self.assertEqual(self.client.get("/api/generate/jobs/missing/events").status_code, 404)
+
+    def test_full_gate_rejects_job(self):
+        """Test that a job is refused with 503 while the generate gate is full."""
+        gate = admission.gate("generate")
+        gate.acquire()
+        try:
+            response = self.client.post("/api/generate/jobs", json={"difficulty": "easy"})
+        finally:
+            gate.release()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Retry-After", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
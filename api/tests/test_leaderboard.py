@@ -0,0 +1,156 @@
+"""
+Tests for leaderboards and their cached snapshots.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from api.tests import AppTestCase
+from app import leaderboard
+from app.leaderboard import LeaderboardCache, leaderboard_cache, period_start, user_rank
+from app.models import db, Score, User
+
+
+class LeaderboardTestCase(AppTestCase):
+    """Three users with one easy score each."""
+
+    config = {"LEADERBOARD_SIZE": 3}
+
+    def setUp(self):
+        # Registered first so it runs last, after the score writer has stopped.
+        self.addCleanup(leaderboard_cache.clear)
+        super().setUp()
+        with self.app.app_context():
+            users = [User(google_id=f"g{i}", email=f"{i}@example.com", name=f"U{i}")
+                     for i in range(3)]
+            db.session.add_all(users)
+            db.session.commit()
+            self.user_ids = [user.id for user in users]
+            for user_id, points in zip(self.user_ids, [300, 200, 100]):
+                self._add(user_id, points)
+
+    def _add(self, user_id, points, difficulty="easy", completed_at=None):
+        db.session.add(Score(user_id=user_id, difficulty=difficulty, score=points,
+                             time_seconds=60, mistakes=0,
+                             completed_at=completed_at or datetime.utcnow()))
+        db.session.commit()
+
+
+class TestLeaderboard(LeaderboardTestCase):
+    """Test cases for leaderboards."""
+
+    def setUp(self):
+        super().setUp()
+        self.context = self.app.app_context()
+        self.context.push()
+
+    def tearDown(self):
+        self.context.pop()
+        super().tearDown()
+
+    def _cached_get(self, cache, difficulty="easy", period="all"):
+        """Get a leaderboard, returning (scores, whether it queried)"""
+        with mock.patch.object(leaderboard, "top_scores", wraps=leaderboard.top_scores) as query:
+            entries = cache.get(difficulty, period)
+            return [entry["score"] for entry in entries], query.called
+
+    def test_top_scores(self):
+        """Test that the top scores are ranked best first."""
+        entries = leaderboard.top_scores("easy", "all", 2)
+
+        self.assertEqual([(e["rank"], e["score"]) for e in entries], [(1, 300), (2, 200)])
+        self.assertEqual(entries[0]["player"], "U0")
+
+    def test_snapshot_reused(self):
+        """Test that a fresh snapshot is served without a query."""
+        cache = LeaderboardCache(size=3)
+
+        self.assertEqual(self._cached_get(cache), ([300, 200, 100], True))
+        self.assertEqual(self._cached_get(cache), ([300, 200, 100], False))
+
+    def test_low_score_keeps_full_snapshot(self):
+        """Test that a score below a full snapshot leaves it in place."""
+        cache = LeaderboardCache(size=3)
+        self._cached_get(cache)
+        self._add(self.user_ids[0], 50)
+        cache.record("easy", 50)
+
+        self.assertEqual(self._cached_get(cache), ([300, 200, 100], False))
+
+    def test_high_score_drops_snapshot(self):
+        """Test that a score that would make the board drops its snapshot."""
+        cache = LeaderboardCache(size=3)
+        self._cached_get(cache)
+        self._cached_get(cache, "hard")
+        self._add(self.user_ids[1], 250)
+        cache.record("easy", 250)
+
+        self.assertEqual(self._cached_get(cache), ([300, 250, 200], True))
+        self.assertEqual(self._cached_get(cache, "hard"), ([], False))
+
+    def test_partial_snapshot_dropped(self):
+        """Test that any score drops a snapshot that is not yet full."""
+        cache = LeaderboardCache(size=5)
+        self._cached_get(cache)
+        self._add(self.user_ids[2], 10)
+        cache.record("easy", 10)
+
+        self.assertEqual(self._cached_get(cache), ([300, 200, 100, 10], True))
+
+    def test_ttl_expiry(self):
+        """Test that an expired snapshot is queried again."""
+        cache = LeaderboardCache(size=3, ttl=-1)
+        self._cached_get(cache)
+
+        self.assertTrue(self._cached_get(cache)[1])
+
+    def test_new_week_requeries(self):
+        """Test that a weekly snapshot from last week is not served."""
+        cache = LeaderboardCache(size=3)
+        self._cached_get(cache, period="week")
+        next_week = period_start("week") + timedelta(days=7)
+        with mock.patch.object(leaderboard, "period_start", return_value=next_week):
+            self.assertEqual(self._cached_get(cache, period="week"), ([], True))
+
+    def test_user_rank(self):
+        """Test that a user's rank counts the better scores above their best."""
+        self._add(self.user_ids[2], 250)
+
+        self.assertEqual(user_rank(self.user_ids[2], "easy", "all"), {"rank": 2, "score": 250})
+        self.assertIsNone(user_rank(self.user_ids[2], "hard", "all"))
+
+
+class TestLeaderboardRoute(LeaderboardTestCase):
+    """Test cases for /api/leaderboard."""
+
+    def test_saved_score_shows_up(self):
+        """Test that a score saved through the API appears on the next request."""
+        client = self.app.test_client()
+        client.get("/api/leaderboard?difficulty=easy")
+        with client.session_transaction() as session:
+            session["_user_id"] = str(self.user_ids[2])
+            session["_fresh"] = True
+
+        client.post("/api/save-score", json={"difficulty": "easy", "time": 60, "mistakes": 0,
+                                             "score": 400})
+        data = client.get("/api/leaderboard?difficulty=easy").get_json()
+
+        self.assertEqual([e["score"] for e in data["entries"]], [400, 300, 200])
+        self.assertEqual(data["me"], {"rank": 1, "score": 400})
+
+    def test_unknown_period(self):
+        """Test that an unknown period is rejected."""
+        response = self.app.test_client().get("/api/leaderboard?period=month")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_difficulty(self):
+        """Test that an unknown difficulty is rejected without caching a snapshot."""
+        response = self.app.test_client().get("/api/leaderboard?difficulty=x1")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn(("x1", "all"), leaderboard_cache._snapshots)
+
+
+if __name__ == "__main__":
+    unittest.main()
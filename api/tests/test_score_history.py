@@ -0,0 +1,106 @@
+"""
+Tests for the paginated score history.
+"""
+
+import base64
+import unittest
+from datetime import datetime, timedelta
+from api.tests import AppTestCase
+from app.models import db, Score, User, UserStats
+
+
+class TestScoreHistory(AppTestCase):
+    """Test cases for /api/get-scores."""
+
+    def setUp(self):
+        super().setUp()
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        with self.app.app_context():
+            user = User(google_id="g1", email="a@example.com", name="A")
+            other = User(google_id="g2", email="b@example.com", name="B")
+            db.session.add_all([user, other])
+            db.session.flush()
+            # Two games share a completion time, so ties are ordered by id.
+            times = [start, start + timedelta(minutes=1), start + timedelta(minutes=1),
+                     start + timedelta(minutes=2), start + timedelta(minutes=3)]
+            for points, (completed_at, difficulty) in enumerate(
+                    zip(times, ["easy", "hard", "easy", "easy", "hard"]), start=1):
+                score = Score(user_id=user.id, difficulty=difficulty, score=points * 100,
+                              time_seconds=60, mistakes=0, completed_at=completed_at)
+                db.session.add(score)
+                UserStats.record(score)
+            db.session.add(Score(user_id=other.id, difficulty="easy", score=999,
+                                 time_seconds=60, mistakes=0, completed_at=start))
+            db.session.commit()
+            self.user_id = user.id
+
+        self.client = self.app.test_client()
+        with self.client.session_transaction() as session:
+            session["_user_id"] = str(self.user_id)
+            session["_fresh"] = True
+
+    def _pages(self, query=""):
+        """Follow next_cursor to the end, returning the score values per page"""
+        pages = []
+        url = f"/api/get-scores?limit=2{query}"
+        while True:
+            data = self.client.get(url).get_json()
+            self.assertTrue(data["success"])
+            pages.append([s["score"] for s in data["scores"]])
+            if data["next_cursor"] is None:
+                return pages
+            url = f"/api/get-scores?limit=2{query}&cursor={data['next_cursor']}"
+
+    def test_pages_newest_first(self):
+        """Test that pages cover every score once, newest first, ties by id."""
+        self.assertEqual(self._pages(), [[500, 400], [300, 200], [100]])
+
+    def test_difficulty_filter(self):
+        """Test that a filtered history pages through one difficulty."""
+        self.assertEqual(self._pages("&difficulty=easy"), [[400, 300], [100]])
+
+    def test_statistics(self):
+        """Test that statistics come from the user's running totals."""
+        statistics = self.client.get("/api/get-scores").get_json()["statistics"]
+
+        self.assertEqual(statistics["total_games"], 5)
+        self.assertEqual(statistics["highest_score"], 500)
+        self.assertEqual(statistics["average_score"], 300)
+        self.assertEqual(statistics["by_difficulty"]["easy"]["count"], 3)
+
+    def test_limit_is_clamped(self):
+        """Test that out-of-range limits fall back to the allowed range."""
+        first = self.client.get("/api/get-scores?limit=0").get_json()
+        everything = self.client.get("/api/get-scores?limit=1000").get_json()
+
+        self.assertEqual(len(first["scores"]), 1)
+        self.assertEqual(len(everything["scores"]), 5)
+        self.assertIsNone(everything["next_cursor"])
+
+    def test_invalid_cursor(self):
+        """Test that malformed cursors are rejected with 400."""
+        bad = [
+            "not-a-cursor",
+            "%%%",
+            base64.urlsafe_b64encode(b"2024-01-01T00:00:00").decode(),
+            base64.urlsafe_b64encode(b"yesterday|1").decode(),
+            base64.urlsafe_b64encode(b"2024-01-01T00:00:00|x").decode(),
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        ]
+        for cursor in bad:
+            with self.subTest(cursor=cursor):
+                response = self.client.get(f"/api/get-scores?cursor={cursor}")
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json()["error"], "Invalid cursor")
+
+    def test_guest_gets_empty_history(self):
+        """Test that a guest gets no scores and empty statistics."""
+        data = self.app.test_client().get("/api/get-scores").get_json()
+
+        self.assertEqual(data["scores"], [])
+        self.assertIsNone(data["next_cursor"])
+        self.assertEqual(data["statistics"]["total_games"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for batched score writes.
+"""
+
+import os
+import unittest
+from datetime import datetime
+from api.tests import AppTestCase
+from app.models import db, Score, User, UserStats
+from app.score_writer import ScoreWriter
+
+
+def _score(user_id, points, difficulty="easy"):
+    return Score(user_id=user_id, difficulty=difficulty, score=points,
+                 time_seconds=100, mistakes=0, completed_at=datetime.utcnow())
+
+
+class TestScoreWriter(AppTestCase):
+    """Test cases for the score writer."""
+
+    config = {"SCORE_FLUSH_DELAY": 10.0}
+
+    def setUp(self):
+        super().setUp()
+        self.writer = self.app.extensions["score_writer"]
+        with self.app.app_context():
+            user = User(google_id="g1", email="a@example.com", name="A")
+            db.session.add(user)
+            db.session.commit()
+            self.user_id = user.id
+
+    def _scores(self):
+        with self.app.app_context():
+            return sorted(s.score for s in Score.query.filter_by(user_id=self.user_id))
+
+    def test_bound_per_app(self):
+        """Test that each app gets its own writer."""
+        other = self.make_app(
+            SQLALCHEMY_DATABASE_URI="sqlite://",
+            SESSION_DB_PATH=os.path.join(self.directory, "other-sessions.db"),
+        )
+
+        self.assertIsInstance(self.writer, ScoreWriter)
+        self.assertIsNot(other.extensions["score_writer"], self.writer)
+        with self.assertRaises(RuntimeError):
+            self.writer.init_app(other)
+
+    def test_batch_waits_for_delay(self):
+        """Test that queued scores are written together once the batch is due."""
+        self.assertFalse(self.writer.submit(_score(self.user_id, 100)))
+        self.assertFalse(self.writer.submit(_score(self.user_id, 200)))
+
+        self.assertEqual(self._scores(), [])
+        self.writer.stop()
+        self.assertEqual(self._scores(), [100, 200])
+
+    def test_full_batch_is_written(self):
+        """Test that a batch is written as soon as it is full."""
+        self.writer.configure(max_batch=2)
+        self.writer.submit(_score(self.user_id, 100))
+
+        self.assertTrue(self.writer.submit(_score(self.user_id, 200), durable=True, timeout=5))
+        self.assertEqual(self._scores(), [100, 200])
+        with self.app.app_context():
+            stats = db.session.get(UserStats, (self.user_id, "easy"))
+            self.assertEqual((stats.games, stats.total_score, stats.best_score), (2, 300, 200))
+
+    def test_wait_for_reads_own_writes(self):
+        """Test that waiting for a user's scores flushes their batch first."""
+        self.writer.configure(max_delay=0.2)
+        self.writer.submit(_score(self.user_id, 300))
+
+        self.assertTrue(self.writer.wait_for(self.user_id, timeout=5))
+        self.assertEqual(self._scores(), [300])
+        self.assertTrue(self.writer.wait_for(self.user_id + 1, timeout=0))
+
+    def test_bad_score_keeps_rest_of_batch(self):
+        """Test that one failing score is retried alone and the rest commit."""
+        self.writer.configure(max_batch=3)
+        self.writer.submit(_score(self.user_id, 100))
+        self.writer.submit(_score(self.user_id, 200))
+
+        with self.assertRaises(Exception):
+            self.writer.submit(_score(self.user_id, 50, difficulty=None), durable=True, timeout=5)
+        self.assertEqual(self._scores(), [100, 200])
+
+    def test_get_scores_sees_queued_score(self):
+        """Test that the score history includes a score saved just before."""
+        self.writer.configure(max_delay=0.2)
+        client = self.app.test_client()
+        with client.session_transaction() as session:
+            session["_user_id"] = str(self.user_id)
+            session["_fresh"] = True
+
+        saved = client.post("/api/save-score", json={"difficulty": "easy", "time": 60,
+                                                     "mistakes": 1, "score": 1234}).get_json()
+        scores = client.get("/api/get-scores?limit=5").get_json()
+
+        self.assertFalse(saved["saved_to_db"])
+        self.assertEqual([s["score"] for s in scores["scores"]], [1234])
+        self.assertEqual(scores["statistics"]["total_games"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
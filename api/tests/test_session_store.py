@@ -0,0 +1,148 @@
+"""
+Tests for server-side sessions.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from flask import Flask, session
+from app.session_store import ServerSession, ServerSessionInterface, SqliteSessionStore
+
+
+class TestSqliteSessionStore(unittest.TestCase):
+    """Test cases for the session store."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = SqliteSessionStore(os.path.join(self.directory, "sessions.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_save_and_load(self):
+        """Test that saved data loads back until it expires."""
+        self.store.save("a", {"game_id": "g"}, time.time() + 60)
+        self.store.save("b", {"x": 1}, time.time() - 1)
+
+        self.assertEqual(self.store.load("a"), {"game_id": "g"})
+        self.assertIsNone(self.store.load("b"))
+        self.assertIsNone(self.store.load("missing"))
+
+    def test_touch_and_sweep(self):
+        """Test that touching extends a session and sweeping drops expired ones."""
+        self.store.save("a", {"x": 1}, time.time() - 1)
+        self.store.save("b", {"x": 2}, time.time() - 1)
+        self.store.touch("a", time.time() + 60)
+
+        self.assertEqual(self.store.sweep(), 1)
+        self.assertEqual(self.store.load("a"), {"x": 1})
+
+    def test_connection_per_thread(self):
+        """Test that a thread reuses its connection and others get their own."""
+        with self.store._connect() as first:
+            pass
+        with self.store._connect() as second:
+            pass
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.store._connect().__enter__()))
+        thread.start()
+        thread.join()
+
+        self.assertIs(first, second)
+        self.assertIsNot(other[0], first)
+
+
+class TestServerSessionInterface(unittest.TestCase):
+    """Test cases for the Flask session interface."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = SqliteSessionStore(os.path.join(self.directory, "sessions.db"))
+        self.app = Flask(__name__, static_folder=self.directory, static_url_path="/static")
+        self.app.secret_key = "test"
+        self.app.session_interface = ServerSessionInterface(self.store)
+
+        @self.app.route("/set/<value>")
+        def set_value(value):
+            session["value"] = value
+            return "ok"
+
+        @self.app.route("/get")
+        def get_value():
+            return session.get("value", "")
+
+        @self.app.route("/login")
+        def login():
+            session.regenerate()
+            session["user"] = "u"
+            return "ok"
+
+        @self.app.route("/logout")
+        def logout():
+            session.clear()
+            return "ok"
+
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _sid(self):
+        return self.client.get_cookie("session").value
+
+    def test_round_trip(self):
+        """Test that data stays on the server and the cookie holds its id."""
+        self.client.get("/set/hello")
+
+        self.assertEqual(self.client.get("/get").data, b"hello")
+        self.assertEqual(self.store.load(self._sid()), {"value": "hello"})
+
+    def test_regenerate_on_login(self):
+        """Test that logging in moves the data to a new id and drops the old one."""
+        self.client.get("/set/hello")
+        before = self._sid()
+        self.client.get("/login")
+        after = self._sid()
+
+        self.assertNotEqual(before, after)
+        self.assertIsNone(self.store.load(before))
+        self.assertEqual(self.store.load(after), {"value": "hello", "user": "u"})
+
+    def test_regenerate_new_session(self):
+        """Test that regenerating a session that was never saved just uses a new id."""
+        fresh = ServerSession(new=True)
+        sid = fresh.sid
+        fresh.regenerate()
+
+        self.assertNotEqual(fresh.sid, sid)
+        self.assertIsNone(fresh.previous_sid)
+
+    def test_logout_deletes(self):
+        """Test that clearing the session removes its row and cookie."""
+        self.client.get("/set/hello")
+        sid = self._sid()
+        self.client.get("/logout")
+
+        self.assertIsNone(self.store.load(sid))
+        self.assertIsNone(self.client.get_cookie("session"))
+
+    def test_static_skips_store(self):
+        """Test that static file requests never read the session store."""
+        with open(os.path.join(self.directory, "a.txt"), "w") as f:
+            f.write("static")
+        self.client.get("/set/hello")
+
+        with mock.patch.object(self.store, "load") as load:
+            response = self.client.get("/static/a.txt")
+            response.close()
+
+        load.assert_not_called()
+        self.assertEqual(self.client.get("/get").data, b"hello")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for solve steps and their explanations.
+"""
+
+import pickle
+import threading
+import unittest
+from api.solver.solve_step import SolveStep, TECHNIQUE_NAMES, technique_id
+
+
+class TestSolveStep(unittest.TestCase):
+    """Test cases for solve steps."""
+
+    def test_compact_fields(self):
+        """Test that steps round-trip cells and digits through their masks."""
+        step = SolveStep("Naked Pair", 3, candidates_removed={4, 7},
+                         affected_cells=[80, 5, 12], unit=0,
+                         pattern_cells=[3, 4], pattern_digits=[7, 4])
+
+        self.assertIsNone(step.value)
+        self.assertEqual(step.candidates_removed, {4, 7})
+        self.assertEqual(step.affected_cells, [5, 12, 80])
+        self.assertEqual(step.pattern_digits, [4, 7])
+        self.assertFalse(hasattr(step, "__dict__"))
+
+    def test_equality(self):
+        """Test that equal steps compare and hash equal."""
+        first = SolveStep("Naked Single", 10, 5)
+        second = SolveStep("Naked Single", 10, 5)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        self.assertNotEqual(first, SolveStep("Hidden Single", 10, 5, unit=1))
+
+    def test_pickle_uses_technique_name(self):
+        """Test that steps pickle the technique name, not the per-process id."""
+        step = SolveStep("Hidden Pair", 0, candidates_removed={5}, affected_cells=[0, 1])
+        data = pickle.dumps(step)
+
+        self.assertIn(b"Hidden Pair", data)
+        self.assertEqual(pickle.loads(data), step)
+
+    def test_concurrent_technique_registration(self):
+        """Test that names registered from many threads each get their own id."""
+        names = [f"Concurrent Technique {i}" for i in range(50)]
+        ids = {}
+        barrier = threading.Barrier(len(names))
+
+        def register(name):
+            barrier.wait()
+            ids[name] = technique_id(name)
+
+        threads = [threading.Thread(target=register, args=(name,)) for name in names]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name in names:
+            self.assertEqual(TECHNIQUE_NAMES[ids[name]], name)
+            self.assertEqual(technique_id(name), ids[name])
+
+    def test_explanation(self):
+        """Test that explanations are rendered from the step fields."""
+        step = SolveStep("Hidden Single", 10, 5, unit=10)
+
+        self.assertEqual(
+            step.explanation,
+            "Value 5 can only go in one cell in column 2: cell at row 2, column 2",
+        )
+
+    def test_localized_explanation(self):
+        """Test rendering with a locale and falling back to English."""
+        step = SolveStep("Naked Single", 0, 9)
+
+        self.assertIn("9", step.explain("it"))
+        self.assertNotEqual(step.explain("it"), step.explanation)
+        self.assertEqual(step.explain("xx"), step.explanation)
+        self.assertEqual(step.to_dict("it")["explanation"], step.explain("it"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,11 @@ Tests for the Sudoku solver.
 
 import unittest
 import random
+import threading
 from api.generator.full_board import FullBoardGenerator
 from api.generator.puzzle_generator import PuzzleGenerator
 from api.solver.solver import SudokuSolver
+from api.solver.registry import TechniqueRegistry
 from api.validation.rules import validate_complete
 
 
@@ -82,6 +84,65 @@ class TestSolver(unittest.TestCase):
         hardest = solver.get_hardest_technique()
         self.assertIsNotNone(hardest)
 
+    def test_registry_records_stats(self):
+        """Test that the technique registry profiles every search."""
+        generator = PuzzleGenerator()
+        puzzle = generator.generate(difficulty="easy")
+
+        registry = TechniqueRegistry()
+        solver = SudokuSolver(registry=registry)
+        solver.solve(puzzle.copy(), use_cache=False)
+
+        stats = registry.get_stats()
+        self.assertEqual(list(stats), [t.name for t in registry.techniques])
+        self.assertEqual(stats["Naked Single"]["calls"], len(solver.get_steps()))
+        self.assertGreater(stats["Naked Single"]["hits"], 0)
+        self.assertGreater(stats["Naked Single"]["total_ns"], 0)
+
+    def test_adaptive_order(self):
+        """Test that adaptive ordering reorders profiled techniques and still solves."""
+        generator = PuzzleGenerator()
+        puzzle = generator.generate(difficulty="medium")
+
+        registry = TechniqueRegistry(min_calls=1)
+        registry.record("Hidden Single", 10, True)
+        registry.record("Naked Single", 1000, False)
+        ordered = [t.name for t in registry.ordered(adaptive=True)]
+        self.assertEqual(ordered[:2], ["Hidden Single", "Naked Single"])
+        self.assertEqual(registry.techniques[0].name, "Naked Single")
+
+        expected = puzzle.copy()
+        SudokuSolver().solve(expected, use_cache=False)
+        adaptive = puzzle.copy()
+        SudokuSolver(registry=registry, adaptive=True).solve(adaptive, use_cache=False)
+        self.assertEqual(adaptive, expected)
+
+    def test_shared_solver_across_threads(self):
+        """Test that one solver serves concurrent solves without mixing steps."""
+        generator = PuzzleGenerator()
+        puzzles = [generator.generate(difficulty="easy") for _ in range(4)]
+        expected = [SudokuSolver().solve_result(p.copy(), use_cache=False) for p in puzzles]
+
+        solver = SudokuSolver()
+        errors = []
+
+        def worker(index):
+            for _ in range(5):
+                solver.solve(puzzles[index].copy(), use_cache=False)
+                result = solver.solve_result(puzzles[index].copy(), use_cache=False)
+                if result.steps != expected[index].steps:
+                    errors.append(("result", index))
+                if solver.get_steps() != expected[index].steps:
+                    errors.append(("steps", index))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(puzzles))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
 
 if __name__ == "__main__":
     unittest.main()
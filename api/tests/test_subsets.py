@@ -0,0 +1,101 @@
+"""
+Tests for the naked and hidden subset techniques.
+"""
+
+import unittest
+from api.board.board import Board
+from api.solver.techniques.subsets import (
+    NakedPair, HiddenPair, NakedTriple, HiddenTriple, NakedQuad, HiddenQuad,
+    digit_mask, mask_digits,
+)
+
+
+def _board_with_candidates(candidates: dict) -> Board:
+    """Create an empty board and override candidates for some cells."""
+    board = Board()
+    for idx, values in candidates.items():
+        board.get_cell_by_index(idx).candidates = set(values)
+    return board
+
+
+class TestSubsets(unittest.TestCase):
+    """Test cases for subset techniques."""
+
+    def test_mask_round_trip(self):
+        """Test conversion between values and digit masks."""
+        self.assertEqual(digit_mask({1, 9}), 0b100000001)
+        self.assertEqual(mask_digits(digit_mask({2, 5, 7})), [2, 5, 7])
+
+    def test_naked_pair(self):
+        """Test naked pair detection in a row."""
+        board = _board_with_candidates({0: {1, 2}, 4: {1, 2}})
+
+        step = NakedPair().find(board)
+
+        self.assertIsNotNone(step)
+        self.assertEqual(step.technique, "Naked Pair")
+        self.assertEqual(step.candidates_removed, {1, 2})
+        self.assertEqual(step.affected_cells, [1, 2, 3, 5, 6, 7, 8])
+
+    def test_naked_triple(self):
+        """Test naked triple detection where no cell holds all three values."""
+        board = _board_with_candidates({0: {1, 2}, 1: {2, 3}, 2: {1, 3}})
+
+        self.assertIsNone(NakedPair().find(board))
+        step = NakedTriple().find(board)
+
+        self.assertIsNotNone(step)
+        self.assertEqual(step.technique, "Naked Triple")
+        self.assertEqual(step.candidates_removed, {1, 2, 3})
+        self.assertNotIn(0, step.affected_cells)
+        self.assertIn(3, step.affected_cells)
+
+    def test_naked_quad(self):
+        """Test naked quad detection."""
+        board = _board_with_candidates(
+            {0: {1, 2}, 1: {2, 3}, 2: {3, 4}, 3: {1, 4}}
+        )
+
+        step = NakedQuad().find(board)
+
+        self.assertIsNotNone(step)
+        self.assertEqual(step.candidates_removed, {1, 2, 3, 4})
+        self.assertEqual(step.affected_cells, [4, 5, 6, 7, 8])
+
+    def test_hidden_pair(self):
+        """Test hidden pair detection in a row."""
+        others = {idx: {1, 2, 3, 6, 7, 8, 9} for idx in range(9) if idx not in (3, 4)}
+        board = _board_with_candidates(others)
+
+        step = HiddenPair().find(board)
+
+        self.assertIsNotNone(step)
+        self.assertEqual(step.technique, "Hidden Pair")
+        self.assertEqual(step.affected_cells, [3, 4])
+        self.assertEqual(step.candidates_removed, {1, 2, 3, 6, 7, 8, 9})
+
+    def test_hidden_triple(self):
+        """Test hidden triple detection in a row."""
+        others = {idx: {1, 2, 3, 7, 8, 9} for idx in range(9) if idx not in (2, 5, 8)}
+        others[2] = {4, 5, 9}
+        others[5] = {5, 6, 8}
+        others[8] = {4, 6, 7}
+        board = _board_with_candidates(others)
+
+        self.assertIsNone(HiddenPair().find(board))
+        step = HiddenTriple().find(board)
+
+        self.assertIsNotNone(step)
+        self.assertEqual(step.affected_cells, [2, 5, 8])
+        self.assertEqual(step.candidates_removed, {7, 8, 9})
+
+    def test_hidden_quad_not_found_on_open_board(self):
+        """Test that an unconstrained board has no subsets."""
+        board = Board()
+
+        for technique in (NakedQuad(), HiddenQuad()):
+            self.assertIsNone(technique.find(board))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for canonical forms under the Sudoku symmetry group.
+"""
+
+import unittest
+import random
+import time
+from unittest import mock
+from api.utils import symmetry
+from api.utils.symmetry import CanonicalSearchLimit, canonical_form, canonical_key
+
+PUZZLE = (
+    "53..7....6..195....98....6.8...6...34..8.3..17...2...6"
+    ".6....28....419..5....8..79"
+)
+
+
+def _random_symmetry(board_str: str) -> str:
+    """Apply a random transpose, row/column permutation and relabeling."""
+    grid = [board_str[r * 9:r * 9 + 9] for r in range(9)]
+    if random.random() < 0.5:
+        grid = ["".join(col) for col in zip(*grid)]
+
+    bands = random.sample(range(3), 3)
+    rows = [b * 3 + r for b in bands for r in random.sample(range(3), 3)]
+    stacks = random.sample(range(3), 3)
+    cols = [s * 3 + c for s in stacks for c in random.sample(range(3), 3)]
+    digits = random.sample("123456789", 9)
+    relabel = {str(i + 1): digits[i] for i in range(9)}
+    relabel["."] = "."
+
+    return "".join(relabel[grid[r][c]] for r in rows for c in cols)
+
+
+# Regular boards whose many tied arrangements make the search slow.
+BAND = "123456789456789123789123456" + "." * 54
+ROW = "123456789" + "." * 72
+COLUMN = "".join(str(r + 1) + "." * 8 for r in range(9))
+DIAGONAL = "".join("." * r + str(r + 1) + "." * (8 - r) for r in range(9))
+
+
+class TestSymmetry(unittest.TestCase):
+    """Test cases for canonical forms."""
+
+    def setUp(self):
+        random.seed(7)
+
+    def test_equivalent_puzzles_share_canonical_form(self):
+        """Test that symmetric variants have the same canonical form."""
+        canonical = canonical_key(PUZZLE)
+
+        for _ in range(20):
+            self.assertEqual(canonical_key(_random_symmetry(PUZZLE)), canonical)
+
+    def test_different_puzzles_differ(self):
+        """Test that removing a clue changes the canonical form."""
+        other = "." + PUZZLE[1:]
+        self.assertNotEqual(canonical_key(other), canonical_key(PUZZLE))
+
+    def test_canonical_form_is_minimal_variant(self):
+        """Test that no random variant is smaller than the canonical form."""
+        canonical = canonical_key(PUZZLE).replace(".", "0")
+
+        for _ in range(50):
+            variant = _random_symmetry(PUZZLE)
+            seen = {}
+            relabeled = "".join(
+                "0" if ch == "." else seen.setdefault(ch, str(len(seen) + 1))
+                for ch in variant
+            )
+            self.assertLessEqual(canonical, relabeled)
+
+    def test_transform_round_trip(self):
+        """Test that the transform maps boards and indices both ways."""
+        canonical, transform = canonical_form(PUZZLE)
+
+        self.assertEqual(transform.apply(PUZZLE), canonical)
+        self.assertEqual(transform.invert(canonical), PUZZLE)
+        for index in range(81):
+            mapped = transform.map_index(index)
+            self.assertEqual(transform.unmap_index(mapped), index)
+            self.assertEqual(
+                PUZZLE[index] == ".", canonical[mapped] == "."
+            )
+
+
+    def _nodes(self, board, max_nodes=None):
+        """Count the arrangements tried while canonicalizing a board"""
+        nodes = []
+        original = symmetry._refine
+
+        def refine(*args):
+            alternatives = original(*args)
+            nodes.append(len(alternatives))
+            return alternatives
+
+        with mock.patch.object(symmetry, "_refine", side_effect=refine):
+            try:
+                canonical_form(board, max_nodes=max_nodes)
+            except CanonicalSearchLimit:
+                return sum(nodes), True
+        return sum(nodes), False
+
+    def test_budget_caps_regular_boards(self):
+        """Test that a node budget stops the search early on regular boards."""
+        for board in (BAND, ROW, COLUMN, DIAGONAL):
+            with self.subTest(board=board):
+                # Uncapped these try 7,000-16,000 arrangements (150-400 ms).
+                uncapped, _ = self._nodes(board)
+                capped, stopped = self._nodes(board, max_nodes=1000)
+
+                self.assertTrue(stopped)
+                self.assertLess(capped, uncapped / 3)
+
+    def test_budget_fits_real_puzzles(self):
+        """Test that ordinary puzzles canonicalize well within the budget."""
+        for _ in range(10):
+            variant = _random_symmetry(PUZZLE)
+            self.assertEqual(canonical_form(variant, max_nodes=300)[0], canonical_key(PUZZLE))
+
+    def test_deadline(self):
+        """Test that a passed deadline stops the search."""
+        with self.assertRaises(CanonicalSearchLimit):
+            canonical_form(BAND, deadline=time.time() - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
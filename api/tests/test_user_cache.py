@@ -0,0 +1,98 @@
+"""
+Tests for the logged-in user cache.
+"""
+
+import unittest
+from unittest import mock
+from api.tests import AppTestCase
+from app.models import db, User
+from app.user_cache import UserCache, user_cache
+
+
+class TestUserCache(AppTestCase):
+    """Test cases for the user cache."""
+
+    def setUp(self):
+        self.addCleanup(user_cache.clear)
+        super().setUp()
+        with self.app.app_context():
+            user = User(google_id="g1", email="a@example.com", name="Alice", nickname="Al")
+            db.session.add(user)
+            db.session.commit()
+            self.user_id = user.id
+        user_cache.clear()
+
+    def _load(self, cache):
+        """Load the user in a fresh app context, returning (nickname, queried)"""
+        with self.app.app_context():
+            with mock.patch.object(db.session, "get", wraps=db.session.get) as get:
+                user = cache.load(self.user_id)
+                return user.nickname, get.called
+
+    def test_hit_skips_query(self):
+        """Test that a cached user is rebuilt without a query."""
+        cache = UserCache()
+
+        self.assertEqual(self._load(cache), ("Al", True))
+        self.assertEqual(self._load(cache), ("Al", False))
+
+    def test_ttl_none_never_expires(self):
+        """Test that a TTL of None caches users without expiry."""
+        cache = UserCache(ttl=None)
+        self._load(cache)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(self._load(cache), ("Al", False))
+
+    def test_ttl_zero_disables(self):
+        """Test that a TTL of 0 turns the cache off."""
+        cache = UserCache(ttl=0)
+        self._load(cache)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(self._load(cache), ("Al", True))
+
+    def test_expired_user_reloads(self):
+        """Test that an expired user is read from the database again."""
+        cache = UserCache(ttl=60)
+        with mock.patch("app.user_cache.time") as clock:
+            clock.monotonic.return_value = 1000.0
+            self._load(cache)
+            self.assertEqual(len(cache), 1)
+
+            clock.monotonic.return_value = 1059.0
+            self.assertEqual(self._load(cache), ("Al", False))
+
+            clock.monotonic.return_value = 1120.0
+            self.assertEqual(self._load(cache), ("Al", True))
+            self.assertEqual(len(cache), 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used user is evicted."""
+        cache = UserCache(max_size=1)
+        with self.app.app_context():
+            other = User(google_id="g2", email="b@example.com", name="Bob")
+            db.session.add(other)
+            db.session.commit()
+            cache.load(self.user_id)
+            cache.load(other.id)
+
+            self.assertEqual(len(cache), 1)
+            self.assertIsNone(cache._get(self.user_id))
+
+    def test_nickname_update_invalidates(self):
+        """Test that changing a nickname is seen on the next request."""
+        client = self.app.test_client()
+        with client.session_transaction() as session:
+            session["_user_id"] = str(self.user_id)
+            session["_fresh"] = True
+
+        client.get("/api/get-scores")
+        response = client.post("/api/profile/update-nickname", json={"nickname": "Ally"})
+
+        self.assertTrue(response.get_json()["success"])
+        self.assertEqual(self._load(user_cache), ("Ally", True))
+
+
+if __name__ == "__main__":
+    unittest.main()
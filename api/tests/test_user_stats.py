@@ -0,0 +1,96 @@
+"""
+Tests for the per-user statistics table.
+"""
+
+import random
+import unittest
+from datetime import datetime, timedelta
+from api.tests import AppTestCase
+from app.models import db, Score, User, UserStats
+
+
+class TestUserStats(AppTestCase):
+    """Test cases for running per-user totals."""
+
+    def setUp(self):
+        super().setUp()
+        with self.app.app_context():
+            users = [User(google_id=f"g{i}", email=f"{i}@example.com", name=f"U{i}")
+                     for i in range(3)]
+            db.session.add_all(users)
+            db.session.commit()
+            self.user_ids = [user.id for user in users]
+
+    def _scores(self, count, seed=0):
+        """Make scores in random order, with repeated times and completion times"""
+        rng = random.Random(seed)
+        start = datetime(2024, 1, 1)
+        return [
+            Score(user_id=rng.choice(self.user_ids),
+                  difficulty=rng.choice(["easy", "medium", "expert"]),
+                  score=rng.randrange(0, 5000),
+                  time_seconds=rng.randrange(30, 300, 30),
+                  mistakes=rng.randrange(3),
+                  completed_at=start + timedelta(hours=rng.randrange(100)))
+            for _ in range(count)
+        ]
+
+    @staticmethod
+    def _snapshot():
+        return sorted(
+            (s.user_id, s.difficulty, s.games, s.total_score, s.best_score,
+             s.best_time, s.last_played_at)
+            for s in UserStats.query.all()
+        )
+
+    def test_record_matches_rebuild(self):
+        """Test that recording scores one by one gives the same totals as a rebuild."""
+        with self.app.app_context():
+            for score in self._scores(200):
+                db.session.add(score)
+                UserStats.record(score)
+                db.session.commit()
+            recorded = self._snapshot()
+
+            UserStats.rebuild()
+            db.session.commit()
+            rebuilt = self._snapshot()
+
+        self.assertEqual(len(recorded), 9)
+        self.assertEqual(recorded, rebuilt)
+
+    def test_record_in_one_transaction(self):
+        """Test that several scores for one row recorded before a commit all count."""
+        with self.app.app_context():
+            scores = [Score(user_id=self.user_ids[0], difficulty="easy", score=points,
+                            time_seconds=seconds, mistakes=0,
+                            completed_at=datetime(2024, 1, day))
+                      for points, seconds, day in [(100, 90, 3), (300, 120, 1), (200, 60, 2)]]
+            for score in scores:
+                db.session.add(score)
+                UserStats.record(score)
+            db.session.commit()
+            stats = db.session.get(UserStats, (self.user_ids[0], "easy"))
+
+            self.assertEqual((stats.games, stats.total_score, stats.best_score, stats.best_time),
+                             (3, 600, 300, 60))
+            self.assertEqual(stats.last_played_at, datetime(2024, 1, 3))
+
+    def test_backfilled_at_startup(self):
+        """Test that an app started over scores without totals rebuilds them."""
+        with self.app.app_context():
+            db.session.add_all(self._scores(50, seed=1))
+            db.session.commit()
+            self.assertIsNone(UserStats.query.first())
+
+        app = self.make_app()
+        with app.app_context():
+            recorded = self._snapshot()
+            UserStats.rebuild()
+            db.session.commit()
+            self.assertTrue(recorded)
+            self.assertEqual(recorded, self._snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for board validation.
+"""
+
+import unittest
+from api.board.board import Board
+from api.generator.full_board import FullBoardGenerator
+from api.validation.consistency import check_consistency, find_conflicts, is_solvable
+from api.validation.rules import validate_complete, validate_partial
+
+
+class TestConflicts(unittest.TestCase):
+    """Test cases for conflict detection."""
+
+    def test_valid_board_has_no_conflicts(self):
+        """Test that a solved board is conflict-free."""
+        board = FullBoardGenerator().generate()
+
+        self.assertEqual(find_conflicts(board), set())
+        self.assertEqual(check_consistency(board), (True, []))
+
+    def test_finds_every_conflicting_cell(self):
+        """Test that all cells of every repeated value are returned."""
+        board_str = list("." * 81)
+        board_str[0] = board_str[4] = board_str[8] = "5"   # three 5s in row 1
+        board_str[10] = board_str[20] = "7"                # two 7s in box 1
+        board_str[80] = "5"                                # same column as cell 8
+        board = Board.from_string("".join(board_str))
+
+        self.assertEqual(find_conflicts(board), {0, 4, 8, 10, 20, 80})
+        self.assertFalse(board.is_valid())
+
+    def test_reports_all_duplicates_per_unit(self):
+        """Test that a unit with two repeated values reports both."""
+        board = Board.from_string("11.22" + "." * 76)
+
+        is_consistent, issues = check_consistency(board)
+        self.assertFalse(is_consistent)
+        self.assertIn("Row 1 has duplicates: [1, 2]", issues)
+
+    def test_validate_partial_reports_every_unit(self):
+        """Test that partial validation names every unit find_conflicts flags."""
+        board_str = list("." * 81)
+        board_str[0] = board_str[4] = "5"      # row 1
+        board_str[10] = board_str[20] = "7"    # box 1
+        board_str[44] = board_str[80] = "3"    # column 9
+        board = Board.from_string("".join(board_str))
+
+        self.assertEqual(validate_partial(board), (False, "Invalid row 1, column 9, box 1"))
+        self.assertEqual(len(find_conflicts(board)), 6)
+        self.assertEqual(validate_partial(Board.from_string("." * 81)), (True, ""))
+
+
+class TestSolvable(unittest.TestCase):
+    """Test cases for the solvability check."""
+
+    def test_solvable_returns_solution(self):
+        """Test that a solvable board comes with a valid solution."""
+        board_str = (
+            "8..........36......7..9.2...5...7.......457.....1...3..."
+            "1....68..85...1..9....4.."
+        )
+        board = Board.from_string(board_str)
+        result = is_solvable(board)
+
+        self.assertTrue(result)
+        solution = Board.from_string(result.solution)
+        self.assertTrue(validate_complete(solution))
+        for idx, char in enumerate(board_str):
+            if char != ".":
+                self.assertEqual(result.solution[idx], char)
+        self.assertEqual(board.to_string(), board_str)
+
+    def test_contradiction_found_by_propagation(self):
+        """Test that an empty candidate set is reported without searching."""
+        board = Board.from_string("12345678.........9" + "." * 63)
+        result = is_solvable(board, max_nodes=0)
+
+        self.assertFalse(result)
+        self.assertFalse(result.undecided)
+        self.assertEqual(result.contradiction, "Cell (1, 9) has no candidates")
+
+    def test_duplicate_is_unsolvable(self):
+        """Test that a repeated value is reported as the contradiction."""
+        result = is_solvable(Board.from_string("11" + "." * 79))
+
+        self.assertFalse(result)
+        self.assertEqual(result.contradiction, "Row 1 repeats 1")
+
+    def test_search_limit(self):
+        """Test that the search gives up when the branch budget runs out."""
+        result = is_solvable(Board(), max_nodes=0)
+
+        self.assertFalse(result)
+        self.assertTrue(result.undecided)
+
+
+if __name__ == "__main__":
+    unittest.main()
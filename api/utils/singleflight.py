@@ -0,0 +1,82 @@
+"""
+Single-flight execution of identical concurrent calls.
+
+When several threads ask for the same key at once, the first one runs the
+computation and the others wait for it and share its result (or its
+exception). Nothing is remembered once the call finishes; pair it with a
+cache to keep results.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+
+class _Call:
+    """One in-flight computation and the threads waiting on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key."""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the computation
+            fn: Computation to run if none is in flight for the key
+
+        Returns:
+            (result, shared), where shared is True if this caller waited on
+            another caller's computation
+
+        Raises:
+            Whatever fn raised, in every caller that shared the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Get the number of computations currently running."""
+        with self._lock:
+            return len(self._calls)
+
+    def coalesced(self) -> int:
+        """Get how many calls have waited on another caller's computation."""
+        with self._lock:
+            return self._coalesced
@@ -0,0 +1,419 @@
+"""
+Canonical forms of Sudoku puzzles under the Sudoku symmetry group.
+
+Two puzzles are equivalent when one can be turned into the other by
+transposing the grid, permuting bands, permuting rows within a band,
+permuting stacks, permuting columns within a stack, and relabeling the
+digits. The canonical form is the lexicographically smallest equivalent
+puzzle (empty cells sort before digits), so equivalent puzzles share it.
+
+The search builds the canonical grid one row at a time and keeps only
+the row and column arrangements that tie for the smallest row so far.
+Columns that are still empty are kept as unordered groups instead of
+being enumerated, which prunes most of the column permutations.
+"""
+
+import time
+from dataclasses import dataclass, field
+from itertools import permutations, product
+from typing import Dict, List, Optional, Tuple
+
+from ..board.constants import EMPTY_CELL, UNIT_INDICES
+from ..solver.solve_step import SolveStep
+
+
+class CanonicalSearchLimit(Exception):
+    """Raised when a canonical search runs out of its work budget or time."""
+
+
+@dataclass(frozen=True)
+class SymmetryTransform:
+    """
+    A symmetry mapping an original puzzle onto its canonical form.
+
+    Canonical cell (i, j) holds labels[v], where v is the value at row
+    rows[i], column cols[j] of the original grid (transposed first when
+    transpose is set).
+
+    Attributes:
+        transpose: Whether the grid is transposed first
+        rows: Source row for each canonical row
+        cols: Source column for each canonical column
+        labels: Map from original digit to canonical digit (all 9 digits)
+    """
+    transpose: bool
+    rows: Tuple[int, ...]
+    cols: Tuple[int, ...]
+    labels: Dict[int, int] = field(hash=False)
+
+    def map_index(self, index: int) -> int:
+        """Map an original cell index to its canonical cell index."""
+        row, col = divmod(index, 9)
+        if self.transpose:
+            row, col = col, row
+        return self.rows.index(row) * 9 + self.cols.index(col)
+
+    def unmap_index(self, index: int) -> int:
+        """Map a canonical cell index back to the original cell index."""
+        row, col = self.rows[index // 9], self.cols[index % 9]
+        if self.transpose:
+            row, col = col, row
+        return row * 9 + col
+
+    def apply(self, board_str: str) -> str:
+        """Transform an original board string into canonical coordinates."""
+        values = _parse(board_str)
+        if self.transpose:
+            values = _transpose(values)
+        return _format(
+            self.labels[values[r * 9 + c]] if values[r * 9 + c] else EMPTY_CELL
+            for r in self.rows
+            for c in self.cols
+        )
+
+    def invert(self, board_str: str) -> str:
+        """Transform a canonical board string back to original coordinates."""
+        inverse = {canon: orig for orig, canon in self.labels.items()}
+        canonical = _parse(board_str)
+        values = [EMPTY_CELL] * 81
+        for i, r in enumerate(self.rows):
+            for j, c in enumerate(self.cols):
+                value = canonical[i * 9 + j]
+                values[r * 9 + c] = inverse[value] if value else EMPTY_CELL
+        if self.transpose:
+            values = _transpose(values)
+        return _format(values)
+
+    def unmap_step(self, step: SolveStep) -> SolveStep:
+        """Transform a step found on the canonical board back to original coordinates."""
+        inverse = {canon: orig for orig, canon in self.labels.items()}
+        unit = step.unit
+        if unit >= 0:
+            cells = {self.unmap_index(idx) for idx in UNIT_INDICES[unit]}
+            unit = next(u for u, indices in enumerate(UNIT_INDICES) if cells == set(indices))
+        return SolveStep(
+            technique=step.technique,
+            cell_index=self.unmap_index(step.cell_index),
+            value=inverse[step.value] if step.value else None,
+            candidates_removed=[inverse[d] for d in step.candidates_removed],
+            affected_cells=[self.unmap_index(idx) for idx in step.affected_cells],
+            unit=unit,
+            pattern_cells=[self.unmap_index(idx) for idx in step.pattern_cells],
+            pattern_digits=[inverse[d] for d in step.pattern_digits],
+        )
+
+
+def canonical_form(
+    board_str: str,
+    max_nodes: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[str, SymmetryTransform]:
+    """
+    Compute the canonical representative of a puzzle.
+
+    Args:
+        board_str: 81-character puzzle ('.' or '0' for empty cells)
+        max_nodes: Give up after trying this many row and column arrangements
+        deadline: Give up once time.time() passes this
+
+    Returns:
+        (canonical board string, transform from the puzzle to it)
+
+    Raises:
+        CanonicalSearchLimit: If the budget or deadline ran out first
+
+    Generated puzzles take about 1 ms. The search is exponential in the
+    number of tied arrangements, though, so highly regular boards are far
+    slower: a filled first band with the rest empty takes about 300 ms,
+    and a single filled row, column or diagonal about 150 ms. Callers on
+    a request path should pass a budget.
+    """
+    values = _parse(board_str)
+    grids = (values, _transpose(values))
+
+    # A state is (transpose, source rows so far, column layout, labels).
+    initial_layout = ((True, (0, 1, 2)),)
+    states = [(0, (), initial_layout, {}), (1, (), initial_layout, {})]
+    canonical = []
+
+    for position in range(9):
+        best_row = None
+        next_states = []
+        seen = set()
+        for transpose, rows, layout, labels in states:
+            if deadline is not None and time.time() > deadline:
+                raise CanonicalSearchLimit("Canonical search passed its deadline")
+            grid = grids[transpose]
+            for row in _next_rows(rows, position):
+                row_values = grid[row * 9:row * 9 + 9]
+                row_key = _row_key(row_values, layout, labels)
+                if best_row is not None and row_key > best_row:
+                    continue
+                if best_row is None or row_key < best_row:
+                    best_row = row_key
+                    next_states = []
+                    seen = set()
+
+                new_rows = rows + (row,)
+                alternatives = _refine(row_values, layout, labels)
+                if max_nodes is not None:
+                    max_nodes -= len(alternatives)
+                    if max_nodes < 0:
+                        raise CanonicalSearchLimit("Canonical search exceeded its budget")
+                for new_layout, new_columns in alternatives:
+                    new_labels = labels
+                    if new_columns:
+                        new_labels = dict(labels)
+                        for value in new_columns:
+                            new_labels[value] = len(new_labels) + 1
+
+                    # States that used the same rows and share a layout and
+                    # labels have identical futures; keep only the first.
+                    signature = (
+                        transpose, frozenset(new_rows), row // 3,
+                        new_layout, tuple(sorted(new_labels.items())),
+                    )
+                    if signature not in seen:
+                        seen.add(signature)
+                        next_states.append((transpose, new_rows, new_layout, new_labels))
+        canonical.extend(best_row)
+        states = next_states
+
+    transpose, rows, layout, labels = states[0]
+    labels = dict(labels)
+    spare = iter(v for v in range(1, 10) if v not in labels.values())
+    for value in range(1, 10):
+        if value not in labels:
+            labels[value] = next(spare)
+
+    transform = SymmetryTransform(bool(transpose), rows, _layout_columns(layout), labels)
+    return _format(canonical), transform
+
+
+def canonical_key(board_str: str) -> str:
+    """Get the canonical board string of a puzzle, e.g. for deduplication."""
+    return canonical_form(board_str)[0]
+
+
+# Column layouts
+#
+# A layout is a tuple of slots, left to right. A slot is either
+# (False, cells) - one stack whose columns are split into ordered cells,
+# the columns inside a cell being interchangeable - or (True, stacks) -
+# whole stacks, empty in every row placed so far, in any order.
+#
+# Columns only stay interchangeable while they are empty: within a row
+# every digit is distinct, so any other tie would be between digits seen
+# for the first time, and those are branched on explicitly because their
+# order decides their labels.
+
+_NEW = 10  # Sort key of a digit without a label yet (after every label).
+
+
+def _form(row_values: List[int], columns, labels: Dict[int, int]) -> List[int]:
+    """Get the smallest form of some interchangeable columns of a row."""
+    form = []
+    new = 0
+    for c in columns:
+        value = row_values[c]
+        if value in labels:
+            form.append(labels[value])
+        elif value:
+            new += 1
+        else:
+            form.append(EMPTY_CELL)
+    form.sort()
+    form.extend([_NEW] * new)
+    return form
+
+
+def _row_key(row_values: List[int], layout: tuple, labels: Dict[int, int]) -> List[int]:
+    """Get the smallest relabeled form of a row under a column layout."""
+    key = []
+    for is_group, content in layout:
+        if is_group:
+            forms = sorted(
+                _form(row_values, (s * 3, s * 3 + 1, s * 3 + 2), labels) for s in content
+            )
+            for form in forms:
+                key.extend(form)
+        else:
+            for cell in content:
+                key.extend(_form(row_values, cell, labels))
+
+    next_label = len(labels) + 1
+    for i, value in enumerate(key):
+        if value == _NEW:
+            key[i] = next_label
+            next_label += 1
+    return key
+
+
+def _refine(row_values: List[int], layout: tuple, labels: Dict[int, int]) -> list:
+    """
+    Get every refined layout giving a row its smallest form.
+
+    Returns:
+        List of (refined layout, newly labeled digits in order)
+    """
+    slot_options = []
+    for is_group, content in layout:
+        if is_group:
+            slot_options.append(_refine_group(row_values, content, labels))
+        else:
+            slot_options.append(_refine_cells(row_values, content, labels))
+
+    alternatives = []
+    for combo in product(*slot_options):
+        new_layout = []
+        new_columns = []
+        for slots, digits in combo:
+            new_layout.extend(slots)
+            new_columns.extend(digits)
+        alternatives.append((tuple(new_layout), new_columns))
+    return alternatives
+
+
+def _split(row_values: List[int], columns, labels: Dict[int, int]) -> tuple:
+    """Split columns into empty, labeled (sorted by label), and unlabeled."""
+    empty, labeled, unlabeled = [], [], []
+    for c in columns:
+        value = row_values[c]
+        if not value:
+            empty.append(c)
+        elif value in labels:
+            labeled.append(c)
+        else:
+            unlabeled.append(c)
+    labeled.sort(key=lambda c: labels[row_values[c]])
+    return empty, labeled, unlabeled
+
+
+def _refine_cells(row_values: List[int], cells: tuple, labels: Dict[int, int]) -> tuple:
+    """Refine one stack of ordered cells; unlabeled digits are branched on."""
+    if len(cells) == 3:
+        # Fully ordered stack: nothing to refine, only new labels to assign.
+        digits = [
+            row_values[c] for (c,) in cells
+            if row_values[c] and row_values[c] not in labels
+        ]
+        return [(((False, cells),), digits)]
+
+    fixed = []
+    branches = []
+    for cell in cells:
+        empty, labeled, unlabeled = _split(row_values, cell, labels)
+        fixed.append((empty, labeled))
+        branches.append(permutations(unlabeled))
+
+    options = []
+    for orders in product(*branches):
+        new_cells = []
+        digits = []
+        for (empty, labeled), order in zip(fixed, orders):
+            if empty:
+                new_cells.append(tuple(empty))
+            new_cells.extend((c,) for c in labeled)
+            new_cells.extend((c,) for c in order)
+            digits.extend(row_values[c] for c in order)
+        options.append((((False, tuple(new_cells)),), digits))
+    return options
+
+
+def _refine_group(row_values: List[int], stacks: tuple, labels: Dict[int, int]) -> tuple:
+    """Refine interchangeable stacks: order them by their smallest form."""
+    forms = []
+    for stack in stacks:
+        columns = (stack * 3, stack * 3 + 1, stack * 3 + 2)
+        empty, labeled, unlabeled = _split(row_values, columns, labels)
+        form = (
+            [EMPTY_CELL] * len(empty)
+            + [labels[row_values[c]] for c in labeled]
+            + [_NEW] * len(unlabeled)
+        )
+        forms.append((form, stack, empty, labeled, unlabeled))
+    forms.sort(key=lambda f: f[0])
+
+    # Stacks with equal forms are either still empty (they stay a group)
+    # or hold only new digits (their order decides labels, so branch).
+    runs = []
+    for form in forms:
+        if runs and runs[-1][0][0] == form[0]:
+            runs[-1].append(form)
+        else:
+            runs.append([form])
+
+    run_options = []
+    for run in runs:
+        if not run[0][3] and not run[0][4]:
+            stacks_left = tuple(f[1] for f in run)
+            if len(stacks_left) > 1:
+                run_options.append([([(True, stacks_left)], [])])
+            else:
+                run_options.append([([(False, (tuple(run[0][2]),))], [])])
+            continue
+
+        options = []
+        for run_order in permutations(run):
+            for orders in product(*(permutations(f[4]) for f in run_order)):
+                slots = []
+                digits = []
+                for (_, _, empty, labeled, _), order in zip(run_order, orders):
+                    cells = []
+                    if empty:
+                        cells.append(tuple(empty))
+                    cells.extend((c,) for c in labeled)
+                    cells.extend((c,) for c in order)
+                    digits.extend(row_values[c] for c in order)
+                    slots.append((False, tuple(cells)))
+                options.append((slots, digits))
+        run_options.append(options)
+
+    options = []
+    for combo in product(*run_options):
+        slots = []
+        digits = []
+        for run_slots, run_digits in combo:
+            slots.extend(run_slots)
+            digits.extend(run_digits)
+        options.append((slots, digits))
+    return options
+
+
+def _layout_columns(layout: tuple) -> Tuple[int, ...]:
+    """Pick one concrete column order from a layout."""
+    columns = []
+    for is_group, content in layout:
+        if is_group:
+            for stack in content:
+                columns.extend((stack * 3, stack * 3 + 1, stack * 3 + 2))
+        else:
+            for cell in content:
+                columns.extend(cell)
+    return tuple(columns)
+
+
+def _next_rows(rows: Tuple[int, ...], position: int) -> List[int]:
+    """Get source rows allowed at a canonical row position."""
+    if position % 3:
+        band = rows[-1] // 3
+        return [r for r in range(band * 3, band * 3 + 3) if r not in rows]
+    used_bands = {r // 3 for r in rows}
+    return [r for r in range(9) if r // 3 not in used_bands]
+
+
+def _parse(board_str: str) -> List[int]:
+    """Parse a board string into 81 integers (0 for empty)."""
+    if len(board_str) != 81:
+        raise ValueError("Board must have exactly 81 cells")
+    return [EMPTY_CELL if char in ".0" else int(char) for char in board_str]
+
+
+def _format(values) -> str:
+    """Format integers as a board string ('.' for empty)."""
+    return "".join(str(v) if v else "." for v in values)
+
+
+def _transpose(values: List[int]) -> List[int]:
+    """Transpose a grid given as 81 integers."""
+    return [values[c * 9 + r] for r in range(9) for c in range(9)]
@@ -2,8 +2,18 @@
 Consistency checker for Sudoku boards.
 """
 
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple
+
 from ..board.board import Board
-from ..board.constants import EMPTY_CELL
+from ..board.constants import (
+    EMPTY_CELL, CELL_UNITS, PEER_INDICES, UNIT_INDICES, mask_digits
+)
+
+
+UNIT_NAMES = ["Row"] * 9 + ["Column"] * 9 + ["Box"] * 9
+ALL_DIGITS = 0x1FF
 
 
 def check_consistency(board: Board) -> tuple[bool, list]:
@@ -14,77 +24,217 @@ def check_consistency(board: Board) -> tuple[bool, list]:
         (is_consistent, list of issues)
     """
     issues = []
+    for unit, mask in enumerate(_duplicate_masks(board.to_list())):
+        if mask:
+            issues.append(f"{UNIT_NAMES[unit]} {unit % 9 + 1} has duplicates: {mask_digits(mask)}")
+
+    return len(issues) == 0, issues
 
-    for row in range(9):
-        duplicates = _find_duplicates_in_row(board, row)
-        if duplicates:
-            issues.append(f"Row {row + 1} has duplicates: {duplicates}")
 
-    for col in range(9):
-        duplicates = _find_duplicates_in_col(board, col)
-        if duplicates:
-            issues.append(f"Column {col + 1} has duplicates: {duplicates}")
+def find_conflicts(board: Board) -> Set[int]:
+    """
+    Find every cell whose value is repeated in its row, column, or box.
 
-    for box in range(9):
-        duplicates = _find_duplicates_in_box(board, box)
-        if duplicates:
-            issues.append(f"Box {box + 1} has duplicates: {duplicates}")
+    Args:
+        board: The board to check
 
-    return len(issues) == 0, issues
+    Returns:
+        Set of conflicting cell indices (empty if the board is consistent)
+    """
+    values = board.to_list()
+    duplicates = _duplicate_masks(values)
+
+    conflicts = set()
+    for idx, value in enumerate(values):
+        if value == EMPTY_CELL:
+            continue
+        bit = 1 << (value - 1)
+        for unit in CELL_UNITS[idx]:
+            if duplicates[unit] & bit:
+                conflicts.add(idx)
+                break
+    return conflicts
+
+
+def _duplicate_masks(values: List[int]) -> List[int]:
+    """Get, for each of the 27 units, a digit mask of the values it repeats."""
+    seen = [0] * 27
+    duplicates = [0] * 27
+    for idx, value in enumerate(values):
+        if value == EMPTY_CELL:
+            continue
+        bit = 1 << (value - 1)
+        for unit in CELL_UNITS[idx]:
+            if seen[unit] & bit:
+                duplicates[unit] |= bit
+            else:
+                seen[unit] |= bit
+    return duplicates
+
+
+@dataclass(frozen=True)
+class Solvability:
+    """
+    Whether a board can be completed, with a witness either way.
 
+    Evaluates as True when the board is solvable.
 
-def _find_duplicates_in_row(board: Board, row: int) -> list:
-    """Find duplicate values in a row."""
-    values = []
-    for col in range(9):
-        val = board.get_value(row, col)
-        if val != EMPTY_CELL:
-            if val in values:
-                return [val]
-            values.append(val)
-    return []
-
-
-def _find_duplicates_in_col(board: Board, col: int) -> list:
-    """Find duplicate values in a column."""
-    values = []
-    for row in range(9):
-        val = board.get_value(row, col)
-        if val != EMPTY_CELL:
-            if val in values:
-                return [val]
-            values.append(val)
-    return []
-
-
-def _find_duplicates_in_box(board: Board, box: int) -> list:
-    """Find duplicate values in a box."""
-    from ..board.constants import BOX_INDICES
-
-    values = []
-    for idx in BOX_INDICES[box]:
-        val = board.get_cell_by_index(idx).value
-        if val != EMPTY_CELL:
-            if val in values:
-                return [val]
-            values.append(val)
-    return []
-
-
-def is_solvable(board: Board) -> bool:
+    Attributes:
+        solvable: Whether at least one solution exists
+        solution: A solution as an 81-character string, if solvable
+        contradiction: Why the board cannot be completed, if not
+        undecided: Whether the search limit was reached before an answer
     """
-    Check if a puzzle has at least one solution.
+    solvable: bool
+    solution: Optional[str] = None
+    contradiction: Optional[str] = None
+    undecided: bool = False
+
+    def __bool__(self) -> bool:
+        return self.solvable
+
 
-    Uses a simple backtracking solver.
+def is_solvable(
+    board: Board, max_nodes: Optional[int] = None, deadline: Optional[float] = None
+) -> Solvability:
     """
-    from ..generator.uniqueness import count_solutions
-    from ..board.constants import EMPTY_CELL
+    Check if a puzzle has at least one solution.
 
-    test_board = board.copy()
+    Candidates are propagated first (naked and hidden singles on digit
+    masks), which rejects most impossible boards without any search; a
+    depth-first search on the fewest-candidate cell then stops at the
+    first solution. The board is not modified.
 
-    for idx in range(81):
-        if test_board.get_cell_by_index(idx).is_empty:
-            test_board.set_value(idx // 9, idx % 9, 0, fixed=False)
+    Args:
+        board: The board to check
+        max_nodes: Give up after this many search branches (None for no limit)
+        deadline: Give up once time.time() passes this (None for no limit)
 
-    count = count_solutions(test_board)
-    return count >= 1
+    Returns:
+        A Solvability with the solution or the contradiction found
+    """
+    values = board.to_list()
+    duplicates = _duplicate_masks(values)
+    for unit, mask in enumerate(duplicates):
+        if mask:
+            return Solvability(
+                False, contradiction=f"{UNIT_NAMES[unit]} {unit % 9 + 1} repeats {mask_digits(mask)[0]}"
+            )
+
+    candidates = [0] * 81
+    for idx, value in enumerate(values):
+        if value == EMPTY_CELL:
+            used = 0
+            for peer in PEER_INDICES[idx]:
+                if values[peer]:
+                    used |= 1 << (values[peer] - 1)
+            candidates[idx] = ALL_DIGITS & ~used
+
+    budget = [max_nodes if max_nodes is not None else -1, deadline]
+    try:
+        solution, contradiction = _search(values, candidates, budget)
+    except _SearchLimit as e:
+        reason = str(e) or f"Gave up after {max_nodes} search branches"
+        return Solvability(False, contradiction=reason, undecided=True)
+    if solution is None:
+        return Solvability(False, contradiction=contradiction)
+    return Solvability(True, solution="".join(map(str, solution)))
+
+
+class _SearchLimit(Exception):
+    """Raised when is_solvable runs out of search branches or time."""
+
+
+def _search(
+    values: List[int], candidates: List[int], budget: list
+) -> Tuple[Optional[List[int]], Optional[str]]:
+    """
+    Propagate, then branch on the cell with the fewest candidates.
+
+    budget is [branches left (-1 for no limit), deadline or None].
+    """
+    contradiction = _propagate(values, candidates)
+    if contradiction:
+        return None, contradiction
+
+    empty = [idx for idx in range(81) if values[idx] == EMPTY_CELL]
+    if not empty:
+        return values, None
+
+    idx = min(empty, key=lambda i: candidates[i].bit_count())
+    mask = candidates[idx]
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        if budget[0] == 0:
+            raise _SearchLimit
+        if budget[1] is not None and time.time() > budget[1]:
+            raise _SearchLimit("Gave up at the deadline")
+        budget[0] -= 1
+        branch_values = values[:]
+        branch_candidates = candidates[:]
+        if _assign(branch_values, branch_candidates, idx, bit.bit_length()):
+            continue
+        solution, _ = _search(branch_values, branch_candidates, budget)
+        if solution is not None:
+            return solution, None
+
+    return None, f"Every value for cell ({idx // 9 + 1}, {idx % 9 + 1}) leads to a contradiction"
+
+
+def _assign(values: List[int], candidates: List[int], idx: int, value: int) -> Optional[str]:
+    """Place a value and remove it from the peers' candidates."""
+    values[idx] = value
+    candidates[idx] = 0
+    bit = 1 << (value - 1)
+    for peer in PEER_INDICES[idx]:
+        if values[peer] == EMPTY_CELL and candidates[peer] & bit:
+            candidates[peer] &= ~bit
+            if not candidates[peer]:
+                return f"Cell ({peer // 9 + 1}, {peer % 9 + 1}) has no candidates"
+    return None
+
+
+def _propagate(values: List[int], candidates: List[int]) -> Optional[str]:
+    """Apply naked and hidden singles until nothing changes."""
+    changed = True
+    while changed:
+        changed = False
+
+        for idx in range(81):
+            if values[idx] != EMPTY_CELL:
+                continue
+            mask = candidates[idx]
+            if not mask:
+                return f"Cell ({idx // 9 + 1}, {idx % 9 + 1}) has no candidates"
+            if not mask & (mask - 1):
+                contradiction = _assign(values, candidates, idx, mask.bit_length())
+                if contradiction:
+                    return contradiction
+                changed = True
+
+        for unit, indices in enumerate(UNIT_INDICES):
+            placed = once = twice = 0
+            for idx in indices:
+                if values[idx]:
+                    placed |= 1 << (values[idx] - 1)
+                else:
+                    twice |= once & candidates[idx]
+                    once |= candidates[idx]
+
+            missing = ALL_DIGITS & ~placed
+            singles = missing & ~twice
+            while singles:
+                bit = singles & -singles
+                singles ^= bit
+                target = next(
+                    (idx for idx in indices if not values[idx] and candidates[idx] & bit), None
+                )
+                if target is None:
+                    return f"{UNIT_NAMES[unit]} {unit % 9 + 1} has no place for {bit.bit_length()}"
+                contradiction = _assign(values, candidates, target, bit.bit_length())
+                if contradiction:
+                    return contradiction
+                changed = True
+
+    return None
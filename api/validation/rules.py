@@ -4,6 +4,7 @@ Validation rules for Sudoku.
 
 from ..board.board import Board
 from ..board.constants import EMPTY_CELL, ROW_INDICES, COL_INDICES, BOX_INDICES
+from .consistency import UNIT_NAMES, _duplicate_masks
 
 
 def validate_complete(board: Board) -> bool:
@@ -45,30 +46,17 @@ def validate_partial(board: Board) -> tuple[bool, str]:
     """
     Validate a partial board (during solving).
 
+    Uses the same single pass as find_conflicts, so every bad unit is
+    reported, not just the first.
+
     Returns (is_valid, error_message).
     """
-    for row in range(9):
-        if not _validate_group_partial(board, ROW_INDICES[row], f"Row {row + 1}"):
-            return False, f"Invalid row {row + 1}"
-
-    for col in range(9):
-        if not _validate_group_partial(board, COL_INDICES[col], f"Column {col + 1}"):
-            return False, f"Invalid column {col + 1}"
-
-    for box in range(9):
-        if not _validate_group_partial(board, BOX_INDICES[box], f"Box {box + 1}"):
-            return False, f"Invalid box {box + 1}"
-
+    duplicates = _duplicate_masks(board.to_list())
+    bad_units = [
+        f"{UNIT_NAMES[unit].lower()} {unit % 9 + 1}"
+        for unit, mask in enumerate(duplicates)
+        if mask
+    ]
+    if bad_units:
+        return False, f"Invalid {', '.join(bad_units)}"
     return True, ""
-
-
-def _validate_group_partial(board: Board, indices: list, group_name: str) -> bool:
-    """Validate a group has no duplicate values."""
-    values = set()
-    for idx in indices:
-        val = board.get_cell_by_index(idx).value
-        if val != EMPTY_CELL:
-            if val in values:
-                return False
-            values.add(val)
-    return True
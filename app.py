@@ -7,9 +7,10 @@ Run with: python app.py
 
 from app import create_app
 
-# Create and run the Flask application
-app = create_app()
-
 if __name__ == "__main__":
+    # Created here rather than at import: pool workers started by the
+    # forkserver re-import this module and must not build an app of their own.
+    app = create_app()
+
     # Run development server
     app.run(debug=True, host="127.0.0.1", port=5000)
@@ -7,7 +7,17 @@ import os
 from flask import Flask
 from flask_login import LoginManager
 from dotenv import load_dotenv
-from .models import db, User
+from api.solver.cache import solve_cache
+from api.hints.context import hint_contexts
+from .game_store import game_store
+from .executor import cpu_executor
+from .jobs import job_manager
+from .admission import admission
+from .leaderboard import leaderboard_cache
+from .session_store import ServerSessionInterface, SqliteSessionStore
+from .models import db, Score, UserStats, configure_sqlite
+from .score_writer import ScoreWriter
+from .user_cache import user_cache
 from .routes import main_bp, api_bp, auth_bp
 
 # Load environment variables from .env file
@@ -37,6 +47,101 @@ def create_app(config=None):
     app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+    # Solve cache configuration (entries, seconds)
+    app.config["SOLVE_CACHE_SIZE"] = int(os.environ.get("SOLVE_CACHE_SIZE", 1024))
+    app.config["SOLVE_CACHE_TTL"] = float(os.environ.get("SOLVE_CACHE_TTL", 3600))
+
+    # Per-game hint state (games, seconds since last hint)
+    app.config["HINT_CONTEXT_SIZE"] = int(os.environ.get("HINT_CONTEXT_SIZE", 4096))
+    app.config["HINT_CONTEXT_TTL"] = float(os.environ.get("HINT_CONTEXT_TTL", 7200))
+
+    # Server-held game solutions (games kept in memory, seconds, database
+    # file shared by all worker processes; empty keeps games in memory only)
+    app.config["GAME_STORE_SIZE"] = int(os.environ.get("GAME_STORE_SIZE", 10000))
+    app.config["GAME_STORE_TTL"] = float(os.environ.get("GAME_STORE_TTL", 86400))
+    app.config["GAME_DB_PATH"] = os.environ.get(
+        "GAME_DB_PATH", os.path.join(root_dir, "games.db")
+    )
+
+    # CPU process pool (workers, seconds per task)
+    app.config["CPU_WORKERS"] = int(os.environ.get("CPU_WORKERS", os.cpu_count() or 1))
+    app.config["GENERATE_TIMEOUT"] = float(os.environ.get("GENERATE_TIMEOUT", 60))
+    app.config["SOLVE_TIMEOUT"] = float(os.environ.get("SOLVE_TIMEOUT", 10))
+
+    # Admission control for expensive endpoints (concurrent, queued, seconds
+    # a queued request waits). Validation and hints are never gated.
+    workers = app.config["CPU_WORKERS"]
+    app.config["GENERATE_CONCURRENCY"] = int(os.environ.get("GENERATE_CONCURRENCY", workers))
+    app.config["GENERATE_QUEUE"] = int(os.environ.get("GENERATE_QUEUE", workers))
+    app.config["SOLVE_CONCURRENCY"] = int(os.environ.get("SOLVE_CONCURRENCY", workers))
+    app.config["SOLVE_QUEUE"] = int(os.environ.get("SOLVE_QUEUE", 2 * workers))
+    app.config["ADMISSION_WAIT"] = float(os.environ.get("ADMISSION_WAIT", 2))
+
+    # Background generation job threads (0: one per "generate" slot, so an
+    # admitted job never waits for a thread)
+    app.config["JOB_WORKERS"] = int(os.environ.get("JOB_WORKERS", 0))
+
+    # Server-side sessions (database file, seconds, seconds between sweeps)
+    app.config["SESSION_DB_PATH"] = os.environ.get(
+        "SESSION_DB_PATH", os.path.join(root_dir, "sessions.db")
+    )
+    app.config["PERMANENT_SESSION_LIFETIME"] = int(
+        os.environ.get("SESSION_LIFETIME", 7 * 24 * 3600)
+    )
+    app.config["SESSION_SWEEP_INTERVAL"] = float(os.environ.get("SESSION_SWEEP_INTERVAL", 300))
+
+    # Leaderboard snapshots (entries, seconds)
+    app.config["LEADERBOARD_SIZE"] = int(os.environ.get("LEADERBOARD_SIZE", 50))
+    app.config["LEADERBOARD_TTL"] = float(os.environ.get("LEADERBOARD_TTL", 30))
+
+    # SQLite tuning and batched score writes (seconds a score may wait)
+    app.config["SQLITE_SYNCHRONOUS"] = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")
+    app.config["SQLITE_BUSY_TIMEOUT_MS"] = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    app.config["SCORE_BATCH_SIZE"] = int(os.environ.get("SCORE_BATCH_SIZE", 100))
+    app.config["SCORE_FLUSH_DELAY"] = float(os.environ.get("SCORE_FLUSH_DELAY", 0.5))
+    app.config["SCORE_DURABLE"] = os.environ.get("SCORE_DURABLE", "false").lower() == "true"
+
+    # Logged-in user cache (users, seconds)
+    app.config["USER_CACHE_SIZE"] = int(os.environ.get("USER_CACHE_SIZE", 10000))
+    app.config["USER_CACHE_TTL"] = float(os.environ.get("USER_CACHE_TTL", 300))
+
+    if config:
+        app.config.update(config)
+
+    solve_cache.configure(
+        max_size=app.config["SOLVE_CACHE_SIZE"], ttl=app.config["SOLVE_CACHE_TTL"]
+    )
+    hint_contexts.configure(
+        max_size=app.config["HINT_CONTEXT_SIZE"], ttl=app.config["HINT_CONTEXT_TTL"]
+    )
+    game_store.configure(
+        max_size=app.config["GAME_STORE_SIZE"],
+        ttl=app.config["GAME_STORE_TTL"],
+        path=app.config["GAME_DB_PATH"] or None,
+    )
+    cpu_executor.configure(max_workers=app.config["CPU_WORKERS"])
+    job_manager.configure(
+        max_workers=app.config["JOB_WORKERS"] or app.config["GENERATE_CONCURRENCY"]
+    )
+    for gate in ("generate", "solve"):
+        admission.configure(
+            gate,
+            limit=app.config[f"{gate.upper()}_CONCURRENCY"],
+            queue=app.config[f"{gate.upper()}_QUEUE"],
+            wait=app.config["ADMISSION_WAIT"],
+        )
+
+    user_cache.configure(
+        max_size=app.config["USER_CACHE_SIZE"], ttl=app.config["USER_CACHE_TTL"]
+    )
+    leaderboard_cache.configure(
+        size=app.config["LEADERBOARD_SIZE"], ttl=app.config["LEADERBOARD_TTL"]
+    )
+    app.session_interface = ServerSessionInterface(
+        SqliteSessionStore(app.config["SESSION_DB_PATH"]),
+        sweep_interval=app.config["SESSION_SWEEP_INTERVAL"],
+    )
+
     # Initialize extensions
     db.init_app(app)
 
@@ -47,7 +152,7 @@ def create_app(config=None):
 
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        return user_cache.load(int(user_id))
 
     # Register blueprints
     app.register_blueprint(main_bp)
@@ -56,6 +161,24 @@ def create_app(config=None):
 
     # Create tables
     with app.app_context():
+        configure_sqlite(
+            db.engine,
+            synchronous=app.config["SQLITE_SYNCHRONOUS"],
+            busy_timeout_ms=app.config["SQLITE_BUSY_TIMEOUT_MS"],
+        )
         db.create_all()
+        # create_all() skips existing tables, so add indexes introduced later.
+        for index in Score.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
+        # Fill in totals for scores saved before UserStats existed.
+        if UserStats.query.first() is None and Score.query.first() is not None:
+            UserStats.rebuild()
+            db.session.commit()
+
+    ScoreWriter(
+        app,
+        max_batch=app.config["SCORE_BATCH_SIZE"],
+        max_delay=app.config["SCORE_FLUSH_DELAY"],
+    )
 
     return app
@@ -0,0 +1,139 @@
+"""
+Admission control for expensive endpoints
+Caps how much CPU-bound work runs at once so cheap requests stay fast
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class Overloaded(Exception):
+    """Raised when a gate is full; carries a suggested retry delay"""
+
+    def __init__(self, gate: str, retry_after: int):
+        super().__init__(f"Server is busy with {gate} requests, try again shortly")
+        self.gate = gate
+        self.retry_after = retry_after
+
+
+class Gate:
+    """
+    Bounded-concurrency gate with a short wait queue.
+
+    Up to `limit` callers hold a slot at once and up to `queue` more wait
+    for one, each for at most `wait` seconds. Anyone beyond that, or still
+    waiting when the time is up, is turned away with Overloaded.
+    """
+
+    def __init__(self, name: str, limit: int, queue: int = 0, wait: float = 2.0):
+        self.name = name
+        self._limit = limit
+        self._queue = queue
+        self._wait = wait
+        self._active = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._peak_waiting = 0
+        self._changed = threading.Condition()
+
+    def configure(
+        self,
+        limit: Optional[int] = None,
+        queue: Optional[int] = None,
+        wait: Optional[float] = None,
+    ) -> None:
+        """Change the limits; callers already admitted keep their slots"""
+        with self._changed:
+            if limit is not None:
+                self._limit = max(1, limit)
+            if queue is not None:
+                self._queue = max(0, queue)
+            if wait is not None:
+                self._wait = wait
+            self._changed.notify_all()
+
+    def acquire(self) -> None:
+        """Take a slot, waiting briefly if needed; raises Overloaded"""
+        with self._changed:
+            if self._active >= self._limit:
+                if self._waiting >= self._queue:
+                    self._reject()
+
+                self._waiting += 1
+                self._peak_waiting = max(self._peak_waiting, self._waiting)
+                try:
+                    admitted = self._changed.wait_for(
+                        lambda: self._active < self._limit, timeout=self._wait
+                    )
+                finally:
+                    self._waiting -= 1
+                if not admitted:
+                    self._reject()
+
+            self._active += 1
+            self._admitted += 1
+
+    def release(self) -> None:
+        """Give back a slot taken with acquire()"""
+        with self._changed:
+            self._active -= 1
+            self._changed.notify()
+
+    @contextmanager
+    def slot(self):
+        """Hold a slot for the duration of a with-block"""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> dict:
+        """Get current load and counters"""
+        with self._changed:
+            return {
+                "limit": self._limit,
+                "queue": self._queue,
+                "active": self._active,
+                "waiting": self._waiting,
+                "peak_waiting": self._peak_waiting,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+            }
+
+    def _reject(self) -> None:
+        """Count a rejection and raise; called with the lock held"""
+        self._rejected += 1
+        # Roughly one queue wait per caller ahead, at least a second.
+        retry_after = max(1, round(self._wait * (self._waiting + 1) / self._limit))
+        raise Overloaded(self.name, retry_after)
+
+
+class AdmissionControl:
+    """Named gates, one per class of expensive endpoint"""
+
+    def __init__(self):
+        self._gates: Dict[str, Gate] = {}
+        self._lock = threading.Lock()
+
+    def gate(self, name: str) -> Gate:
+        """Get a gate by name, creating a single-slot one on first use"""
+        with self._lock:
+            if name not in self._gates:
+                self._gates[name] = Gate(name, limit=1)
+            return self._gates[name]
+
+    def configure(self, name: str, limit: int, queue: int = 0, wait: float = 2.0) -> None:
+        """Set the limits of a gate"""
+        self.gate(name).configure(limit=limit, queue=queue, wait=wait)
+
+    def stats(self) -> dict:
+        """Get the stats of every gate"""
+        with self._lock:
+            gates = list(self._gates.values())
+        return {gate.name: gate.stats() for gate in gates}
+
+
+admission = AdmissionControl()
@@ -0,0 +1,172 @@
+"""
+Process pool for CPU-bound API work
+Keeps puzzle search off the request threads so the GIL does not stall them
+"""
+
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+
+class TaskTimeout(Exception):
+    """Raised when a pool task does not finish in time"""
+
+
+class ProgressReporter:
+    """Picklable progress callback that workers use to report back"""
+
+    def __init__(self, shared, key: str):
+        self._shared = shared
+        self._key = key
+
+    def __call__(self, fraction: float) -> None:
+        self._shared[self._key] = fraction
+
+
+class CpuExecutor:
+    """
+    Shared process pool with per-task timeouts.
+
+    Tasks still queued when their timeout passes are cancelled. A task
+    that is already running cannot be interrupted from outside, so tasks
+    are also given a deadline they are expected to check themselves.
+
+    Workers are started by a forkserver rather than forked from the server,
+    which runs many threads: a fork taken while one of them holds a lock
+    would leave that lock held forever in the worker. A pool whose worker
+    died is replaced, and the task that hit it is retried once.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._pool = None
+        self._manager = None
+        self._progress = None
+        self._lock = threading.Lock()
+
+    def configure(self, max_workers: Optional[int] = None) -> None:
+        """Set the pool size; takes effect when the pool is next started"""
+        with self._lock:
+            self._max_workers = max_workers
+
+    def run(
+        self,
+        fn: Callable,
+        *args,
+        timeout: float,
+        progress: Optional[Callable[[float], None]] = None,
+    ):
+        """
+        Run fn(*args, deadline=..., progress=...) in the pool and wait for it.
+
+        Args:
+            fn: Module-level function to run in a worker process
+            args: Picklable arguments
+            timeout: Seconds to wait before giving up
+            progress: Called in this process with the worker's progress
+
+        Returns:
+            The function's return value
+
+        Raises:
+            TaskTimeout: If the task did not finish in time
+        """
+        deadline = time.time() + timeout
+        reporter = None
+        key = None
+        if progress is not None:
+            shared = self._shared_progress()
+            key = uuid.uuid4().hex
+            reporter = ProgressReporter(shared, key)
+
+        try:
+            return self._wait(fn, args, deadline, timeout, key, reporter, progress)
+        except BrokenProcessPool:
+            # The broken pool was already replaced; retry once on the new one.
+            return self._wait(fn, args, deadline, timeout, key, reporter, progress)
+        finally:
+            if key is not None:
+                self._progress.pop(key, None)
+
+    def _wait(self, fn, args, deadline, timeout, key, reporter, progress):
+        """Submit a task and wait for it, relaying progress"""
+        pool = self._get_pool()
+        try:
+            future = pool.submit(fn, *args, deadline=deadline, progress=reporter)
+        except BrokenProcessPool:
+            self._reset_pool(pool)
+            raise
+        try:
+            if reporter is None:
+                return future.result(timeout=max(0.0, deadline - time.time()))
+
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise FutureTimeout()
+                done, _ = wait([future], timeout=min(0.25, remaining))
+                fraction = self._progress.get(key)
+                if fraction is not None:
+                    progress(fraction)
+                if done:
+                    return future.result()
+        except FutureTimeout:
+            future.cancel()
+            raise TaskTimeout(f"Task did not finish within {timeout:g} seconds")
+        except BrokenProcessPool:
+            self._reset_pool(pool)
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the pool, cancelling queued tasks"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+                self._progress = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the pool on first use"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers, mp_context=_pool_context()
+                )
+            return self._pool
+
+    def _reset_pool(self, broken: Optional[ProcessPoolExecutor] = None) -> None:
+        """Drop a broken pool so the next task starts a new one"""
+        with self._lock:
+            if self._pool is not None and (broken is None or self._pool is broken):
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _shared_progress(self):
+        """Start the progress manager on first use"""
+        with self._lock:
+            if self._manager is None:
+                self._manager = _pool_context().Manager()
+                self._progress = self._manager.dict()
+            return self._progress
+
+
+def _pool_context():
+    """Get the safest start method available: forkserver, else spawn"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def check_deadline(deadline: Optional[float], what: str = "Task") -> None:
+    """Raise TaskTimeout in a worker once its deadline has passed"""
+    if deadline is not None and time.time() > deadline:
+        raise TaskTimeout(f"{what} timed out")
+
+
+cpu_executor = CpuExecutor()
@@ -0,0 +1,180 @@
+"""
+Server-side store of running games
+Keeps each game's solution on the server so moves can be checked by id
+"""
+
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Game:
+    """A generated puzzle and its solution"""
+
+    puzzle: str
+    solution: str
+    difficulty: str
+
+    def is_correct(self, index: int, value) -> bool:
+        """Check a single move against the solution"""
+        if not 0 <= index < 81:
+            raise ValueError("Index must be between 0 and 80")
+        return self.solution[index] == str(value)
+
+
+class GameStore:
+    """
+    Thread-safe bounded store of games keyed by game id, with expiry.
+
+    Recent games are kept in memory. With a database path set, every game
+    is also written to SQLite, so games survive restarts and are shared
+    by all worker processes; the memory copy then acts as a cache.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = 86400.0):
+        self._games: "OrderedDict[str, Tuple[float, Game]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._path: Optional[str] = None
+        self._sweep_interval = 300.0
+        self._last_sweep = 0.0
+
+    def configure(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        """Change the size limit, TTL (0 disables expiry) and/or database path"""
+        with self._lock:
+            if max_size is not None:
+                self._max_size = max_size
+            if ttl is not None:
+                self._ttl = ttl if ttl > 0 else None
+            if path is not None:
+                self._path = path
+                with self._connect() as conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS games ("
+                        " id TEXT PRIMARY KEY,"
+                        " puzzle TEXT NOT NULL,"
+                        " solution TEXT NOT NULL,"
+                        " difficulty TEXT NOT NULL,"
+                        " created_at REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS ix_games_created_at ON games (created_at)"
+                    )
+            self._evict()
+
+    def create(self, puzzle: str, solution: str, difficulty: str) -> str:
+        """Store a new game and return its id"""
+        game_id = uuid.uuid4().hex
+        game = Game(puzzle, solution, difficulty)
+        created_at = time.time()
+        if self._path is not None:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO games (id, puzzle, solution, difficulty, created_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (game_id, puzzle, solution, difficulty, created_at),
+                )
+        with self._lock:
+            self._games[game_id] = (created_at, game)
+            self._evict()
+        self._maybe_sweep()
+        return game_id
+
+    def get(self, game_id: str) -> Optional[Game]:
+        """Get a game, or None if it is unknown or expired"""
+        with self._lock:
+            entry = self._games.get(game_id)
+        if entry is None:
+            entry = self._load(game_id)
+            if entry is None:
+                return None
+
+        created_at, game = entry
+        if self._ttl is not None and time.time() - created_at > self._ttl:
+            self.discard(game_id)
+            return None
+        with self._lock:
+            loaded = game_id not in self._games
+            self._games[game_id] = entry
+            self._games.move_to_end(game_id)
+            if loaded:
+                self._evict()
+        return game
+
+    def check_moves(self, game_id: str, moves: Iterable[Tuple[int, object]]) -> Optional[List[bool]]:
+        """Check (index, value) moves, or return None if the game is unknown"""
+        game = self.get(game_id)
+        if game is None:
+            return None
+        return [game.is_correct(index, value) for index, value in moves]
+
+    def discard(self, game_id: str) -> None:
+        """Forget a finished game"""
+        with self._lock:
+            self._games.pop(game_id, None)
+        if self._path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM games WHERE id = ?", (game_id,))
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def _load(self, game_id: str) -> Optional[Tuple[float, Game]]:
+        """Read a game another process (or an earlier run) stored"""
+        if self._path is None:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT created_at, puzzle, solution, difficulty FROM games WHERE id = ?",
+                (game_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], Game(*row[1:])
+
+    def _evict(self) -> None:
+        """Drop expired games, then the least recently used ones beyond the limit"""
+        if self._ttl is not None:
+            # Games move to the end when used, so expired ones can be anywhere.
+            cutoff = time.time() - self._ttl
+            for game_id in [g for g, (created_at, _) in self._games.items() if created_at < cutoff]:
+                del self._games[game_id]
+        while len(self._games) > self._max_size:
+            self._games.popitem(last=False)
+
+    def _maybe_sweep(self) -> None:
+        """Delete expired games from the database every few minutes"""
+        if self._path is None or self._ttl is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep < self._sweep_interval:
+                return
+            self._last_sweep = now
+        with self._connect() as conn:
+            conn.execute("DELETE FROM games WHERE created_at < ?", (time.time() - self._ttl,))
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection for one transaction"""
+        conn = sqlite3.connect(self._path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+game_store = GameStore()
@@ -0,0 +1,132 @@
+"""
+Background jobs for slow API work
+Runs work off the request thread and tracks its progress by job id
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class Job:
+    """State of one background job"""
+
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.version = 0
+        self.updated_at = time.monotonic()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job is done or failed"""
+        return self.status in ("done", "failed")
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization"""
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": round(self.progress, 3),
+        }
+        if self.status == "done":
+            data["result"] = self.result
+        elif self.status == "failed":
+            data["error"] = self.error
+        return data
+
+
+class JobManager:
+    """Runs jobs on a small thread pool and keeps recent ones for polling"""
+
+    def __init__(self, max_workers: int = 2, max_jobs: int = 1000, ttl: float = 600.0):
+        self._executor = None
+        self._max_workers = max_workers
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._changed = threading.Condition()
+        self._max_jobs = max_jobs
+        self._ttl = ttl
+
+    def configure(self, max_workers: Optional[int] = None, max_jobs: Optional[int] = None) -> None:
+        """Change the worker count and/or job limit; running jobs finish on their old threads"""
+        with self._changed:
+            if max_jobs is not None:
+                self._max_jobs = max_jobs
+            if max_workers is not None and max_workers != self._max_workers:
+                self._max_workers = max(1, max_workers)
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+
+    def submit(self, kind: str, fn: Callable, *args) -> Job:
+        """
+        Start a job.
+
+        fn is called as fn(*args, progress=callback) and its return value
+        becomes the job result.
+        """
+        job = Job(kind)
+        with self._changed:
+            self._jobs[job.id] = job
+            self._evict()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="job"
+                )
+            executor = self._executor
+        executor.submit(self._run, job, fn, args)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job, or None if it is unknown or expired"""
+        with self._changed:
+            return self._jobs.get(job_id)
+
+    def wait(self, job: Job, version: int, timeout: float) -> bool:
+        """Wait until the job changes past a version; False on timeout"""
+        with self._changed:
+            return self._changed.wait_for(lambda: job.version != version, timeout=timeout)
+
+    def _run(self, job: Job, fn: Callable, args: tuple) -> None:
+        """Run a job and record its outcome"""
+        self._update(job, status="running")
+
+        def progress(fraction: float) -> None:
+            # Only publish visible changes, so waiters are not woken per cell.
+            if fraction - job.progress >= 0.01:
+                self._update(job, progress=fraction)
+
+        try:
+            result = fn(*args, progress=progress)
+        except Exception as e:
+            self._update(job, status="failed", error=str(e))
+        else:
+            self._update(job, status="done", progress=1.0, result=result)
+
+    def _update(self, job: Job, **changes) -> None:
+        """Apply changes to a job and wake anyone waiting on it"""
+        with self._changed:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+            job.updated_at = time.monotonic()
+            self._changed.notify_all()
+
+    def _evict(self) -> None:
+        """Drop finished jobs that expired, then the oldest beyond the limit"""
+        cutoff = time.monotonic() - self._ttl
+        for job_id in [j.id for j in self._jobs.values() if j.finished and j.updated_at < cutoff]:
+            del self._jobs[job_id]
+        while len(self._jobs) > self._max_jobs:
+            self._jobs.popitem(last=False)
+
+
+job_manager = JobManager()
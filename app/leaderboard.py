@@ -0,0 +1,151 @@
+"""
+Per-difficulty leaderboards
+Top scores come from the (difficulty, score) index and are kept as short-lived
+in-memory snapshots; ranks come from indexed count queries
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.models import db, Score, User
+
+PERIODS = ("all", "week")
+DIFFICULTIES = ("easy", "medium", "expert", "master", "extreme")
+
+
+def period_start(period: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """Get the earliest completion time a period covers (None for all time)"""
+    if period == "all":
+        return None
+    if period == "week":
+        now = now or datetime.utcnow()
+        monday = now - timedelta(days=now.weekday())
+        return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown period: {period}")
+
+
+def _filtered(query, difficulty: str, since: Optional[datetime]):
+    """Restrict a score query to a difficulty and period"""
+    query = query.filter(Score.difficulty == difficulty)
+    if since is not None:
+        query = query.filter(Score.completed_at >= since)
+    return query
+
+
+def top_scores(difficulty: str, period: str, limit: int) -> List[dict]:
+    """Query the best games of a difficulty, walking the score index from the top"""
+    since = period_start(period)
+    rows = (
+        _filtered(
+            db.session.query(
+                Score.user_id,
+                Score.score,
+                Score.time_seconds,
+                Score.completed_at,
+                User.nickname,
+                User.name,
+            ).join(User, User.id == Score.user_id),
+            difficulty,
+            since,
+        )
+        .order_by(Score.score.desc(), Score.completed_at.asc())
+        .limit(limit)
+        .all()
+    )
+    return [
+        {
+            "rank": position,
+            "user_id": user_id,
+            "player": nickname or name,
+            "score": score,
+            "time_seconds": time_seconds,
+            "completed_at": completed_at.isoformat() if completed_at else None,
+        }
+        for position, (user_id, score, time_seconds, completed_at, nickname, name)
+        in enumerate(rows, start=1)
+    ]
+
+
+def user_rank(user_id: int, difficulty: str, period: str) -> Optional[dict]:
+    """
+    Rank a user's best game among all games of a difficulty.
+
+    Both queries are index range scans: the best score reads the user's
+    (user_id, difficulty, completed_at) entries and the rank counts the
+    (difficulty, score) entries above it.
+    """
+    since = period_start(period)
+    best = (
+        _filtered(db.session.query(db.func.max(Score.score)), difficulty, since)
+        .filter(Score.user_id == user_id)
+        .scalar()
+    )
+    if best is None:
+        return None
+
+    better = (
+        _filtered(db.session.query(db.func.count(Score.id)), difficulty, since)
+        .filter(Score.score > best)
+        .scalar()
+    )
+    return {"rank": better + 1, "score": best}
+
+
+class LeaderboardCache:
+    """Top-N snapshots per (difficulty, period), refreshed after a short TTL"""
+
+    def __init__(self, size: int = 50, ttl: float = 30.0):
+        self._snapshots: Dict[Tuple[str, str], Tuple[float, Optional[datetime], List[dict]]] = {}
+        self._lock = threading.Lock()
+        self._size = size
+        self._ttl = ttl
+
+    def configure(self, size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """Change the snapshot size and/or TTL, dropping current snapshots"""
+        with self._lock:
+            if size is not None:
+                self._size = size
+            if ttl is not None:
+                self._ttl = ttl
+            self._snapshots.clear()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, difficulty: str, period: str) -> List[dict]:
+        """Get the top scores, querying only when the snapshot is stale"""
+        key = (difficulty, period)
+        since = period_start(period)
+        with self._lock:
+            entry = self._snapshots.get(key)
+        if entry is not None:
+            fetched_at, snapshot_since, entries = entry
+            if time.monotonic() - fetched_at <= self._ttl and snapshot_since == since:
+                return entries
+
+        entries = top_scores(difficulty, period, self._size)
+        with self._lock:
+            self._snapshots[key] = (time.monotonic(), since, entries)
+        return entries
+
+    def record(self, difficulty: str, score: int) -> None:
+        """Drop snapshots a newly saved score would appear in"""
+        with self._lock:
+            for period in PERIODS:
+                entry = self._snapshots.get((difficulty, period))
+                if entry is None:
+                    continue
+                entries = entry[2]
+                if len(entries) < self._size or score > entries[-1]["score"]:
+                    del self._snapshots[(difficulty, period)]
+
+    def clear(self) -> None:
+        """Drop every snapshot"""
+        with self._lock:
+            self._snapshots.clear()
+
+
+leaderboard_cache = LeaderboardCache()
@@ -4,11 +4,35 @@ Database models for Sudoku Flask app
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
+from sqlalchemy import event, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime
 
 db = SQLAlchemy()
 
 
+def configure_sqlite(engine, synchronous: str = "NORMAL", busy_timeout_ms: int = 5000):
+    """
+    Tune every new SQLite connection of an engine.
+
+    WAL lets readers carry on while a write is committing, and in WAL mode
+    synchronous=NORMAL only syncs at checkpoints, so a commit costs no
+    fsync. busy_timeout makes a writer wait for the lock instead of
+    failing at once.
+    """
+    synchronous = synchronous.upper()
+    if synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+        raise ValueError(f"Unknown SQLite synchronous level: {synchronous}")
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        cursor.close()
+
+
 class User(UserMixin, db.Model):
     """User model for storing user information"""
 
@@ -27,6 +51,9 @@ class User(UserMixin, db.Model):
     scores = db.relationship(
         "Score", backref="user", lazy=True, cascade="all, delete-orphan"
     )
+    stats = db.relationship(
+        "UserStats", backref="user", lazy=True, cascade="all, delete-orphan"
+    )
 
     def __repr__(self):
         return f"<User {self.email}>"
@@ -39,6 +66,13 @@ class User(UserMixin, db.Model):
 class Score(db.Model):
     """Score model for storing game results"""
 
+    __table_args__ = (
+        # Per-difficulty stats and filtered history for one user
+        db.Index("ix_score_user_difficulty_completed", "user_id", "difficulty", "completed_at"),
+        # Newest-first history for one user
+        db.Index("ix_score_user_completed", "user_id", "completed_at"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(
         db.Integer, db.ForeignKey("user.id"), nullable=False, index=True
@@ -66,3 +100,107 @@ class Score(db.Model):
                 self.completed_at.isoformat() if self.completed_at else None
             ),
         }
+
+
+# Leaderboards: top scores of a difficulty, newest ties last. The trailing
+# columns make it covering for the leaderboard query.
+db.Index(
+    "ix_score_difficulty_score",
+    Score.difficulty,
+    Score.score.desc(),
+    Score.completed_at,
+    Score.user_id,
+    Score.time_seconds,
+)
+
+
+class UserStats(db.Model):
+    """Running totals of one user's games at one difficulty"""
+
+    __tablename__ = "user_stats"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    difficulty = db.Column(db.String(20), primary_key=True)
+    games = db.Column(db.Integer, nullable=False, default=0)
+    total_score = db.Column(db.Integer, nullable=False, default=0)
+    best_score = db.Column(db.Integer, nullable=False, default=0)
+    best_time = db.Column(db.Integer, nullable=True)  # Fastest time in seconds
+    last_played_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<UserStats user={self.user_id} difficulty={self.difficulty} games={self.games}>"
+
+    @classmethod
+    def record(cls, score):
+        """
+        Add a score to its user's totals
+
+        Runs as one upsert in the caller's transaction, so committing the
+        score commits the totals with it, and concurrent saves cannot lose
+        an update.
+        """
+        stmt = sqlite_insert(cls).values(
+            user_id=score.user_id,
+            difficulty=score.difficulty,
+            games=1,
+            total_score=score.score,
+            best_score=score.score,
+            best_time=score.time_seconds,
+            last_played_at=score.completed_at,
+        )
+        new = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.user_id, cls.difficulty],
+            set_={
+                "games": cls.games + 1,
+                "total_score": cls.total_score + new.total_score,
+                "best_score": func.max(cls.best_score, new.best_score),
+                "best_time": func.min(func.coalesce(cls.best_time, new.best_time), new.best_time),
+                "last_played_at": func.max(
+                    func.coalesce(cls.last_played_at, new.last_played_at), new.last_played_at
+                ),
+            },
+        )
+        db.session.execute(stmt)
+
+    @classmethod
+    def rebuild(cls):
+        """Recompute every user's totals from the score table"""
+        db.session.query(cls).delete()
+        rows = (
+            db.session.query(
+                Score.user_id,
+                Score.difficulty,
+                func.count(Score.id),
+                func.sum(Score.score),
+                func.max(Score.score),
+                func.min(Score.time_seconds),
+                func.max(Score.completed_at),
+            )
+            .group_by(Score.user_id, Score.difficulty)
+            .all()
+        )
+        for user_id, difficulty, games, total, best, best_time, last_played in rows:
+            db.session.add(
+                cls(
+                    user_id=user_id,
+                    difficulty=difficulty,
+                    games=games,
+                    total_score=total,
+                    best_score=best,
+                    best_time=best_time,
+                    last_played_at=last_played,
+                )
+            )
+
+    def to_dict(self):
+        """Convert stats to dictionary"""
+        return {
+            "count": self.games,
+            "highest": self.best_score,
+            "average": round(self.total_score / self.games, 2) if self.games else 0,
+            "best_time": self.best_time,
+            "last_played_at": (
+                self.last_played_at.isoformat() if self.last_played_at else None
+            ),
+        }
@@ -3,67 +3,277 @@ API routes for Sudoku game
 Handles puzzle generation, solving, validation, and scoring
 """
 
-from flask import Blueprint, jsonify, request, session
+import functools
+import json
+import time
+
+from flask import Blueprint, Response, current_app, jsonify, request, session
 
 from api.generator.puzzle_generator import PuzzleGenerator
 from api.solver.solver import SudokuSolver
+from api.solver.cache import solve_cache
 from api.hints.hint_engine import HintEngine
+from api.hints.context import hint_contexts
+from api.difficulty.analyzer import DifficultyAnalyzer
 from api.board.board import Board
-from api.board.constants import EMPTY_CELL
 from api.validation.rules import validate_complete
+from api.validation.consistency import find_conflicts, is_solvable
+from api.utils.singleflight import SingleFlight
+from app.game_store import game_store
+from app.jobs import job_manager
+from app.executor import cpu_executor, check_deadline, TaskTimeout
+from app.admission import admission, Overloaded
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
+# Shared by all requests; none of these keep per-request state.
 _generator = PuzzleGenerator()
 _solver = SudokuSolver()
 _hint_engine = HintEngine()
+_analyzer = DifficultyAnalyzer()
+
+# Identical boards posted to /api/solve at once share one pool task.
+_solve_flights = SingleFlight()
+
+# Search branches allowed when checking a submitted board can be solved.
+SOLVABLE_MAX_NODES = 10000
+
+# Seconds between keep-alive comments on a job event stream.
+EVENTS_KEEPALIVE = 15.0
+
+# Guest scores kept in the session, oldest dropped first, and the order of
+# the fields in each stored row.
+MAX_SESSION_SCORES = 50
+SCORE_FIELDS = ("difficulty", "time", "mistakes", "score", "timestamp")
 
 
 def _board_to_string(board: Board) -> str:
     """Convert board to string representation."""
-    result = []
-    for i in range(81):
-        val = board.get_cell_by_index(i).value
-        result.append(str(val) if val != EMPTY_CELL else ".")
-    return "".join(result)
+    return board.to_string()
 
 
 def _string_to_board(board_str: str) -> Board:
     """Convert string to board."""
-    values = []
-    for char in board_str:
-        if char == ".":
-            values.append(EMPTY_CELL)
-        else:
-            values.append(int(char))
-    return Board(values)
+    return Board.from_string(board_str)
+
+
+# -------------------------------------------
+# Worker tasks
+# These run in the CPU process pool, so they take and return plain data.
+# -------------------------------------------
+
+
+def _generate_task(difficulty: str, deadline=None, progress=None) -> dict:
+    """Generate, solve and rate a puzzle (runs in a worker process)"""
+
+    def on_progress(fraction: float) -> None:
+        check_deadline(deadline, "Puzzle generation")
+        if progress is not None:
+            progress(fraction)
+
+    puzzle_board = _generator.generate(difficulty, progress=on_progress)
+
+    # One solve gives both the solution and the hint path.
+    result = _call_with_deadline(_solver.get_result, puzzle_board, deadline=deadline)
+    solution_str = result.solution
+    if not result.solved:
+        solution_str = is_solvable(puzzle_board, deadline=deadline).solution
+        check_deadline(deadline, "Puzzle generation")
+
+    return {
+        "puzzle": _board_to_string(puzzle_board),
+        "solution": solution_str,
+        "steps": result.steps,
+        "rating": _analyzer.rate(puzzle_board).to_dict(),
+        "cache": _cache_entry(result.key),
+    }
+
+
+def _solve_task(board_str: str, deadline=None, progress=None) -> dict:
+    """Check and solve a submitted board (runs in a worker process)"""
+    board = _string_to_board(board_str)
+    solvable = is_solvable(board, max_nodes=SOLVABLE_MAX_NODES, deadline=deadline)
+    check_deadline(deadline, "Solving")
+    if not solvable:
+        return {"solution": None, "error": solvable.contradiction, "cache": None}
+
+    result = _call_with_deadline(_solver.solve_result, board.copy(), deadline=deadline)
+    solution_str = result.solution if result.solved else solvable.solution
+    return {"solution": solution_str, "error": None, "cache": _cache_entry(result.key)}
+
+
+def _call_with_deadline(fn, *args, deadline=None):
+    """Call a solver method, reporting a passed deadline as TaskTimeout"""
+    try:
+        return fn(*args, deadline=deadline)
+    except TimeoutError as e:
+        raise TaskTimeout(str(e)) from e
+
+
+def _cache_entry(key):
+    """Get a worker's cached solve so the parent process can store it too"""
+    if key is None:
+        return None
+    result = solve_cache.get(key)
+    return None if result is None else (key, result)
+
+
+def _keep_in_cache(task: dict) -> None:
+    """Store a worker's solve in this process's cache"""
+    if task.get("cache"):
+        solve_cache.put(*task["cache"])
+
+
+def _new_game(difficulty: str, timeout: float, progress=None) -> dict:
+    """Generate a puzzle in the pool and register it as a new game"""
+    task = cpu_executor.run(_generate_task, difficulty, timeout=timeout, progress=progress)
+    _keep_in_cache(task)
+    puzzle_str = task["puzzle"]
+    solution_str = task["solution"]
+
+    # The solution stays on the server; moves are checked by game id.
+    game_id = game_store.create(puzzle_str, solution_str, difficulty)
+    hint_contexts.start(game_id, puzzle_str, solution_str, task["steps"])
+
+    return {
+        "game_id": game_id,
+        "puzzle": puzzle_str,
+        "difficulty": difficulty,
+        "rating": task["rating"],
+    }
+
+
+def _admit(gate: str):
+    """Run a view only once the named admission gate lets it in"""
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            with admission.gate(gate).slot():
+                return view(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _release_after(gate: str, fn):
+    """Wrap a job function so it gives back its gate slot when done"""
+
+    def run(*args, progress=None):
+        try:
+            return fn(*args, progress=progress)
+        finally:
+            admission.gate(gate).release()
+
+    return run
+
+
+@api_bp.errorhandler(Overloaded)
+def handle_overloaded(e):
+    """Shed load with a fast 503 the client can retry"""
+    response = jsonify({"success": False, "error": str(e), "retry_after": e.retry_after})
+    response.status_code = 503
+    response.headers["Retry-After"] = str(e.retry_after)
+    return response
+
+
+@api_bp.route("/admission", methods=["GET"])
+def admission_stats():
+    """Report load, queue depth and rejections for each admission gate"""
+    return jsonify({"success": True, "gates": admission.stats()})
+
+
+def _start_session(game: dict) -> None:
+    """Make a new game the current one for this session"""
+    session["game_id"] = game["game_id"]
+    session["puzzle"] = game["puzzle"]
+    session["difficulty"] = game["difficulty"]
 
 
 @api_bp.route("/generate", methods=["POST"])
+@_admit("generate")
 def generate_puzzle():
     """Generate a new Sudoku puzzle based on difficulty"""
     data = request.get_json() or {}
     difficulty = data.get("difficulty", "easy")
 
     try:
-        puzzle_board = _generator.generate(difficulty)
-        
-        puzzle_str = _board_to_string(puzzle_board)
-        
-        solution_board = puzzle_board.copy()
-        _solver.solve(solution_board, collect_steps=False)
-        solution_str = _board_to_string(solution_board)
-
-        session["puzzle"] = puzzle_str
-        session["solution"] = solution_str
-        session["difficulty"] = difficulty
-
-        return jsonify({"success": True, "puzzle": puzzle_str, "difficulty": difficulty})
+        game = _new_game(difficulty, current_app.config["GENERATE_TIMEOUT"])
+        _start_session(game)
+        return jsonify({"success": True, **game})
+    except TaskTimeout as e:
+        return jsonify({"success": False, "error": str(e)}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
 
+@api_bp.route("/generate/jobs", methods=["POST"])
+def start_generate_job():
+    """Start generating a puzzle in the background and return the job id"""
+    data = request.get_json() or {}
+    difficulty = data.get("difficulty", "easy")
+
+    # The slot is taken now, so a full server says so before queueing a job.
+    admission.gate("generate").acquire()
+    try:
+        job = job_manager.submit(
+            "generate",
+            _release_after("generate", _new_game),
+            difficulty,
+            current_app.config["GENERATE_TIMEOUT"],
+        )
+    except Exception:
+        admission.gate("generate").release()
+        raise
+    return jsonify({
+        "success": True,
+        "job_id": job.id,
+        "status_url": f"/api/generate/jobs/{job.id}",
+        "events_url": f"/api/generate/jobs/{job.id}/events",
+    }), 202
+
+
+@api_bp.route("/generate/jobs/<job_id>", methods=["GET"])
+def get_generate_job(job_id):
+    """Poll a generation job; a finished job becomes the session's game"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Unknown or expired job"}), 404
+
+    # Only the first poll that sees the job done changes the session.
+    if job.status == "done" and session.get("game_id") != job.result["game_id"]:
+        _start_session(job.result)
+    return jsonify({"success": True, **job.to_dict()})
+
+
+@api_bp.route("/generate/jobs/<job_id>/events", methods=["GET"])
+def stream_generate_job(job_id):
+    """Stream a generation job's progress as Server-Sent Events"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Unknown or expired job"}), 404
+
+    def events():
+        version = -1
+        while True:
+            if job.version != version:
+                version = job.version
+                yield f"event: {job.status}\ndata: {json.dumps(job.to_dict())}\n\n"
+                if job.finished:
+                    return
+            elif not job_manager.wait(job, version, EVENTS_KEEPALIVE):
+                yield ": keep-alive\n\n"
+
+    return Response(
+        events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @api_bp.route("/solve", methods=["POST"])
+@_admit("solve")
 def solve_puzzle():
     """Solve a given Sudoku puzzle"""
     data = request.get_json()
@@ -71,28 +281,67 @@ def solve_puzzle():
 
     try:
         board = _string_to_board(board_str)
-        solved = board.copy()
-        _solver.solve(solved, collect_steps=False)
-        solution_str = _board_to_string(solved)
-        return jsonify({"success": True, "solution": solution_str})
+        timeout = current_app.config["SOLVE_TIMEOUT"]
+        # A puzzle solved before (here or as a generated game) skips the pool.
+        cached = _solver.cached_result(board, deadline=time.time() + timeout)
+        if cached is not None and cached.solved:
+            return jsonify({"success": True, "solution": cached.solution})
+
+        board_str = _board_to_string(board)
+        task, shared = _solve_flights.do(
+            board_str, lambda: cpu_executor.run(_solve_task, board_str, timeout=timeout)
+        )
+        if not shared:
+            _keep_in_cache(task)
+        if task["error"]:
+            return jsonify({"success": False, "error": task["error"]}), 400
+        return jsonify({"success": True, "solution": task["solution"]})
+    except TaskTimeout as e:
+        return jsonify({"success": False, "error": str(e)}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
 
 @api_bp.route("/validate", methods=["POST"])
 def validate_move():
-    """Validate if a move is correct"""
-    data = request.get_json()
+    """
+    Validate moves against the game's server-held solution.
+
+    Expected JSON, one move or a batch:
+    {"game_id": "...", "index": <0-80>, "value": <1-9>}
+    {"game_id": "...", "moves": [{"index": <0-80>, "value": <1-9>}, ...]}
+
+    The game id may be omitted to use the one from the session.
+    """
+    data = request.get_json() or {}
+    game_id = data.get("game_id") or session.get("game_id")
+
+    try:
+        if "moves" in data:
+            moves = [(int(move["index"]), move["value"]) for move in data["moves"]]
+        else:
+            moves = [(int(data.get("index", -1)), data.get("value", ""))]
+
+        results = game_store.check_moves(game_id, moves) if game_id else None
+        if results is None:
+            return jsonify({"success": False, "error": "Unknown or expired game"}), 404
+
+        if "moves" in data:
+            return jsonify({"success": True, "results": results})
+        return jsonify({"success": True, "correct": results[0]})
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@api_bp.route("/check", methods=["POST"])
+def check_board():
+    """Find every cell that conflicts with another in its row, column, or box"""
+    data = request.get_json() or {}
     board_str = data.get("board", "")
-    index = data.get("index", -1)
-    value = data.get("value", "")
-    solution = data.get("solution", "")
 
     try:
-        if 0 <= index < 81 and solution and index < len(solution):
-            is_correct = solution[index] == value
-            return jsonify({"success": True, "correct": is_correct})
-        return jsonify({"success": False, "error": "Invalid index or solution"}), 400
+        conflicts = sorted(find_conflicts(_string_to_board(board_str)))
+        return jsonify({"success": True, "valid": not conflicts, "conflicts": conflicts})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -102,31 +351,28 @@ def get_hint():
     """Get a hint for the current board"""
     data = request.get_json()
     board_str = data.get("board", "")
-    solution_str = data.get("solution", "")
+    lang = data.get("lang", "en")
 
     try:
-        if not solution_str or not board_str:
-            return (
-                jsonify({"success": False, "error": "Missing board or solution"}),
-                400,
-            )
-
-        board = _string_to_board(board_str)
-        
-        _hint_engine.reset()
-        step = _hint_engine.get_next_hint(board)
-        
-        if step and step.value is not None:
-            index = step.cell_index
-            value = str(step.value)
-            return jsonify({
-                "success": True, 
-                "index": index, 
-                "value": value,
-                "explanation": step.explanation
-            })
-
-        return jsonify({"success": False, "error": "No hints available"}), 400
+        if not board_str:
+            return jsonify({"success": False, "error": "Missing board"}), 400
+
+        # Contexts are only kept for games this server started, so made-up
+        # ids cannot fill the store; other boards get a stateless hint.
+        game_id = data.get("game_id") or session.get("game_id")
+        if game_id and game_store.get(game_id) is not None:
+            context = hint_contexts.get(game_id, board_str)
+            step, eliminations = context.next_placement(board_str)
+        else:
+            step, eliminations = _hint_engine.get_next_placement(_string_to_board(board_str))
+
+        return jsonify({
+            "success": True,
+            "index": step.cell_index,
+            "value": str(step.value),
+            "explanation": step.explain(lang),
+            "eliminations": [s.to_dict(lang) for s in eliminations],
+        })
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -134,7 +380,7 @@ def get_hint():
 @api_bp.route("/score", methods=["POST"])
 def save_score():
     """
-    Save game score to session.
+    Save game score to the server-side session.
 
     Expected JSON:
     {
@@ -147,9 +393,6 @@ def save_score():
     data = request.get_json() or {}
 
     try:
-        if "scores" not in session:
-            session["scores"] = []
-
         score_entry = {
             "difficulty": data.get("difficulty", "unknown"),
             "time": data.get("time", 0),
@@ -158,16 +401,28 @@ def save_score():
             "timestamp": data.get("timestamp", ""),
         }
 
-        session["scores"].append(score_entry)
-        session.modified = True
+        # Rows are stored as compact lists and only the latest are kept;
+        # totals cover every game so the stats survive the cap.
+        recent = session.get("scores", [])
+        recent.append([score_entry[field] for field in SCORE_FIELDS])
+        session["scores"] = recent[-MAX_SESSION_SCORES:]
+
+        games, total, highest = session.get("score_totals", [0, 0, 0])
+        games += 1
+        total += score_entry["score"]
+        highest = score_entry["score"] if games == 1 else max(highest, score_entry["score"])
+        session["score_totals"] = [games, total, highest]
+
+        if session.get("game_id"):
+            hint_contexts.discard(session["game_id"])
+            game_store.discard(session["game_id"])
 
-        scores_list = [s["score"] for s in session["scores"]]
         stats = {
             "current_score": score_entry["score"],
-            "total_games": len(session["scores"]),
-            "highest_score": max(scores_list) if scores_list else 0,
-            "average_score": sum(scores_list) / len(scores_list) if scores_list else 0,
-            "all_scores": session["scores"],
+            "total_games": games,
+            "highest_score": highest,
+            "average_score": total / games,
+            "recent_scores": [dict(zip(SCORE_FIELDS, row)) for row in session["scores"]],
         }
 
         return jsonify({"success": True, "stats": stats})
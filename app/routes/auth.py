@@ -10,6 +10,7 @@ from flask_login import login_user, logout_user, current_user
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.service_account import Credentials
 from app.models import User, db
+from app.user_cache import user_cache
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
@@ -135,8 +136,11 @@ def callback():
         )
         db.session.add(user)
         db.session.commit()
+        user_cache.invalidate(user.id)
 
-    # Log the user in
+    # Log the user in under a new session id, so an id planted before
+    # login (session fixation) is not the one that ends up signed in
+    session.regenerate()
     login_user(user)
 
     return redirect(url_for("main.index"))
@@ -3,12 +3,24 @@ Main page routes for Sudoku game
 Handles rendering HTML templates
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+import base64
+import binascii
+from datetime import datetime
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
-from app.models import User, db, Score
+from sqlalchemy import and_, or_
+from app.models import User, db, Score, UserStats
+from app.leaderboard import leaderboard_cache, user_rank, DIFFICULTIES, PERIODS
+from app.score_writer import score_writer
+from app.user_cache import user_cache
 
 main_bp = Blueprint("main", __name__)
 
+# Score history page sizes
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
 
 @main_bp.route("/")
 def index():
@@ -47,7 +59,10 @@ def result():
 @login_required
 def profile():
     """Serve the user profile page"""
-    return render_template("profile.html", user=current_user)
+    score_writer.wait_for(current_user.id)
+    return render_template(
+        "profile.html", user=current_user, statistics=_score_statistics(current_user.id)
+    )
 
 
 @main_bp.route("/api/profile/update-nickname", methods=["POST"])
@@ -66,6 +81,7 @@ def update_nickname():
     try:
         current_user.nickname = nickname
         db.session.commit()
+        user_cache.invalidate(current_user.id)
         return jsonify({"success": True, "message": "Nickname updated successfully"})
     except Exception as e:
         db.session.rollback()
@@ -76,7 +92,7 @@ def update_nickname():
 def save_score():
     """
     Save game score (works with or without authentication).
-    For authenticated users, saves to database.
+    For authenticated users, queues it for the database.
     For guests, saves only to session.
 
     Expected JSON:
@@ -84,7 +100,8 @@ def save_score():
         "difficulty": "easy|medium|expert|master|extreme",
         "time": <seconds>,
         "mistakes": <number>,
-        "score": <calculated score>
+        "score": <calculated score>,
+        "durable": <optional, wait until the score is committed>
     }
     """
     data = request.get_json() or {}
@@ -103,21 +120,22 @@ def save_score():
             "mistakes": mistakes,
         }
 
-        # If user is authenticated, save to database
+        # If user is authenticated, queue it for the database
         if current_user.is_authenticated:
+            score_record = Score(
+                user_id=current_user.id,
+                difficulty=difficulty,
+                score=score,
+                time_seconds=time_seconds,
+                mistakes=mistakes,
+                completed_at=datetime.utcnow(),
+            )
+            durable = bool(data.get("durable", current_app.config["SCORE_DURABLE"]))
             try:
-                score_record = Score(
-                    user_id=current_user.id,
-                    difficulty=difficulty,
-                    score=score,
-                    time_seconds=time_seconds,
-                    mistakes=mistakes,
-                )
-                db.session.add(score_record)
-                db.session.commit()
-                result["saved_to_db"] = True
+                # Written in batches; a durable save waits for its batch.
+                result["saved_to_db"] = score_writer.submit(score_record, durable=durable)
+                result["queued"] = True
             except Exception as db_error:
-                db.session.rollback()
                 result["saved_to_db"] = False
                 result["db_error"] = str(db_error)
 
@@ -130,8 +148,13 @@ def save_score():
 def get_scores():
     """
     Get user scores.
-    If authenticated, returns scores from database with statistics.
+    If authenticated, returns a page of scores from the database with statistics.
     Otherwise returns empty list.
+
+    Query parameters:
+        limit: Scores per page (default 20, at most 100)
+        cursor: next_cursor from the previous page
+        difficulty: Only list scores of this difficulty
     """
     try:
         if not current_user.is_authenticated:
@@ -139,55 +162,129 @@ def get_scores():
                 {
                     "success": True,
                     "scores": [],
-                    "statistics": {
-                        "total_games": 0,
-                        "highest_score": 0,
-                        "average_score": 0,
-                    },
+                    "next_cursor": None,
+                    "statistics": _empty_statistics(),
                 }
             )
 
-        # Get scores from database
-        scores = (
-            Score.query.filter_by(user_id=current_user.id)
-            .order_by(Score.completed_at.desc())
-            .all()
-        )
-        scores_data = [s.to_dict() for s in scores]
-
-        # Calculate statistics
-        if scores_data:
-            score_values = [s["score"] for s in scores_data]
-            statistics = {
-                "total_games": len(scores_data),
-                "highest_score": max(score_values),
-                "average_score": round(sum(score_values) / len(score_values), 2),
-                "by_difficulty": {},
-            }
+        limit = min(max(request.args.get("limit", DEFAULT_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+        difficulty = request.args.get("difficulty")
+
+        # Scores are written in batches; show the caller's own games even
+        # when the batch holding their latest one has not committed yet.
+        score_writer.wait_for(current_user.id)
+
+        query = Score.query.filter(Score.user_id == current_user.id)
+        if difficulty:
+            query = query.filter(Score.difficulty == difficulty)
 
-            # Group by difficulty
-            for score in scores_data:
-                diff = score["difficulty"]
-                if diff not in statistics["by_difficulty"]:
-                    statistics["by_difficulty"][diff] = {
-                        "count": 0,
-                        "highest": 0,
-                        "average": 0,
-                    }
-                statistics["by_difficulty"][diff]["count"] += 1
-                statistics["by_difficulty"][diff]["highest"] = max(
-                    statistics["by_difficulty"][diff]["highest"], score["score"]
+        cursor = request.args.get("cursor")
+        if cursor:
+            try:
+                completed_at, score_id = _decode_cursor(cursor)
+            except ValueError:
+                return jsonify({"success": False, "error": "Invalid cursor"}), 400
+            query = query.filter(
+                or_(
+                    Score.completed_at < completed_at,
+                    and_(Score.completed_at == completed_at, Score.id < score_id),
                 )
-        else:
-            statistics = {
-                "total_games": 0,
-                "highest_score": 0,
-                "average_score": 0,
-                "by_difficulty": {},
-            }
+            )
+
+        # Fetch one extra row to know whether another page follows.
+        rows = query.order_by(Score.completed_at.desc(), Score.id.desc()).limit(limit + 1).all()
+        page = rows[:limit]
+        next_cursor = _encode_cursor(page[-1]) if len(rows) > limit else None
 
         return jsonify(
-            {"success": True, "scores": scores_data, "statistics": statistics}
+            {
+                "success": True,
+                "scores": [s.to_dict() for s in page],
+                "next_cursor": next_cursor,
+                "statistics": _score_statistics(current_user.id),
+            }
         )
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
+
+
+@main_bp.route("/api/leaderboard", methods=["GET"])
+def get_leaderboard():
+    """
+    Get the top scores of a difficulty.
+
+    Query parameters:
+        difficulty: Difficulty to rank (default easy)
+        period: "all" for all time or "week" for this week (default all)
+        limit: Entries to return (at most the snapshot size)
+    """
+    difficulty = request.args.get("difficulty", "easy")
+    period = request.args.get("period", "all")
+    # Only known values, so arbitrary ones cannot grow the snapshot cache.
+    if difficulty not in DIFFICULTIES:
+        error = f"Difficulty must be one of {', '.join(DIFFICULTIES)}"
+        return jsonify({"success": False, "error": error}), 400
+    if period not in PERIODS:
+        error = f"Period must be one of {', '.join(PERIODS)}"
+        return jsonify({"success": False, "error": error}), 400
+
+    try:
+        # Include the caller's own latest game even if its batch is still pending.
+        if current_user.is_authenticated:
+            score_writer.wait_for(current_user.id)
+
+        size = leaderboard_cache.size
+        limit = min(max(request.args.get("limit", size, type=int), 1), size)
+        entries = leaderboard_cache.get(difficulty, period)[:limit]
+
+        result = {
+            "success": True,
+            "difficulty": difficulty,
+            "period": period,
+            "entries": entries,
+        }
+        if current_user.is_authenticated:
+            result["me"] = user_rank(current_user.id, difficulty, period)
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+def _empty_statistics() -> dict:
+    """Statistics for a player with no games"""
+    return {
+        "total_games": 0,
+        "highest_score": 0,
+        "average_score": 0,
+        "by_difficulty": {},
+    }
+
+
+def _score_statistics(user_id: int) -> dict:
+    """Read a user's running totals, one row per difficulty played"""
+    rows = UserStats.query.filter_by(user_id=user_id).all()
+    if not rows:
+        return _empty_statistics()
+
+    total_games = sum(row.games for row in rows)
+    return {
+        "total_games": total_games,
+        "highest_score": max(row.best_score for row in rows),
+        "average_score": round(sum(row.total_score for row in rows) / total_games, 2),
+        "by_difficulty": {row.difficulty: row.to_dict() for row in rows},
+    }
+
+
+def _encode_cursor(score: Score) -> str:
+    """Opaque position of a score in newest-first order"""
+    raw = f"{score.completed_at.isoformat()}|{score.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    """Turn a cursor back into (completed_at, id); raises ValueError if malformed"""
+    try:
+        completed_at, score_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(completed_at), int(score_id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
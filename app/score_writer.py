@@ -0,0 +1,204 @@
+"""
+Write-behind score ingestion
+Queues finished games and commits them in batches, one transaction per flush
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from flask import current_app
+from werkzeug.local import LocalProxy
+
+from app.models import db, Score, UserStats
+from app.leaderboard import leaderboard_cache
+
+logger = logging.getLogger(__name__)
+
+
+class PendingScore:
+    """A score waiting to be written, and the outcome once it is"""
+
+    def __init__(self, score: Score):
+        self.score = score
+        # Kept apart from the model, which expires once committed.
+        self.user_id = score.user_id
+        self.difficulty = score.difficulty
+        self.points = score.score
+        self.done = threading.Event()
+        self.error: Optional[Exception] = None
+
+
+class ScoreWriter:
+    """
+    Batches score inserts on a background thread.
+
+    A batch is written once it holds max_batch scores or its oldest score
+    has waited max_delay seconds, whichever comes first. Each score and its
+    UserStats update go in the same transaction as the rest of the batch.
+
+    Each app gets its own writer through init_app(); routes reach it as
+    score_writer, which resolves to the current app's.
+    """
+
+    def __init__(self, app=None, max_batch: int = 100, max_delay: float = 0.5):
+        self._queue: "queue.Queue[Optional[PendingScore]]" = queue.Queue()
+        self._max_batch = max(1, max_batch)
+        self._max_delay = max_delay
+        self._app = None
+        self._thread = None
+        self._lock = threading.Lock()
+        # Queued scores per user, so reads can wait for the user's own writes.
+        self._pending: Dict[int, Set[PendingScore]] = {}
+        if app is not None:
+            self.init_app(app)
+
+    def configure(self, max_batch: Optional[int] = None, max_delay: Optional[float] = None) -> None:
+        """Change the batch size and/or flush delay"""
+        if max_batch is not None:
+            self._max_batch = max(1, max_batch)
+        if max_delay is not None:
+            self._max_delay = max_delay
+
+    def init_app(self, app) -> None:
+        """Bind the writer to an app and start its thread"""
+        if self._app is not None and self._app is not app:
+            raise RuntimeError("ScoreWriter is already bound to another app")
+        self._app = app
+        app.extensions["score_writer"] = self
+        self.start()
+
+    def start(self) -> None:
+        """Start the writer thread; safe to call more than once"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def submit(self, score: Score, durable: bool = False, timeout: float = 10.0) -> bool:
+        """
+        Queue a score for writing.
+
+        Args:
+            score: Unsaved Score
+            durable: Wait until the batch holding the score has committed
+            timeout: Seconds a durable submit waits at most
+
+        Returns:
+            True if the score is known to be committed, False if only queued
+
+        Raises:
+            Exception: The commit error, for a durable submit whose batch failed
+        """
+        pending = PendingScore(score)
+        with self._lock:
+            self._pending.setdefault(pending.user_id, set()).add(pending)
+        self._queue.put(pending)
+        if not durable:
+            return False
+        if not pending.done.wait(timeout):
+            return False
+        if pending.error is not None:
+            raise pending.error
+        return True
+
+    def wait_for(self, user_id: int, timeout: float = 10.0) -> bool:
+        """
+        Wait until every score a user has queued so far is written.
+
+        Args:
+            user_id: User whose scores to wait for
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if nothing of theirs is still queued
+        """
+        with self._lock:
+            waiting = list(self._pending.get(user_id, ()))
+        deadline = time.monotonic() + timeout
+        for pending in waiting:
+            if not pending.done.wait(max(0.0, deadline - time.monotonic())):
+                return False
+        return True
+
+    def stop(self) -> None:
+        """Write what is queued and stop the thread"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout=10.0)
+
+    def _run(self) -> None:
+        """Collect batches and write them until stopped"""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._max_delay
+            stopping = False
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write(batch)
+            if stopping:
+                return
+
+    def _write(self, batch: List[PendingScore]) -> None:
+        """Commit a batch in one transaction and wake durable waiters"""
+        with self._app.app_context():
+            errors = [self._commit(batch)] * len(batch)
+            if errors[0] is not None and len(batch) > 1:
+                # Keep one bad score from losing the rest of the batch.
+                errors = [self._commit([pending]) for pending in batch]
+
+        for pending, error in zip(batch, errors):
+            if error is None:
+                leaderboard_cache.record(pending.difficulty, pending.points)
+            else:
+                logger.error("Failed to save score for user %s: %s", pending.user_id, error)
+            pending.error = error
+            pending.done.set()
+
+        with self._lock:
+            for pending in batch:
+                waiting = self._pending.get(pending.user_id)
+                if waiting is not None:
+                    waiting.discard(pending)
+                    if not waiting:
+                        del self._pending[pending.user_id]
+
+    def _commit(self, batch: List[PendingScore]) -> Optional[Exception]:
+        """Insert scores and their stats in one transaction; returns the error, if any"""
+        try:
+            for pending in batch:
+                db.session.add(pending.score)
+                UserStats.record(pending.score)
+            db.session.commit()
+            return None
+        except Exception as e:
+            db.session.rollback()
+            return e
+
+
+def _current_writer() -> ScoreWriter:
+    return current_app.extensions["score_writer"]
+
+
+score_writer: ScoreWriter = LocalProxy(_current_writer)
@@ -0,0 +1,176 @@
+"""
+Server-side sessions stored in SQLite
+The cookie carries only a random session id; the data stays on the server
+"""
+
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Optional
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session data that remembers its id and whether it changed"""
+
+    def __init__(self, initial=None, sid: Optional[str] = None, new: bool = False):
+        def on_update(session):
+            session.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid or secrets.token_urlsafe(32)
+        self.new = new
+        self.modified = False
+        self.previous_sid: Optional[str] = None
+
+    def regenerate(self) -> None:
+        """Move the data to a fresh id, e.g. on login; the old one is dropped on save"""
+        if not self.new and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = secrets.token_urlsafe(32)
+        self.modified = True
+
+
+class SqliteSessionStore:
+    """Session rows keyed by id, each with an expiry time"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " id TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_sessions_expires_at ON sessions (expires_at)"
+            )
+
+    def load(self, sid: str) -> Optional[dict]:
+        """Get a session's data, or None if it is unknown or expired"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM sessions WHERE id = ? AND expires_at > ?",
+                (sid, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, sid: str, data: dict, expires_at: float) -> None:
+        """Store a session's data"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (id, data, expires_at) VALUES (?, ?, ?)",
+                (sid, json.dumps(data, separators=(",", ":")), expires_at),
+            )
+
+    def touch(self, sid: str, expires_at: float) -> None:
+        """Push back a session's expiry without rewriting its data"""
+        with self._connect() as conn:
+            conn.execute("UPDATE sessions SET expires_at = ? WHERE id = ?", (expires_at, sid))
+
+    def delete(self, sid: str) -> None:
+        """Remove a session"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE id = ?", (sid,))
+
+    def sweep(self) -> int:
+        """Remove expired sessions and return how many there were"""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM sessions WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+    @contextmanager
+    def _connect(self):
+        """Run one transaction on this thread's connection, opened on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self._path, timeout=5.0)
+        with conn:
+            yield conn
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface backed by a SqliteSessionStore"""
+
+    def __init__(self, store: SqliteSessionStore, sweep_interval: float = 300.0):
+        self._store = store
+        self._sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+
+    def open_session(self, app, request) -> ServerSession:
+        if app.static_url_path and request.path.startswith(app.static_url_path + "/"):
+            # Static files never use the session; skip the lookup.
+            return ServerSession(new=True)
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self._store.load(sid)
+            if data is not None:
+                return ServerSession(data, sid=sid)
+        return ServerSession(new=True)
+
+    def save_session(self, app, session: ServerSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.previous_sid is not None:
+            self._store.delete(session.previous_sid)
+            session.previous_sid = None
+
+        if not session:
+            # Emptied (e.g. on logout): forget it on both sides.
+            if session.modified and not session.new:
+                self._store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            self._maybe_sweep()
+            return
+
+        expires_at = time.time() + _seconds(app.permanent_session_lifetime)
+        if session.modified or session.new:
+            self._store.save(session.sid, dict(session), expires_at)
+        elif self.should_set_cookie(app, session):
+            self._store.touch(session.sid, expires_at)
+        else:
+            return
+
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+        self._maybe_sweep()
+
+    def _maybe_sweep(self) -> None:
+        """Drop expired sessions every sweep_interval seconds"""
+        now = time.monotonic()
+        if now - self._last_sweep < self._sweep_interval:
+            return
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_sweep = now
+            self._store.sweep()
+        finally:
+            self._sweep_lock.release()
+
+
+def _seconds(lifetime) -> float:
+    """Get a session lifetime in seconds"""
+    if isinstance(lifetime, timedelta):
+        return lifetime.total_seconds()
+    return float(lifetime)
@@ -0,0 +1,96 @@
+"""
+In-process cache of logged-in users
+Saves Flask-Login a database query on every request
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.models import db, User
+
+
+class UserCache:
+    """
+    Thread-safe bounded cache of user rows keyed by id, with expiry.
+
+    Only column values are kept. Each hit builds a fresh User and attaches
+    it to the current request's session without a query, so requests never
+    share an instance and relationships still load on demand. A TTL of
+    None keeps users until they are evicted or invalidated.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = 300.0):
+        self._users: "OrderedDict[int, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def configure(self, max_size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """Change the size limit and/or TTL (0 disables caching)"""
+        with self._lock:
+            if max_size is not None:
+                self._max_size = max_size
+            if ttl is not None:
+                self._ttl = ttl
+            self._evict()
+
+    def load(self, user_id: int) -> Optional[User]:
+        """Get a user from the cache, or from the database on a miss"""
+        values = self._get(user_id)
+        if values is not None:
+            user = User(**values)
+            make_transient_to_detached(user)
+            return db.session.merge(user, load=False)
+
+        user = db.session.get(User, user_id)
+        if user is not None:
+            self._put(user)
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        """Forget a user whose row changed"""
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Forget every user"""
+        with self._lock:
+            self._users.clear()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def _get(self, user_id: int) -> Optional[dict]:
+        """Get a user's cached column values, if still fresh"""
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is None:
+                return None
+            stored_at, values = entry
+            if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+                del self._users[user_id]
+                return None
+            self._users.move_to_end(user_id)
+            return values
+
+    def _put(self, user: User) -> None:
+        """Cache a user's column values"""
+        if self._ttl is not None and self._ttl <= 0:
+            return
+        values = {column.name: getattr(user, column.name) for column in User.__table__.columns}
+        with self._lock:
+            self._users[user.id] = (time.monotonic(), values)
+            self._users.move_to_end(user.id)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used users beyond the limit"""
+        while len(self._users) > self._max_size:
+            self._users.popitem(last=False)
+
+
+user_cache = UserCache()
@@ -59,7 +59,7 @@ async function loadScoreHistory() {
     if (!historyListEl) return;
 
     try {
-        const response = await fetch("/api/get-scores", {
+        const response = await fetch("/api/get-scores?limit=5", {
             method: "GET",
             headers: {
                 "Content-Type": "application/json",
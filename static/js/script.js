@@ -6,7 +6,7 @@
 // --- VARS ---
 let selectedCell = null;
 let currentBoard = "";
-let solution = "";
+let gameId = "";
 let mistakes = 0;
 let timer = null;
 let seconds = 0;
@@ -165,7 +165,7 @@ function clearHighlights() {
 // -------------------------------------------
 // Check Win / Game Over
 // -------------------------------------------
-function checkWin() {
+async function checkWin() {
     if (!boardContainer) return;
     const filled = Array.from(boardContainer.children).every((c) => c.textContent !== "");
     if (filled) {
@@ -176,7 +176,8 @@ function checkWin() {
         sessionStorage.setItem("gameTime", seconds);
         sessionStorage.setItem("gameMistakes", mistakes);
         sessionStorage.setItem("gameDifficulty", difficulty);
-        sendScoreToBackend(difficulty, seconds, mistakes, score);
+        // Wait for the save so the result page's history includes this game.
+        await sendScoreToBackend(difficulty, seconds, mistakes, score);
         window.location.href = "/result";
     }
 }
@@ -201,6 +202,58 @@ async function sendScoreToBackend(difficulty, timeTaken, mistakesMade, score) {
     }
 }
 
+// -------------------------------------------
+// Server calls
+// -------------------------------------------
+function boardString() {
+    return Array.from(boardContainer.children)
+        .map((c) => c.textContent || ".")
+        .join("");
+}
+
+async function validateMove(index, value) {
+    const response = await fetch("/api/validate", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ game_id: gameId, index, value }),
+    });
+    const data = await response.json();
+    if (!data.success) {
+        const error = new Error(data.error);
+        error.status = response.status;
+        throw error;
+    }
+    return data.correct;
+}
+
+function moveFailed(error) {
+    console.error("Error validating move:", error);
+    if (error.status === 404) {
+        // The server no longer knows this game (expired or restarted).
+        stopTimer();
+        if (confirm("This game has expired and moves can no longer be checked. Start a new game?")) {
+            window.location.href = "/";
+        }
+    } else {
+        alert("Could not check your move. Please try again.");
+    }
+}
+
+async function requestHint() {
+    const response = await fetch("/api/get-hint", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+            game_id: gameId,
+            board: boardString(),
+            lang: localStorage.getItem("lang") || "en",
+        }),
+    });
+    const data = await response.json();
+    if (!data.success) throw new Error(data.error);
+    return data;
+}
+
 // -------------------------------------------
 // Initialize everything when DOM is ready
 // -------------------------------------------
@@ -246,9 +299,10 @@ document.addEventListener("DOMContentLoaded", () => {
 
     // Number pad
     if (numPad) {
-        numPad.addEventListener("click", (e) => {
+        numPad.addEventListener("click", async (e) => {
             const button = e.target.closest("button");
             if (!button || !selectedCell) return;
+            const cell = selectedCell;
             const number = button.dataset.num;
             clearHighlights();
             highlightSameNumbers(number);
@@ -256,20 +310,29 @@ document.addEventListener("DOMContentLoaded", () => {
             highlightRowColBox(selectedCell);
             if (selectedCell.textContent) highlightSameNumbers(selectedCell.textContent);
 
-            const index = Array.from(boardContainer.children).indexOf(selectedCell);
-            if (solution[index] === number) {
-                selectedCell.textContent = number;
-                selectedCell.classList.remove("selected");
-                selectedCell.classList.add("locked");
-                undoStack.push({ cell: selectedCell, value: number });
-                clearHighlights();
-                selectedCell = null;
+            const index = Array.from(boardContainer.children).indexOf(cell);
+            let correct;
+            try {
+                correct = await validateMove(index, number);
+            } catch (error) {
+                moveFailed(error);
+                return;
+            }
+            if (correct) {
+                cell.textContent = number;
+                cell.classList.remove("selected");
+                cell.classList.add("locked");
+                undoStack.push({ cell, value: number });
+                if (cell === selectedCell) {
+                    clearHighlights();
+                    selectedCell = null;
+                }
                 checkWin();
             } else {
                 mistakes++;
                 if (errCounter) errCounter.textContent = mistakes;
-                selectedCell.classList.add("error");
-                setTimeout(() => selectedCell.classList.remove("error"), 300);
+                cell.classList.add("error");
+                setTimeout(() => cell.classList.remove("error"), 300);
                 if (mistakes >= 3) gameOver();
             }
         });
@@ -288,16 +351,22 @@ document.addEventListener("DOMContentLoaded", () => {
 
     // Hint button
     if (hintBtn) {
-        hintBtn.addEventListener("click", () => {
+        hintBtn.addEventListener("click", async () => {
             if (hintsLeft <= 0 || !boardContainer) return;
-            const emptyCells = Array.from(boardContainer.children).filter((c) => !c.textContent);
-            if (emptyCells.length === 0) return;
-            const randomCell = emptyCells[Math.floor(Math.random() * emptyCells.length)];
-            const index = Array.from(boardContainer.children).indexOf(randomCell);
-            randomCell.textContent = solution[index];
-            randomCell.classList.add("hinted");
+            let hint;
+            try {
+                hint = await requestHint();
+            } catch (error) {
+                console.error("Error getting hint:", error);
+                return;
+            }
+            const hintedCell = boardContainer.children[hint.index];
+            hintedCell.textContent = hint.value;
+            hintedCell.classList.add("hinted");
+            hintedCell.title = hint.explanation;
             hintsLeft--;
             if (numHint) numHint.textContent = hintsLeft;
+            checkWin();
         });
     }
 
@@ -318,7 +387,7 @@ document.addEventListener("DOMContentLoaded", () => {
     // Initialize game if puzzle exists in sessionStorage
     if (boardContainer && sessionStorage.getItem("puzzle")) {
         currentBoard = sessionStorage.getItem("puzzle");
-        solution = sessionStorage.getItem("solution");
+        gameId = sessionStorage.getItem("gameId") || "";
         mistakes = 0;
         hintsLeft = 2;
         undoStack = [];